@@ -0,0 +1,1658 @@
+"""Project store and reminder engine shared by the desktop app and the headless daemon
+
+Nothing in this module imports customtkinter, tkinter or matplotlib, so
+premium_airdrop_tracker.py --headless can run the reminders on a machine
+without a display.
+"""
+import os
+import sys
+import json
+import threading
+import time
+import queue
+import tempfile
+import sqlite3
+import hashlib
+import heapq
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+
+def default_data_dir():
+    """The data folder next to the script, or next to the executable in a frozen build"""
+    if getattr(sys, 'frozen', False):
+        application_path = os.path.dirname(sys.executable)
+    else:
+        application_path = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(application_path, 'data')
+
+
+class ProjectStore:
+    """SQLite project store (WAL mode) with single-row writes"""
+    # DataFrame column, database column, SQL type
+    FIELDS = [
+        ('Project Name', 'name', 'TEXT'),
+        ('Status', 'status', 'TEXT'),
+        ('Due Date', 'due_date', 'TEXT'),
+        ('Due Time', 'due_time', 'TEXT'),
+        ('Progress', 'progress', 'TEXT'),
+        ('Estimated Reward', 'reward', 'REAL'),
+        ('Project Link', 'link', 'TEXT'),
+        ('Notes', 'notes', 'TEXT'),
+        ('Recurrence', 'recurrence', 'TEXT'),
+        ('Reminder Enabled', 'reminder_enabled', 'INTEGER'),
+    ]
+    COLUMNS = [field[0] for field in FIELDS]
+    DB_COLUMNS = {field[0]: field[1] for field in FIELDS}
+    # Project ids are written to exports under this header so they survive a round trip
+    ID_COLUMN = 'ID'
+    # Rows converted per step when loading the project list
+    LOAD_CHUNK_ROWS = 5000
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.lock = threading.RLock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.create_schema()
+
+        # Ids are handed out in memory so callers never wait for an INSERT, and
+        # under a lock of their own so they don't wait for the writer's transaction
+        row = self.conn.execute("SELECT MAX(id) FROM projects").fetchone()
+        self.next_id = (row[0] or 0) + 1
+        self.id_lock = threading.Lock()
+
+    def create_schema(self):
+        """Create tables and indexes if they don't exist"""
+        columns = ", ".join(f"{db_col} {sql_type}" for _, db_col, sql_type in self.FIELDS)
+        with self.lock, self.conn:
+            self.conn.execute(
+                f"CREATE TABLE IF NOT EXISTS projects (id INTEGER PRIMARY KEY AUTOINCREMENT, {columns}, due_ts TEXT)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_projects_status ON projects (status)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_projects_due_ts ON projects (due_ts)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_projects_name ON projects (name)")
+            self.conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+
+            # Add columns introduced after the database was created
+            existing = {row[1] for row in self.conn.execute("PRAGMA table_info(projects)")}
+            for _, db_col, sql_type in self.FIELDS:
+                if db_col not in existing:
+                    default = "''" if sql_type == 'TEXT' else '0'
+                    self.conn.execute(f"ALTER TABLE projects ADD COLUMN {db_col} {sql_type} DEFAULT {default}")
+
+    @staticmethod
+    def to_db_value(col, value):
+        """Convert a DataFrame value to its database representation"""
+        if col == 'Estimated Reward':
+            try:
+                return 0.0 if pd.isna(value) or value == '' else float(value)
+            except (TypeError, ValueError):
+                return 0.0
+        if col == 'Reminder Enabled':
+            if value is None or (isinstance(value, str) and value == '') or pd.isna(value):
+                return 1
+            return 1 if bool(value) else 0
+        if value is None or (not isinstance(value, str) and pd.isna(value)):
+            return ''
+        if col == 'Due Date' and isinstance(value, datetime):
+            return value.strftime('%Y-%m-%d')
+        return str(value)
+
+    @staticmethod
+    def parse_due(due_date, due_time):
+        """Vectorized Due Date and Due Time to datetime64, NaT where unreadable"""
+        return pd.to_datetime(due_date.astype(str) + ' ' + due_time.astype(str),
+                              format='%Y-%m-%d %H:%M', errors='coerce')
+
+    @classmethod
+    def add_due_column(cls, df):
+        """Parse Due Date and Due Time once into the derived Due column"""
+        df['Due'] = cls.parse_due(df['Due Date'], df['Due Time'])
+
+        # Report unreadable due dates once here instead of on every reminder check
+        invalid = df['Due'].isna() & (df['Due Date'] != '') & (df['Due Time'] != '')
+        if invalid.any():
+            names = ", ".join(df.loc[invalid, 'Project Name'].astype(str).head(10))
+            print(f"{int(invalid.sum())} project(s) have an unreadable due date or time and get no reminders: {names}")
+        return df
+
+    @staticmethod
+    def due_timestamp(due_date, due_time):
+        """Sortable due timestamp used by the due-date index"""
+        if due_date and due_time:
+            return f"{due_date} {due_time}"
+        return None
+
+    def allocate_id(self):
+        """Reserve the id for a new project"""
+        with self.id_lock:
+            row_id = self.next_id
+            self.next_id += 1
+            return row_id
+
+    def prepare_frame(self, df):
+        """Normalize a DataFrame to the store schema, keeping its project ids when usable"""
+        records = [[self.to_db_value(col, values.get(col, '')) for col in self.COLUMNS]
+                   for values in df.to_dict('records')]
+        row_ids = self.frame_ids(df)
+        frame = pd.DataFrame(records, columns=self.COLUMNS, index=row_ids)
+        frame['Reminder Enabled'] = frame['Reminder Enabled'].apply(bool)
+        return frame
+
+    def frame_ids(self, df):
+        """Ids from the frame's ID column if they are unique positive integers, else new ones"""
+        if self.ID_COLUMN in df.columns and len(df):
+            ids = pd.to_numeric(df[self.ID_COLUMN], errors='coerce')
+            if ids.notna().all() and (ids > 0).all() and (ids % 1 == 0).all() and ids.is_unique:
+                ids = [int(row_id) for row_id in ids]
+                with self.id_lock:
+                    self.next_id = max(self.next_id, max(ids) + 1)
+                return ids
+        return [self.allocate_id() for _ in range(len(df))]
+
+    def _insert_row(self, row_id, values):
+        row = [self.to_db_value(col, values.get(col, '')) for col in self.COLUMNS]
+        placeholders = ", ".join("?" for _ in self.FIELDS)
+        db_columns = ", ".join(self.DB_COLUMNS[col] for col in self.COLUMNS)
+        self.conn.execute(
+            f"INSERT INTO projects (id, {db_columns}, due_ts) VALUES (?, {placeholders}, ?)",
+            [int(row_id)] + row + [self.due_timestamp(row[2], row[3])])
+
+    def _update_row(self, row_id, values):
+        columns = [col for col in values if col in self.DB_COLUMNS]
+        if not columns:
+            return
+        assignments = ", ".join(f"{self.DB_COLUMNS[col]} = ?" for col in columns)
+        params = [self.to_db_value(col, values[col]) for col in columns]
+        self.conn.execute(f"UPDATE projects SET {assignments} WHERE id = ?", params + [int(row_id)])
+        if 'Due Date' in values or 'Due Time' in values:
+            self.conn.execute(
+                "UPDATE projects SET due_ts = CASE WHEN due_date != '' AND due_time != '' "
+                "THEN due_date || ' ' || due_time END WHERE id = ?", (int(row_id),))
+
+    def _replace_rows(self, frame):
+        self.conn.execute("DELETE FROM projects")
+        for row_id, values in zip(frame.index, frame.to_dict('records')):
+            self._insert_row(row_id, values)
+
+    def apply_changes(self, changes):
+        """Apply a batch of (op, row_id, values) changes in one transaction"""
+        with self.lock, self.conn:
+            self._apply(changes)
+
+    def _apply(self, changes):
+        for op, row_id, values in changes:
+            if op == 'add':
+                self._insert_row(row_id, values)
+            elif op == 'update':
+                self._update_row(row_id, values)
+            elif op == 'delete':
+                self.conn.execute("DELETE FROM projects WHERE id = ?", (int(row_id),))
+            elif op == 'replace_all':
+                self._replace_rows(values)
+            elif op == 'batch':
+                # values is a list of changes that were made together
+                self._apply(values)
+
+    def replace_all(self, df):
+        """Replace every project and return the stored data"""
+        self.apply_changes([('replace_all', None, self.prepare_frame(df))])
+        return self.load_frame()
+
+    def load_frame(self):
+        """Load all projects as a DataFrame indexed by project id"""
+        db_columns = ", ".join(self.DB_COLUMNS[col] for col in self.COLUMNS)
+        chunks = []
+        with self.lock:
+            cursor = self.conn.execute(f"SELECT id, {db_columns} FROM projects ORDER BY id")
+            # Only one chunk of rows exists as Python tuples at a time, which keeps
+            # the peak close to the size of the finished frame
+            while True:
+                rows = cursor.fetchmany(self.LOAD_CHUNK_ROWS)
+                if not rows:
+                    break
+                chunks.append(pd.DataFrame([row[1:] for row in rows], columns=self.COLUMNS,
+                                           index=[row[0] for row in rows]))
+
+        df = pd.concat(chunks) if chunks else pd.DataFrame([], columns=self.COLUMNS, index=[])
+        df['Reminder Enabled'] = df['Reminder Enabled'].apply(bool)
+        return df
+
+    def get_meta(self, key, default=None):
+        """Read a metadata value"""
+        with self.lock:
+            row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+
+    def set_meta(self, key, value):
+        """Write a metadata value"""
+        with self.lock, self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, str(value)))
+
+    def backup(self, backup_path):
+        """Copy the database with the SQLite online backup API"""
+        with self.lock:
+            target = sqlite3.connect(backup_path)
+            try:
+                self.conn.backup(target)
+            finally:
+                target.close()
+
+    def close(self):
+        """Close the database connection"""
+        with self.lock:
+            self.conn.close()
+
+class DataWriter:
+    """Writer thread that coalesces saves into batched, atomic writes"""
+    # Seconds between attempts to store changes that failed to save
+    RETRY_DELAY = 5.0
+
+    def __init__(self, store, data_file_path, write_workbook, coalesce_delay=0.25, on_error=None):
+        self.store = store
+        self.data_file_path = data_file_path
+        self.write_workbook = write_workbook
+        self.coalesce_delay = coalesce_delay
+        # Called with a message from the writer thread when a save fails
+        self.on_error = on_error
+        # Changes not stored yet, retried with the next batch
+        self.failed_changes = []
+        self.queue = queue.Queue()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def submit(self, kind, *args):
+        """Queue a job: 'change', 'export', 'ledger' (file path, ReminderLedger), 'call' or 'stop'"""
+        self.queue.put((kind, args))
+
+    def stop(self, timeout=10.0):
+        """Write everything still queued and stop the thread; timeout None waits for it"""
+        self.submit('stop')
+        self.thread.join(timeout=timeout)
+
+    def _run(self):
+        """Writer loop (called in separate thread)"""
+        running = True
+        while running:
+            try:
+                # Failed changes are retried after a pause even if nothing new arrives
+                jobs = [self.queue.get(timeout=self.RETRY_DELAY if self.failed_changes else None)]
+            except queue.Empty:
+                jobs = []
+            if jobs and jobs[0][0] != 'stop':
+                # Let a burst of edits arrive so it lands in one write
+                time.sleep(self.coalesce_delay)
+            while True:
+                try:
+                    jobs.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            running = self._process(jobs)
+
+    def _process(self, jobs):
+        """Process a batch of jobs, keeping only the newest export snapshot and one save per ledger"""
+        changes = []
+        snapshot = None
+        ledgers = {}
+        running = True
+        for kind, args in jobs:
+            if kind == 'change':
+                changes.append(args)
+            elif kind == 'export':
+                snapshot = args[0]
+            elif kind == 'ledger':
+                file_path, ledger = args
+                ledgers[file_path] = ledger
+            elif kind == 'call':
+                # Everything queued before the call must be on disk first
+                self._flush(changes, snapshot, ledgers)
+                changes, snapshot, ledgers = [], None, {}
+                try:
+                    args[0]()
+                except Exception as e:
+                    print(f"Writer callback error: {e}")
+            elif kind == 'stop':
+                running = False
+        self._flush(changes, snapshot, ledgers)
+        return running
+
+    def _flush(self, changes, snapshot, ledgers=None):
+        """Commit pending changes and write the ledger files and the Excel copy"""
+        changes = self.failed_changes + changes
+        if changes:
+            self.failed_changes = self._commit(changes)
+        # The small files go first; a large workbook can take many seconds
+        for file_path, ledger in (ledgers or {}).items():
+            try:
+                ledger.save(file_path)
+            except Exception as e:
+                print(f"Error saving reminder ledger: {e}")
+        if snapshot is not None:
+            try:
+                self.write_atomically(self.data_file_path,
+                                      lambda temp_path: self.write_workbook(snapshot, temp_path))
+            except Exception as e:
+                self.report_error(f"Failed to write {os.path.basename(self.data_file_path)}: {e}")
+
+    def _commit(self, changes):
+        """Store changes, returning the ones that could not be stored"""
+        try:
+            self.store.apply_changes(changes)
+            return []
+        except Exception:
+            pass
+
+        # The batch was rolled back; store what can be stored one change at a time
+        failed = []
+        error = None
+        for change in changes:
+            try:
+                self.store.apply_changes([change])
+            except Exception as e:
+                failed.append(change)
+                error = e
+        # Report once, not on every retry
+        if failed and not self.failed_changes:
+            self.report_error(f"Failed to save {len(failed)} change(s); they will be retried: {error}")
+        return failed
+
+    def report_error(self, message):
+        """Pass a save error to on_error"""
+        print(f"Save error: {message}")
+        if self.on_error is not None:
+            try:
+                self.on_error(message)
+            except Exception as e:
+                print(f"Error reporting save error: {e}")
+
+    @staticmethod
+    def write_atomically(file_path, write_func):
+        """Write to a temp file, fsync it and replace the target in one step"""
+        base, ext = os.path.splitext(file_path)
+        # A unique name, so concurrent writes to the same target can't collide
+        fd, temp_path = tempfile.mkstemp(prefix=f"{os.path.basename(base)}.", suffix=f".tmp{ext}",
+                                         dir=os.path.dirname(file_path) or None)
+        os.close(fd)
+        try:
+            write_func(temp_path)
+            with open(temp_path, 'rb+') as f:
+                os.fsync(f.fileno())
+            os.replace(temp_path, file_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    @staticmethod
+    def write_json(data, file_path):
+        """Write data as JSON"""
+        with open(file_path, 'w') as f:
+            json.dump(data, f)
+
+class WorkbookWriter:
+    """Streams projects into a styled .xlsx with openpyxl's write-only mode"""
+    SHEET_TITLE = "Airdrop Data"
+    STATUS_COLORS = {
+        'Active': '4FC3F7',
+        'Completed': '81C784',
+        'Monitoring': 'FFA500',
+        'Dropped': 'E57373',
+    }
+    MAX_WIDTH = 50
+    # Rows converted to cell values per step; only one chunk is copied at a time
+    CHUNK_ROWS = 5000
+    _styles = None
+
+    @classmethod
+    def styles(cls):
+        """Header font and status fills, built once and shared by every cell"""
+        if cls._styles is None:
+            from openpyxl.styles import Font, PatternFill
+            fills = {status: PatternFill(start_color=color, end_color=color, fill_type='solid')
+                     for status, color in cls.STATUS_COLORS.items()}
+            cls._styles = (Font(bold=True), fills)
+        return cls._styles
+
+    @staticmethod
+    def headers(df):
+        """Exported columns after the ID: the stored columns except Reminder Enabled"""
+        return [col for col in ProjectStore.COLUMNS if col in df.columns and col != 'Reminder Enabled']
+
+    @classmethod
+    def column_widths(cls, df, headers):
+        """Width per column from the longest text in it, including the header"""
+        widths = [len(ProjectStore.ID_COLUMN), *(len(header) for header in headers)]
+        for start in range(0, len(df), cls.CHUNK_ROWS):
+            chunk = df.iloc[start:start + cls.CHUNK_ROWS]
+            widths[0] = max(widths[0], int(chunk.index.astype(str).str.len().max()))
+            for i, col in enumerate(headers, 1):
+                widths[i] = max(widths[i], int(chunk[col].astype(str).str.len().max()))
+        return [min(width + 2, cls.MAX_WIDTH) for width in widths]
+
+    @classmethod
+    def write(cls, df, file_path, progress=None):
+        """Write df (indexed by project id) to file_path, calling progress(done, total) per chunk"""
+        from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.utils import get_column_letter
+
+        header_font, status_fills = cls.styles()
+        headers = cls.headers(df)
+        status_col = headers.index('Status') + 1 if 'Status' in headers else None
+
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet(cls.SHEET_TITLE)
+        # Write-only sheets emit column widths before the first row
+        for col_idx, width in enumerate(cls.column_widths(df, headers), 1):
+            ws.column_dimensions[get_column_letter(col_idx)].width = width
+
+        header_row = []
+        for header in [ProjectStore.ID_COLUMN] + headers:
+            cell = WriteOnlyCell(ws, value=header)
+            cell.font = header_font
+            header_row.append(cell)
+        ws.append(header_row)
+
+        try:
+            for start in range(0, len(df), cls.CHUNK_ROWS):
+                chunk = df.iloc[start:start + cls.CHUNK_ROWS][headers].astype(object)
+                chunk = chunk.where(chunk.notna(), None)
+                for row in chunk.itertuples(name=None):
+                    row = list(row)
+                    if status_col is not None and row[status_col] in status_fills:
+                        cell = WriteOnlyCell(ws, value=row[status_col])
+                        cell.fill = status_fills[row[status_col]]
+                        row[status_col] = cell
+                    ws.append(row)
+                if progress:
+                    progress(min(start + cls.CHUNK_ROWS, len(df)), len(df))
+        except Exception:
+            # The sheet streams to a temp file that only save() cleans up
+            ws.close()
+            ws._writer.cleanup()
+            raise
+
+        wb.save(file_path)
+
+class CsvWriter:
+    """Writes projects to CSV in chunks"""
+    # The derived Due column and the reminder switch are not exported
+    EXCLUDED_COLUMNS = ['Reminder Enabled', 'Due']
+    CHUNK_ROWS = 5000
+
+    @classmethod
+    def write(cls, df, file_path, progress=None):
+        """Write df (indexed by project id) to file_path, calling progress(done, total) per chunk"""
+        export_df = df.drop(columns=cls.EXCLUDED_COLUMNS, errors='ignore')
+        total = len(export_df)
+        with open(file_path, 'w', newline='', encoding='utf-8') as f:
+            if not total:
+                export_df.to_csv(f, index_label=ProjectStore.ID_COLUMN)
+            for start in range(0, total, cls.CHUNK_ROWS):
+                export_df.iloc[start:start + cls.CHUNK_ROWS].to_csv(
+                    f, header=start == 0, index_label=ProjectStore.ID_COLUMN)
+                if progress:
+                    progress(min(start + cls.CHUNK_ROWS, total), total)
+
+class PdfReportWriter:
+    """Writes the PDF report as page-sized tables, laying out very large reports in parallel"""
+    TITLE = "Airdrop Tracker Report"
+    HEADERS = ['Project Name', 'Status', 'Due DateTime', 'Progress', 'Estimated Reward', 'Project Link', 'Notes']
+    # Frame columns each report row is built from
+    SOURCE_COLUMNS = ['Project Name', 'Status', 'Due Date', 'Due Time', 'Progress',
+                      'Estimated Reward', 'Project Link', 'Notes']
+    COLUMN_WIDTHS = [1.5, 0.8, 1.5, 0.8, 1.0, 1.8, 2.0]  # inches, landscape letter
+    FONT_NAME = 'Helvetica'
+    FONT_SIZE = 8
+    LEADING = 10
+    # Left plus right cell padding (reportlab's default is 6 points a side)
+    CELL_PADDING = 12
+    # About one page of single-line rows; a table that runs over still splits
+    ROWS_PER_TABLE = 30
+    # Reports this long are laid out in worker processes, PART_ROWS rows each,
+    # and concatenated (needs pypdf)
+    PARALLEL_MIN_ROWS = 20000
+    PART_ROWS = 5000
+    _styles = None
+
+    @classmethod
+    def styles(cls):
+        """Title and text styles, cell paragraph class and style, table style and column widths, created once"""
+        if cls._styles is None:
+            from reportlab.lib import colors
+            from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+            from reportlab.lib.units import inch
+            from reportlab.platypus import Paragraph, TableStyle
+
+            class ReportCell(Paragraph):
+                """Paragraph that breaks its lines once per column width"""
+                # Tables wrap every cell again each time they are measured or split
+                def wrap(self, availWidth, availHeight):
+                    if getattr(self, 'wrapped_width', None) != availWidth:
+                        self.wrapped_size = Paragraph.wrap(self, availWidth, availHeight)
+                        self.wrapped_width = availWidth
+                    return self.wrapped_size
+
+            sample = getSampleStyleSheet()
+            # A style of our own: the sample sheet's Normal is shared
+            cell_style = ParagraphStyle('ReportCell', parent=sample['Normal'], fontName=cls.FONT_NAME,
+                                        fontSize=cls.FONT_SIZE, leading=cls.LEADING, wordWrap='CJK')
+            table_style = TableStyle([
+                ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+                ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                ('FONTSIZE', (0, 0), (-1, 0), 10),
+                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+                ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+                ('FONTNAME', (0, 1), (-1, -1), cls.FONT_NAME),
+                ('FONTSIZE', (0, 1), (-1, -1), cls.FONT_SIZE),
+                ('LEADING', (0, 1), (-1, -1), cls.LEADING),
+                ('GRID', (0, 0), (-1, -1), 1, colors.black)
+            ])
+            cls._styles = (sample['Title'], sample['Normal'], ReportCell, cell_style, table_style,
+                           [width * inch for width in cls.COLUMN_WIDTHS])
+        return cls._styles
+
+    @classmethod
+    def report_rows(cls, df):
+        """Cell texts of every project, one list per row"""
+        data = df.reindex(columns=cls.SOURCE_COLUMNS, fill_value='')
+        if 'Due' in df.columns:
+            days = df['Due'].dt.strftime('(%A)').fillna('')
+        else:
+            days = [''] * len(df)
+
+        rows = []
+        for (name, status, due_date, due_time, progress, reward, link, notes), day in zip(
+                data.itertuples(index=False, name=None), days):
+            due = f"{due_date} {due_time}" if due_date and due_time else ''
+            # The day goes on a line of its own; date, time and day don't fit the column together
+            if day:
+                due = f"{due}\n{day}" if due else day
+            rows.append([str(name), str(status), due, str(progress),
+                         f"Rp {reward:,.2f}", str(link), str(notes)])
+        return rows
+
+    @classmethod
+    def cell(cls, text, width):
+        """text as is when each of its lines fits the column, otherwise a wrapping paragraph"""
+        from reportlab.pdfbase.pdfmetrics import stringWidth
+
+        available = width - cls.CELL_PADDING
+        if all(stringWidth(line, cls.FONT_NAME, cls.FONT_SIZE) <= available for line in text.split('\n')):
+            return text
+        from xml.sax.saxutils import escape
+
+        cell_class, cell_style = cls.styles()[2:4]
+        return cell_class(escape(text).replace('\n', '<br/>'), cell_style)
+
+    @classmethod
+    def render(cls, rows, file_path, with_title=True, progress=None):
+        """Lay out rows into a PDF, calling progress(done, total) as tables are placed"""
+        from reportlab.lib.pagesizes import letter, landscape
+        from reportlab.platypus import SimpleDocTemplate, Table, Paragraph
+
+        title_style, text_style, _, _, table_style, col_widths = cls.styles()
+        doc = SimpleDocTemplate(file_path, pagesize=landscape(letter))
+        elements = []
+        if with_title:
+            elements.append(Paragraph(cls.TITLE, title_style))
+            elements.append(Paragraph(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M')}", text_style))
+            elements.append(Paragraph("<br/><br/>", text_style))
+
+        # Every table repeats the header row; an empty report still gets one
+        for start in range(0, max(len(rows), 1), cls.ROWS_PER_TABLE):
+            table_data = [cls.HEADERS]
+            for row in rows[start:start + cls.ROWS_PER_TABLE]:
+                table_data.append([cls.cell(text, width) for text, width in zip(row, col_widths)])
+            table = Table(table_data, colWidths=col_widths, repeatRows=1)
+            table.setStyle(table_style)
+            elements.append(table)
+
+        if progress:
+            placed = [0]
+
+            def after_flowable(flowable):
+                # Tables split across pages arrive in pieces, each with the header row
+                if isinstance(flowable, Table):
+                    placed[0] += flowable._nrows - 1
+                    progress(placed[0], len(rows))
+            doc.afterFlowable = after_flowable
+        doc.build(elements)
+        return len(rows)
+
+    @staticmethod
+    def can_concatenate():
+        """Whether pypdf is installed to join parallel parts"""
+        import importlib.util
+
+        return importlib.util.find_spec('pypdf') is not None
+
+    @staticmethod
+    def concatenate(part_paths, file_path):
+        """Join PDF files page by page"""
+        from pypdf import PdfWriter
+
+        writer = PdfWriter()
+        for part_path in part_paths:
+            writer.append(part_path)
+        with open(file_path, 'wb') as f:
+            writer.write(f)
+
+    @classmethod
+    def write(cls, df, file_path, progress=None):
+        """Write the report for df to file_path, calling progress(done, total) along the way"""
+        rows = cls.report_rows(df)
+        workers = min(os.cpu_count() or 1, -(-len(rows) // cls.PART_ROWS))
+        if len(rows) < cls.PARALLEL_MIN_ROWS or workers < 2 or not cls.can_concatenate():
+            cls.render(rows, file_path, progress=progress)
+            return
+        cls.render_parallel(rows, file_path, workers, progress)
+
+    @classmethod
+    def render_parallel(cls, rows, file_path, workers, progress=None):
+        """Lay out ranges of rows in worker processes, then concatenate them"""
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        with tempfile.TemporaryDirectory() as part_dir:
+            part_paths = []
+            # Fresh interpreters rather than forks of the app and its UI threads
+            context = multiprocessing.get_context('spawn')
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+                futures = []
+                for start in range(0, len(rows), cls.PART_ROWS):
+                    part_path = os.path.join(part_dir, f"part_{len(part_paths):05d}.pdf")
+                    part_paths.append(part_path)
+                    futures.append(pool.submit(cls.render, rows[start:start + cls.PART_ROWS],
+                                               part_path, start == 0))
+                done = 0
+                try:
+                    for future in as_completed(futures):
+                        done += future.result()
+                        if progress:
+                            # Joining the parts is left for the last step
+                            progress(done, len(rows) + cls.PART_ROWS)
+                except BaseException:
+                    # Parts already being laid out finish before the pool shuts down
+                    for future in futures:
+                        future.cancel()
+                    raise
+            cls.concatenate(part_paths, file_path)
+        if progress:
+            progress(1, 1)
+
+class ExportCancelled(Exception):
+    """Raised inside an export whose job was cancelled"""
+
+class ExportJob:
+    """One export of a data snapshot on a worker thread
+
+    The worker reports (job_id, kind, value) tuples to a queue for the UI
+    thread to poll: ('progress', fraction), then one of ('done', file_path),
+    ('cancelled', None) or ('error', message). The file is written to a temp
+    path and only replaces file_path once complete.
+    """
+    def __init__(self, job_id, label, write, df, file_path, events):
+        self.job_id = job_id
+        self.label = label
+        self.write = write
+        self.df = df
+        self.file_path = file_path
+        self.events = events
+        self.cancel_event = threading.Event()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        """Start the worker"""
+        self.thread.start()
+
+    def cancel(self):
+        """Ask the worker to stop at its next progress report"""
+        self.cancel_event.set()
+
+    def progress(self, done, total):
+        """Progress callback handed to the writer"""
+        if self.cancel_event.is_set():
+            raise ExportCancelled()
+        self.events.put((self.job_id, 'progress', done / total if total else 1.0))
+
+    def _run(self):
+        """Export (called in separate thread)"""
+        try:
+            if self.cancel_event.is_set():
+                raise ExportCancelled()
+            DataWriter.write_atomically(self.file_path,
+                                        lambda temp_path: self.write(self.df, temp_path, self.progress))
+            self.events.put((self.job_id, 'done', self.file_path))
+        except ExportCancelled:
+            self.events.put((self.job_id, 'cancelled', None))
+        except Exception as e:
+            self.events.put((self.job_id, 'error', str(e)))
+        finally:
+            # Let go of the snapshot as soon as the file is written
+            self.df = None
+
+class ImportReader:
+    """Reads projects from a CSV or Excel file in chunks, checked and coerced to the store schema
+
+    Rows that fail a check are left out of the result and listed in errors as
+    (row, column, value, message), where row is the row number in the file
+    with the header on row 1. Blank rows are skipped.
+    """
+    CHUNK_ROWS = 5000
+    STATUSES = ['Active', 'Completed', 'Monitoring', 'Dropped']
+    PROGRESS = ['0%', '25%', '50%', '75%', '100%']
+    TRUE_VALUES = ['true', 'yes', 'y', 'on', '1', '1.0']
+    FALSE_VALUES = ['false', 'no', 'n', 'off', '0', '0.0']
+    TIME_PATTERN = r'^(\d{1,2}):(\d{2})(?::\d{2}(?:\.\d+)?)?$'
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self.errors = []
+        self.rows_read = 0
+        # Columns the file has; the others were filled with defaults
+        self.columns = set()
+
+    def chunks(self):
+        """Raw cells of the file, CHUNK_ROWS rows at a time"""
+        if self.file_path.lower().endswith(('.xlsx', '.xlsm')):
+            yield from self._excel_chunks()
+            return
+        # Everything is read as text; read() does the typing
+        yield from pd.read_csv(self.file_path, chunksize=self.CHUNK_ROWS, dtype=str,
+                               keep_default_na=False, encoding='utf-8-sig')
+
+    def _excel_chunks(self):
+        """Rows of the first worksheet, streamed with openpyxl's read-only mode"""
+        from openpyxl import load_workbook
+
+        wb = load_workbook(self.file_path, read_only=True, data_only=True)
+        try:
+            rows = wb.worksheets[0].iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None:
+                return
+            columns = ['' if value is None else str(value) for value in header]
+            batch = []
+            for row in rows:
+                # Read-only sheets can return short rows
+                batch.append(tuple(row[:len(columns)]) + (None,) * (len(columns) - len(row)))
+                if len(batch) == self.CHUNK_ROWS:
+                    yield pd.DataFrame(batch, columns=columns, dtype=object)
+                    batch = []
+            if batch:
+                yield pd.DataFrame(batch, columns=columns, dtype=object)
+        finally:
+            wb.close()
+
+    def read(self):
+        """Valid projects in the file as a DataFrame with the store columns (and ID if present)"""
+        self.errors = []
+        self.rows_read = 0
+        self.columns = set()
+        parts = []
+        for chunk in self.chunks():
+            chunk.columns = [str(col).strip() for col in chunk.columns]
+            # Keep the first of any repeated header
+            chunk = chunk.loc[:, ~chunk.columns.duplicated()]
+            self.columns.update(chunk.columns)
+            parts.append(self.validate(chunk, first_row=self.rows_read + 2))
+            self.rows_read += len(chunk)
+
+        columns = ProjectStore.COLUMNS + ([ProjectStore.ID_COLUMN] if ProjectStore.ID_COLUMN in self.columns else [])
+        if not parts:
+            return pd.DataFrame([], columns=columns)
+        return pd.concat(parts, ignore_index=True)[columns]
+
+    @staticmethod
+    def text(series):
+        """Cell values as stripped strings, blank where missing"""
+        return series.astype(object).where(series.notna(), '').astype(str).str.strip()
+
+    def validate(self, chunk, first_row):
+        """Coerce one chunk to the store schema, recording errors; returns its valid rows"""
+        index = chunk.index
+        rows = pd.Series(range(first_row, first_row + len(chunk)), index=index)
+        blank = pd.Series('', index=index)
+        text = {col: self.text(chunk[col]) if col in chunk.columns else blank
+                for col in ProjectStore.COLUMNS + [ProjectStore.ID_COLUMN]}
+        failed = pd.Series(False, index=index)
+
+        def fail(mask, col, message):
+            nonlocal failed
+            for row, value in zip(rows[mask], text[col][mask]):
+                self.errors.append((int(row), col, value, message))
+            failed = failed | mask
+
+        empty = pd.concat(text.values(), axis=1).eq('').all(axis=1)
+        out = pd.DataFrame(index=index)
+
+        out['Project Name'] = text['Project Name']
+        fail(~empty & (out['Project Name'] == ''), 'Project Name', "Project name is required")
+
+        status = text['Status'].str.lower().map({s.lower(): s for s in self.STATUSES})
+        fail(status.isna() & (text['Status'] != ''), 'Status', f"Status must be one of {', '.join(self.STATUSES)}")
+        out['Status'] = status.fillna('')
+
+        # Dates may come as 2025-01-31 or, from Excel, as 2025-01-31 00:00:00
+        due_date = pd.to_datetime(text['Due Date'].str.split(n=1).str[0], format='%Y-%m-%d', errors='coerce')
+        fail(due_date.isna() & (text['Due Date'] != ''), 'Due Date', "Due date must be YYYY-MM-DD")
+        out['Due Date'] = due_date.dt.strftime('%Y-%m-%d').fillna('')
+
+        time_parts = text['Due Time'].str.extract(self.TIME_PATTERN)
+        hours = pd.to_numeric(time_parts[0], errors='coerce')
+        minutes = pd.to_numeric(time_parts[1], errors='coerce')
+        time_ok = (hours < 24) & (minutes < 60)
+        fail(~time_ok & (text['Due Time'] != ''), 'Due Time', "Due time must be HH:MM")
+        out['Due Time'] = (time_parts[0].str.zfill(2) + ':' + time_parts[1]).where(time_ok, '')
+
+        # Whole percentages with or without %, or, from Excel, fractions of one. A
+        # bare 1 is 1% (and rejected), not 100%; a fraction is below 1 or written 1.0
+        percent = pd.to_numeric(text['Progress'].str.rstrip('%'), errors='coerce')
+        fraction = ~text['Progress'].str.endswith('%') & (
+            (percent < 1) | (text['Progress'].str.contains('.', regex=False) & (percent <= 1)))
+        percent = percent.where(~fraction, percent * 100).round(6)
+        progress_ok = percent.isin([float(value.rstrip('%')) for value in self.PROGRESS])
+        fail(~progress_ok & (text['Progress'] != ''), 'Progress',
+             f"Progress must be one of {', '.join(self.PROGRESS)}, or a fraction such as 0.25")
+        out['Progress'] = (percent.where(progress_ok, 0).astype(int).astype(str) + '%').where(progress_ok, '')
+
+        reward_text = text['Estimated Reward'].str.replace(r'^Rp\s*|,', '', regex=True)
+        reward = pd.to_numeric(reward_text.where(reward_text != '', '0'), errors='coerce')
+        fail(reward.isna(), 'Estimated Reward', "Estimated reward must be a number")
+        out['Estimated Reward'] = reward.fillna(0.0).astype(float)
+
+        out['Project Link'] = text['Project Link']
+        out['Notes'] = text['Notes']
+
+        # Parse each distinct rule once
+        rule_errors = {}
+        for rule in text['Recurrence'].unique():
+            try:
+                RecurrenceRule.parse(rule)
+            except ValueError as e:
+                rule_errors[rule] = str(e)
+        bad_rule = text['Recurrence'].isin(list(rule_errors))
+        for rule, message in rule_errors.items():
+            fail(text['Recurrence'] == rule, 'Recurrence', message)
+        out['Recurrence'] = text['Recurrence'].where(~bad_rule, '')
+
+        enabled = text['Reminder Enabled'].str.lower()
+        enabled_ok = enabled.isin(self.TRUE_VALUES + self.FALSE_VALUES + [''])
+        fail(~enabled_ok, 'Reminder Enabled', "Reminder Enabled must be true or false")
+        out['Reminder Enabled'] = ~enabled.isin(self.FALSE_VALUES)
+
+        out[ProjectStore.ID_COLUMN] = text[ProjectStore.ID_COLUMN]
+        return out[~failed & ~empty]
+
+    def error_report(self):
+        """Errors as a DataFrame, one row per failed check"""
+        return pd.DataFrame(self.errors, columns=['Row', 'Column', 'Value', 'Error'])
+
+class ImportMerge:
+    """Matches imported projects to the current ones and sorts them into inserted, updated and unchanged
+
+    A row matches by project id when the file has one that exists here, and
+    otherwise by its normalized name and link. The current projects are
+    indexed in dicts, so matching takes one pass over each side. Only the
+    columns the file has are compared and updated; the rest (Reminder
+    Enabled, which exports leave out) keep their local values.
+    """
+    def __init__(self, current, incoming, columns):
+        self.columns = [col for col in ProjectStore.COLUMNS if col in columns]
+        self.inserted = incoming.iloc[0:0][ProjectStore.COLUMNS]
+        # (row_id, {column: new value}, {column: old value})
+        self.updated = []
+        self.unchanged = 0
+        # Further rows matching a project that an earlier row already matched
+        self.duplicates = 0
+        self._match(current, incoming)
+
+    @staticmethod
+    def row_keys(df):
+        """Case- and whitespace-insensitive name plus link of each row"""
+        names = df['Project Name'].astype(str).str.split().str.join(' ').str.casefold()
+        links = df['Project Link'].astype(str).str.strip().str.casefold().str.rstrip('/')
+        return names + '\x1f' + links
+
+    def _match(self, current, incoming):
+        """Sort the incoming rows"""
+        by_key = {}
+        for row_id, key in zip(current.index, self.row_keys(current)):
+            by_key.setdefault(key, row_id)
+        current_ids = set(current.index)
+
+        if ProjectStore.ID_COLUMN in incoming.columns:
+            incoming_ids = pd.to_numeric(incoming[ProjectStore.ID_COLUMN], errors='coerce').tolist()
+        else:
+            incoming_ids = [None] * len(incoming)
+
+        insert_positions, matched_positions, targets = [], [], []
+        seen = set()
+        for position, (row_id, key) in enumerate(zip(incoming_ids, self.row_keys(incoming))):
+            key_match = by_key.get(key)
+            # Another copy of the data can give the same id to a different project;
+            # the name and link decide when they point elsewhere
+            if row_id in current_ids and (key_match is None or key_match == row_id):
+                target = int(row_id)
+            else:
+                target = key_match
+            if target is None:
+                insert_positions.append(position)
+            elif target in seen:
+                self.duplicates += 1
+            else:
+                seen.add(target)
+                matched_positions.append(position)
+                targets.append(target)
+
+        self.inserted = incoming.iloc[insert_positions][ProjectStore.COLUMNS].reset_index(drop=True)
+        if not targets:
+            return
+
+        new = incoming.iloc[matched_positions][self.columns].set_axis(targets)
+        old = current.loc[targets, self.columns]
+        changed = pd.DataFrame(index=targets)
+        for col in self.columns:
+            if col == 'Estimated Reward':
+                changed[col] = (pd.to_numeric(new[col], errors='coerce').fillna(0.0)
+                                != pd.to_numeric(old[col], errors='coerce').fillna(0.0))
+            elif col == 'Reminder Enabled':
+                changed[col] = new[col].astype(bool) != old[col].astype(bool)
+            else:
+                changed[col] = new[col].astype(str) != old[col].astype(str)
+
+        flags = changed.to_numpy()
+        row_changed = flags.any(axis=1)
+        self.unchanged = int((~row_changed).sum())
+        new_values = new.to_numpy(dtype=object)
+        old_values = old.to_numpy(dtype=object)
+        for i in row_changed.nonzero()[0]:
+            cols = [j for j, flag in enumerate(flags[i]) if flag]
+            self.updated.append((targets[i], {self.columns[j]: new_values[i, j] for j in cols},
+                                 {self.columns[j]: old_values[i, j] for j in cols}))
+
+class FrameCache:
+    """Binary sidecar cache for DataFrames parsed from slow source files"""
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def fingerprint(self, source_path):
+        """Source file mtime, size and content hash"""
+        stat = os.stat(source_path)
+        digest = hashlib.sha256()
+        with open(source_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+        fingerprint = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'sha256': digest.hexdigest()}
+
+        # Uncheckpointed SQLite changes live in the -wal file, not the database itself
+        wal_path = source_path + '-wal'
+        if os.path.exists(wal_path) and os.path.getsize(wal_path) > 0:
+            fingerprint['wal_size'] = os.path.getsize(wal_path)
+        return fingerprint
+
+    def cache_paths(self, source_path):
+        """Meta and data file paths for a source file"""
+        key = hashlib.sha1(os.path.abspath(source_path).encode('utf-8')).hexdigest()[:16]
+        base = os.path.join(self.cache_dir, f"{os.path.basename(source_path)}.{key}")
+        return f"{base}.json", f"{base}.bin"
+
+    def load(self, source_path, reader):
+        """Return the cached frame if the source is unchanged, otherwise parse and cache it"""
+        fingerprint = self.fingerprint(source_path)
+        meta_path, data_path = self.cache_paths(source_path)
+
+        try:
+            with open(meta_path, 'r') as f:
+                meta = json.load(f)
+            if meta.get('fingerprint') == fingerprint:
+                return self.read_frame(data_path, meta.get('format'))
+        except (OSError, ValueError, KeyError):
+            pass
+        except Exception as e:
+            print(f"Cache read error: {e}")
+
+        df = reader(source_path)
+        try:
+            self.write_frame(df, meta_path, data_path, fingerprint)
+        except Exception as e:
+            print(f"Cache write error: {e}")
+        return df
+
+    def save(self, source_path, df):
+        """Cache a frame for the current contents of the source file"""
+        try:
+            meta_path, data_path = self.cache_paths(source_path)
+            self.write_frame(df, meta_path, data_path, self.fingerprint(source_path))
+        except Exception as e:
+            print(f"Cache write error: {e}")
+
+    def read_frame(self, data_path, cache_format):
+        """Read a cached frame"""
+        if cache_format == 'feather':
+            import pyarrow.feather as feather
+            return feather.read_feather(data_path).set_index('_index').rename_axis(None)
+        return pd.read_pickle(data_path)
+
+    def write_frame(self, df, meta_path, data_path, fingerprint):
+        """Write a frame as Feather when pyarrow can store it, pickle otherwise"""
+        cache_format = 'pickle'
+        try:
+            import pyarrow.feather as feather
+            DataWriter.write_atomically(data_path, lambda temp_path: feather.write_feather(
+                df.rename_axis('_index').reset_index(), temp_path))
+            cache_format = 'feather'
+        except Exception:
+            # pyarrow missing, or object columns with mixed types
+            DataWriter.write_atomically(data_path, lambda temp_path: df.to_pickle(temp_path))
+
+        meta = {'fingerprint': fingerprint, 'format': cache_format}
+        DataWriter.write_atomically(meta_path, lambda temp_path: self._write_meta(temp_path, meta))
+
+    def _write_meta(self, meta_path, meta):
+        with open(meta_path, 'w') as f:
+            json.dump(meta, f)
+
+class PortfolioStats:
+    """Running per-status and per-progress aggregates of the project list"""
+    def __init__(self):
+        self.rebuild(None)
+
+    def rebuild(self, df):
+        """Recompute every aggregate from a full DataFrame"""
+        self.total = 0
+        self.reward_total = 0.0
+        self.status_counts = {}
+        self.progress_counts = {}
+        self.status_rewards = {}
+        if df is None or df.empty:
+            return
+
+        rewards = pd.to_numeric(df['Estimated Reward'], errors='coerce').fillna(0.0)
+        status = df['Status'].where(df['Status'] != '')
+        progress = df['Progress'].where(df['Progress'] != '')
+        self.total = len(df)
+        self.reward_total = float(rewards.sum())
+        self.status_counts = {str(k): int(v) for k, v in status.value_counts().items()}
+        self.progress_counts = {str(k): int(v) for k, v in progress.value_counts().items()}
+        self.status_rewards = {str(k): float(v) for k, v in rewards.groupby(status).sum().items()}
+
+    def add(self, row):
+        """Count a new project"""
+        self._apply(row, 1)
+
+    def remove(self, row):
+        """Forget a deleted project"""
+        self._apply(row, -1)
+
+    def replace(self, old_row, new_row):
+        """Move an edited project between buckets"""
+        self._apply(old_row, -1)
+        self._apply(new_row, 1)
+
+    def _apply(self, row, sign):
+        """Add or subtract one row's contribution"""
+        status = self._key(row.get('Status'))
+        progress = self._key(row.get('Progress'))
+        reward = self._reward(row.get('Estimated Reward'))
+
+        self.total += sign
+        self.reward_total = self.reward_total + sign * reward if self.total else 0.0
+        if status is not None:
+            self._bump(self.status_counts, status, sign)
+            if status in self.status_counts:
+                self.status_rewards[status] = self.status_rewards.get(status, 0.0) + sign * reward
+            else:
+                # Drop the bucket rather than keep floating-point residue
+                self.status_rewards.pop(status, None)
+        if progress is not None:
+            self._bump(self.progress_counts, progress, sign)
+
+    @staticmethod
+    def _bump(counts, key, sign):
+        """Adjust a count, removing buckets that reach zero"""
+        count = counts.get(key, 0) + sign
+        if count > 0:
+            counts[key] = count
+        else:
+            counts.pop(key, None)
+
+    @staticmethod
+    def _key(value):
+        """Bucket name for a Status or Progress value, None when blank"""
+        if value is None or pd.isna(value) or value == '':
+            return None
+        return str(value)
+
+    @staticmethod
+    def _reward(value):
+        """Estimated Reward as a float, treating bad values as zero"""
+        try:
+            reward = float(value)
+        except (TypeError, ValueError):
+            return 0.0
+        return 0.0 if pd.isna(reward) else reward
+
+
+class RecurrenceRule:
+    """Repeat rule for a project's due time, expanded lazily one occurrence at a time
+
+    Rules are "hourly", "daily", "weekly", "every N minutes/hours/days/weeks"
+    (or "every 6h"), or "cron MIN HOUR DAY MONTH WEEKDAY" with *, lists,
+    ranges and /steps; weekday 0 is Sunday.
+    """
+    UNITS = {
+        'm': 'minutes', 'min': 'minutes', 'mins': 'minutes', 'minute': 'minutes', 'minutes': 'minutes',
+        'h': 'hours', 'hr': 'hours', 'hrs': 'hours', 'hour': 'hours', 'hours': 'hours',
+        'd': 'days', 'day': 'days', 'days': 'days',
+        'w': 'weeks', 'week': 'weeks', 'weeks': 'weeks',
+    }
+    NAMED = {'hourly': timedelta(hours=1), 'daily': timedelta(days=1), 'weekly': timedelta(weeks=1)}
+    CRON_RANGES = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 7)]
+    # Longest length of each month, counting 29 February
+    MONTH_DAYS = [31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+    # Give up on cron rules that never match (e.g. 31 February) after this many days
+    CRON_SEARCH_DAYS = 366 * 5
+    _cache = {}
+
+    def __init__(self, step=None, cron=None):
+        self.step = step
+        self.cron = cron
+
+    @classmethod
+    def parse(cls, text):
+        """Rule for a Recurrence value, None for no repeat; raises ValueError if malformed"""
+        text = ' '.join(str(text or '').lower().split())
+        if text in ('', 'none', 'nan'):
+            return None
+        if text not in cls._cache:
+            cls._cache[text] = cls._parse(text)
+        return cls._cache[text]
+
+    @classmethod
+    def parse_or_none(cls, text):
+        """Like parse, but treats a malformed rule as no repeat"""
+        try:
+            return cls.parse(text)
+        except ValueError:
+            return None
+
+    @classmethod
+    def _parse(cls, text):
+        """Build a rule from normalized text"""
+        if text in cls.NAMED:
+            return cls(step=cls.NAMED[text])
+
+        parts = text.split()
+        if parts[0] == 'every':
+            # "every 6 hours", "every 6h" or "every day"
+            rest = ''.join(parts[1:])
+            digits = len(rest) - len(rest.lstrip('0123456789'))
+            count = int(rest[:digits]) if digits else 1
+            unit = cls.UNITS.get(rest[digits:])
+            if unit is None or count < 1:
+                raise ValueError(f"Unknown recurrence: {text}")
+            return cls(step=timedelta(**{unit: count}))
+
+        if parts[0] == 'cron' and len(parts) == 6:
+            fields = [cls._cron_field(field, low, high) for field, (low, high) in zip(parts[1:], cls.CRON_RANGES)]
+            weekdays = {day % 7 for day in fields[4]}
+            restricted = (parts[3] != '*', parts[5] != '*')
+            # A day of month alone must exist in one of the months; with a weekday either may match
+            if restricted == (True, False) and not any(day <= cls.MONTH_DAYS[month - 1]
+                                                       for month in fields[3] for day in fields[2]):
+                raise ValueError(f"Cron rule never matches: {text}")
+            return cls(cron=(sorted(fields[0]), sorted(fields[1]), fields[2], fields[3], weekdays, restricted))
+
+        raise ValueError(f"Unknown recurrence: {text}")
+
+    @staticmethod
+    def _cron_field(field, low, high):
+        """Values allowed by one cron field"""
+        values = set()
+        for part in field.split(','):
+            base, _, step = part.partition('/')
+            if base == '*':
+                start, end = low, high
+            elif '-' in base:
+                start, end = (int(value) for value in base.split('-', 1))
+            else:
+                start = end = int(base)
+            step = int(step) if step else 1
+            if start < low or end > high or start > end or step < 1:
+                raise ValueError(f"Cron field out of range: {field}")
+            values.update(range(start, end + 1, step))
+        return values
+
+    def occurrences(self, anchor, after):
+        """Generate occurrences at or after anchor and strictly after after"""
+        if self.step is not None:
+            return self._interval_occurrences(anchor, after)
+        return self._cron_occurrences(anchor, after)
+
+    def _interval_occurrences(self, anchor, after):
+        """Occurrences of an every-N rule"""
+        # Jump straight to the first occurrence instead of walking from the anchor
+        index = 0 if after < anchor else (after - anchor) // self.step + 1
+        while True:
+            yield anchor + index * self.step
+            index += 1
+
+    def _cron_day_matches(self, day):
+        """Whether a cron rule fires on a date"""
+        minutes, hours, days, months, weekdays, (days_restricted, weekdays_restricted) = self.cron
+        if day.month not in months:
+            return False
+        day_match = day.day in days
+        weekday_match = (day.weekday() + 1) % 7 in weekdays
+        # Like cron, a restricted day and weekday match if either does
+        if days_restricted and weekdays_restricted:
+            return day_match or weekday_match
+        return day_match and weekday_match
+
+    def _cron_occurrences(self, anchor, after):
+        """Occurrences of a cron rule, scanning day by day"""
+        minutes, hours = self.cron[:2]
+        start = max(anchor, after.replace(second=0, microsecond=0) + timedelta(minutes=1))
+        day = start.date()
+        for _ in range(self.CRON_SEARCH_DAYS):
+            if self._cron_day_matches(day):
+                for hour in hours:
+                    for minute in minutes:
+                        occurrence = datetime(day.year, day.month, day.day, hour, minute)
+                        if occurrence >= start:
+                            yield occurrence
+            day += timedelta(days=1)
+
+    def next_occurrence(self, anchor, after):
+        """First occurrence at or after anchor and strictly after after, or None"""
+        return next(self.occurrences(anchor, after), None)
+
+    def latest_occurrence(self, anchor, after, until):
+        """Last occurrence at or after anchor, strictly after after and at or before until, or None"""
+        start = max(anchor, after + timedelta(microseconds=1))
+        if until < start:
+            return None
+        if self.step is not None:
+            occurrence = anchor + (until - anchor) // self.step * self.step
+            return occurrence if occurrence >= start else None
+
+        # Scan cron days backwards from until, stopping at start
+        minutes, hours = self.cron[:2]
+        day = until.date()
+        for _ in range(self.CRON_SEARCH_DAYS):
+            if day < start.date():
+                break
+            if self._cron_day_matches(day):
+                for hour in reversed(hours):
+                    for minute in reversed(minutes):
+                        occurrence = datetime(day.year, day.month, day.day, hour, minute)
+                        if occurrence <= until:
+                            return occurrence if occurrence >= start else None
+            day -= timedelta(days=1)
+        return None
+
+
+class ReminderScheduler:
+    """Priority queue of reminder times keyed by project id"""
+    # Upper bound on one sleep so a suspended machine or a clock change is
+    # noticed without polling every project
+    MAX_WAIT = 300
+
+    def __init__(self):
+        self.heap = []
+        self.entries = {}
+        self.counter = 0
+        self.condition = threading.Condition()
+        # Set by wake() so a wake that comes before the wait isn't lost
+        self.wake_pending = False
+
+    def schedule(self, row_id, when):
+        """Set or move a project's reminder time; None unschedules it"""
+        with self.condition:
+            if when is None:
+                self.entries.pop(row_id, None)
+                return
+            # Superseded heap entries are left in place and skipped when popped
+            self.counter += 1
+            self.entries[row_id] = self.counter
+            heapq.heappush(self.heap, (when, self.counter, row_id))
+            if self.heap[0][1] == self.counter:
+                # New earliest item - wake the waiter to shorten its sleep
+                self.condition.notify_all()
+
+    def remove(self, row_id):
+        """Forget a project"""
+        self.schedule(row_id, None)
+
+    def rebuild(self, items):
+        """Replace the queue with (row_id, when) pairs"""
+        with self.condition:
+            self.counter += 1
+            self.entries = {row_id: self.counter for row_id, when in items if when is not None}
+            self.heap = [(when, self.counter, row_id) for row_id, when in items if when is not None]
+            heapq.heapify(self.heap)
+            self.condition.notify_all()
+
+    def pop_due(self, now):
+        """Remove and return the ids of every project due at or before now"""
+        due = []
+        with self.condition:
+            while self.heap and self.heap[0][0] <= now:
+                when, seq, row_id = heapq.heappop(self.heap)
+                if self.entries.get(row_id) == seq:
+                    del self.entries[row_id]
+                    due.append(row_id)
+        return due
+
+    def next_due(self):
+        """Earliest pending reminder time, or None when nothing is scheduled"""
+        with self.condition:
+            while self.heap and self.entries.get(self.heap[0][2]) != self.heap[0][1]:
+                heapq.heappop(self.heap)
+            return self.heap[0][0] if self.heap else None
+
+    def wait_for_due(self, max_wait=None):
+        """Sleep until the earliest reminder is due, a new earliest item, wake() or max_wait seconds"""
+        # The sleep is worked out under the lock the wait releases, so a
+        # schedule() can't send its wakeup before anyone is listening
+        with self.condition:
+            if not self.wake_pending:
+                next_due = self.next_due()
+                timeout = self.MAX_WAIT
+                if next_due is not None:
+                    timeout = min(max((next_due - datetime.now()).total_seconds(), 0), timeout)
+                if max_wait is not None:
+                    timeout = min(timeout, max_wait)
+                self.condition.wait(timeout)
+            self.wake_pending = False
+
+    def wake(self):
+        """Interrupt wait_for_due(), e.g. on shutdown"""
+        with self.condition:
+            self.wake_pending = True
+            self.condition.notify_all()
+
+
+class ReminderLedger:
+    """Persistent fired/acknowledged/snoozed state per project id and due instant
+
+    The desktop app and the headless daemon may share one ledger file, so
+    save() merges in entries the other process recorded more recently before
+    writing.
+    """
+    FIRED = 'fired'
+    ACKNOWLEDGED = 'acknowledged'
+    SNOOZED = 'snoozed'
+
+    def __init__(self):
+        # project id -> (due, state, snoozed until)
+        self.entries = {}
+        # project id -> when its entry was recorded, or dropped; merges keep the newer side
+        self.recorded = {}
+        self.removed = {}
+        self.cleared = None
+        self.lock = threading.Lock()
+
+    def lookup(self, row_id, due):
+        """State and snooze time recorded for this due instant, or None"""
+        entry = self.entries.get(row_id)
+        if entry is None or entry[0] != due:
+            # Nothing recorded, or recorded for a due time that has since changed
+            return None
+        return entry[1], entry[2]
+
+    def record(self, row_id, due, state, until=None):
+        """Record a reminder event, replacing the project's previous entry"""
+        with self.lock:
+            self.entries[row_id] = (due, state, until)
+            self.recorded[row_id] = datetime.now()
+
+    def forget(self, row_id):
+        """Drop a deleted project's entry"""
+        with self.lock:
+            self.removed[row_id] = datetime.now()
+            self.recorded.pop(row_id, None)
+            return self.entries.pop(row_id, None) is not None
+
+    def clear(self):
+        """Drop every entry"""
+        with self.lock:
+            self.entries.clear()
+            self.recorded.clear()
+            self.removed.clear()
+            self.cleared = datetime.now()
+
+    def latest(self, row_id):
+        """The project's entry whatever due instant it is for, or None"""
+        return self.entries.get(row_id)
+
+    def compact(self, due_times, recurring=()):
+        """Expire entries for deleted projects and superseded due times"""
+        def is_stale(row_id, due):
+            if row_id not in due_times:
+                return True
+            # Recurring projects keep the entry of their latest occurrence
+            if row_id in recurring:
+                return due < due_times[row_id]
+            return due != due_times[row_id]
+
+        with self.lock:
+            stale = [row_id for row_id, entry in self.entries.items() if is_stale(row_id, entry[0])]
+            now = datetime.now()
+            for row_id in stale:
+                del self.entries[row_id]
+                self.recorded.pop(row_id, None)
+                self.removed[row_id] = now
+        return len(stale)
+
+    def to_json(self):
+        """Entries as JSON-serializable data"""
+        with self.lock:
+            return {str(row_id): {'due': due.isoformat(), 'state': state,
+                                  'until': until.isoformat() if until else None,
+                                  'at': self.recorded.get(row_id, datetime.min).isoformat()}
+                    for row_id, (due, state, until) in self.entries.items()}
+
+    @staticmethod
+    def parse_entry(entry):
+        """((due, state, until), recorded at) from one entry written by to_json"""
+        until = datetime.fromisoformat(entry['until']) if entry.get('until') else None
+        # Files written before entries were stamped count as oldest
+        recorded = datetime.fromisoformat(entry['at']) if entry.get('at') else datetime.min
+        return (datetime.fromisoformat(entry['due']), entry['state'], until), recorded
+
+    def merge_json(self, data):
+        """Take the entries in data written by to_json that are new to us or newer than ours
+
+        An entry we dropped, or dropped with clear(), only comes back if it
+        was recorded again afterwards.
+        """
+        merged = 0
+        with self.lock:
+            for key, entry in data.items():
+                row_id = int(key)
+                entry, recorded = self.parse_entry(entry)
+                ours = [stamp for stamp in (self.recorded.get(row_id), self.removed.get(row_id), self.cleared)
+                        if stamp is not None]
+                if not ours or recorded > max(ours):
+                    self.entries[row_id] = entry
+                    self.recorded[row_id] = recorded
+                    merged += 1
+        return merged
+
+    def save(self, file_path):
+        """Merge in what another process wrote to file_path, then write the ledger there"""
+        try:
+            with open(file_path, 'r') as f:
+                self.merge_json(json.load(f))
+        except FileNotFoundError:
+            pass
+        except (ValueError, KeyError, TypeError) as e:
+            print(f"Ignoring unreadable reminder ledger: {e}")
+        data = self.to_json()
+        DataWriter.write_atomically(file_path, lambda temp_path: DataWriter.write_json(data, temp_path))
+
+
+class ReminderEngine:
+    """Reminder queue and ledger over a project DataFrame
+
+    get_frame returns the current DataFrame (indexed by project id, with the
+    Due column) and is only called with data_lock held. save_ledger is called
+    whenever the ledger changed and should be written out.
+    """
+    def __init__(self, get_frame, data_lock, save_ledger):
+        self.get_frame = get_frame
+        self.data_lock = data_lock
+        self.save_ledger = save_ledger
+        self.scheduler = ReminderScheduler()
+        self.ledger = ReminderLedger()
+
+    def take_due(self, now):
+        """Copies of the projects whose reminder is due at or before now"""
+        due_projects = []
+        for row_id in self.scheduler.pop_due(now):
+            with self.data_lock:
+                df = self.get_frame()
+                if row_id not in df.index:
+                    continue
+                project = df.loc[row_id].copy()
+
+            # Re-check against the current row in case it changed after queueing
+            reminder = self.reminder_occurrence(row_id, project)
+            if reminder is None:
+                continue
+            occurrence, reminder_time = reminder
+            if reminder_time > now:
+                self.scheduler.schedule(row_id, reminder_time)
+                continue
+
+            rule = RecurrenceRule.parse_or_none(project.get('Recurrence'))
+            if rule is not None:
+                # Show this occurrence and queue only the one after it
+                anchor = project['Due'].to_pydatetime()
+                project['Due'] = pd.Timestamp(occurrence)
+                project['Due Date'] = occurrence.strftime('%Y-%m-%d')
+                project['Due Time'] = occurrence.strftime('%H:%M')
+                self.scheduler.schedule(row_id, rule.next_occurrence(anchor, occurrence))
+            due_projects.append(project)
+        return due_projects
+
+    def reminder_time(self, row_id, project):
+        """When a project's reminder should fire, or None if it should not"""
+        reminder = self.reminder_occurrence(row_id, project)
+        return None if reminder is None else reminder[1]
+
+    def reminder_occurrence(self, row_id, project):
+        """(due instant, fire time) of a project's next reminder, or None"""
+        if not project.get('Reminder Enabled', True) or project.get('Status') != 'Active':
+            return None
+        due = project.get('Due')
+        if due is None or pd.isna(due):
+            return None
+        due = due.to_pydatetime()
+
+        rule = RecurrenceRule.parse_or_none(project.get('Recurrence'))
+        if rule is None:
+            # A changed due time no longer matches the ledger entry and re-arms the reminder
+            entry = self.ledger.lookup(row_id, due)
+            if entry is None:
+                return due, due
+            state, snooze_until = entry
+            if state == ReminderLedger.SNOOZED:
+                return due, max(due, snooze_until)
+            return None
+
+        # Recurring: Due is the first occurrence and the ledger holds the latest one
+        # shown. Like an overdue one-shot reminder, the latest occurrence missed
+        # since then (app closed, machine asleep, a late --once run) fires once;
+        # the ones before it are skipped rather than replayed one by one.
+        entry = self.ledger.latest(row_id)
+        if entry is not None and entry[0] >= due:
+            last, state, snooze_until = entry
+            if state == ReminderLedger.SNOOZED:
+                return last, max(last, snooze_until)
+            after = last
+        else:
+            after = due - timedelta(microseconds=1)
+        now = datetime.now()
+        occurrence = rule.latest_occurrence(due, after, now)
+        if occurrence is None:
+            occurrence = rule.next_occurrence(due, max(after, now))
+        return None if occurrence is None else (occurrence, occurrence)
+
+    def reschedule(self, row_id):
+        """Re-key one project in the reminder queue after it changed"""
+        with self.data_lock:
+            df = self.get_frame()
+            project = df.loc[row_id] if row_id in df.index else None
+        self.scheduler.schedule(row_id, None if project is None else self.reminder_time(row_id, project))
+
+    def rebuild(self):
+        """Rebuild the reminder queue from the whole DataFrame"""
+        with self.data_lock:
+            recurring = {int(row_id) for row_id, rule in self.get_frame()['Recurrence'].items()
+                         if RecurrenceRule.parse_or_none(rule) is not None}
+        if self.ledger.compact(self.due_times(), recurring):
+            self.save_ledger()
+        with self.data_lock:
+            df = self.get_frame()
+            candidates = df[(df['Status'] == 'Active') & df['Reminder Enabled'].astype(bool) & df['Due'].notna()]
+            # Only the columns reminder_time reads, not a dict of every field per row
+            candidates = candidates[['Status', 'Reminder Enabled', 'Due', 'Recurrence']]
+            items = [(row_id, self.reminder_time(row_id, project))
+                     for row_id, project in zip(candidates.index, candidates.to_dict('records'))]
+        self.scheduler.rebuild(items)
+
+    def due_times(self):
+        """Current due instant of every project with a readable due date"""
+        with self.data_lock:
+            due = self.get_frame()['Due'].dropna()
+            return {int(row_id): value.to_pydatetime() for row_id, value in due.items()}
+
+    def record(self, project, state, until=None):
+        """Record a reminder event in the ledger; returns the project id or None"""
+        # Reminders for stored projects carry their id as the Series name;
+        # the test reminder has none and nothing to record
+        row_id = getattr(project, 'name', None)
+        due = project.get('Due')
+        with self.data_lock:
+            known = row_id is not None and row_id in self.get_frame().index
+        if not known or due is None or pd.isna(due):
+            return None
+        row_id = int(row_id)
+        self.ledger.record(row_id, due.to_pydatetime(), state, until)
+        self.save_ledger()
+        return row_id
+
+    def load_ledger(self, ledger_file, snooze_file):
+        """Load reminder state into the ledger, importing snoozes from the old snooze file once"""
+        try:
+            if os.path.exists(ledger_file):
+                # Merged, so a reload keeps entries recorded here after the file was read
+                with open(ledger_file, 'r') as f:
+                    self.ledger.merge_json(json.load(f))
+            elif os.path.exists(snooze_file):
+                with open(snooze_file, 'r') as f:
+                    snooze_data = json.load(f)
+
+                # Older files keyed snoozes by "name_date_time" or by project id
+                with self.data_lock:
+                    df = self.get_frame()
+                    legacy_ids = {f"{name}_{due_date}_{due_time}": int(row_id)
+                                  for row_id, name, due_date, due_time in zip(
+                                      df.index, df['Project Name'], df['Due Date'], df['Due Time'])}
+                due_times = self.due_times()
+                for key, snooze_until_str in snooze_data.items():
+                    row_id = int(key) if key.isdigit() else legacy_ids.get(key)
+                    if row_id in due_times:
+                        self.ledger.record(row_id, due_times[row_id], ReminderLedger.SNOOZED,
+                                           datetime.fromisoformat(snooze_until_str))
+        except Exception as e:
+            print(f"Error loading reminder ledger: {e}")
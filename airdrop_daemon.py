@@ -0,0 +1,236 @@
+"""Headless reminder daemon
+
+Runs the reminder engine against the app's data folder without a window, for
+a machine with no display, and hands every due reminder to one or more sinks:
+
+    python premium_airdrop_tracker.py --headless [--data-dir DIR] [--once]
+        [--sink stdout] [--sink log=FILE] [--sink notify] [--sink webhook=URL]
+
+Projects and reminder state are reloaded whenever the desktop app changes
+them. Neither customtkinter nor matplotlib is imported; see
+benchmarks/headless_footprint.py for the memory check.
+"""
+import argparse
+import json
+import logging
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import threading
+from datetime import datetime
+
+from airdrop_core import ProjectStore, ReminderEngine, ReminderLedger, default_data_dir
+
+
+def reminder_payload(project):
+    """JSON-ready fields of a due reminder"""
+    return {
+        'id': int(project.name),
+        'project': str(project.get('Project Name', '')),
+        'due': project['Due'].isoformat(),
+        'status': str(project.get('Status', '')),
+        'progress': str(project.get('Progress', '')),
+        'link': str(project.get('Project Link', '')),
+        'notes': str(project.get('Notes', '')),
+        'recurrence': str(project.get('Recurrence', '')),
+    }
+
+
+class LogSink:
+    """Write reminders to stdout, or append them to a log file"""
+    def __init__(self, log_path=None):
+        self.logger = logging.getLogger(f"airdrop.reminders.{log_path or 'stdout'}")
+        handler = logging.FileHandler(log_path, encoding='utf-8') if log_path else logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter('%(asctime)s %(message)s'))
+        self.logger.addHandler(handler)
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+
+    def send(self, reminder):
+        """Log one reminder"""
+        message = f"Reminder: {reminder['project']} is due {reminder['due']}"
+        if reminder['link']:
+            message += f" - {reminder['link']}"
+        self.logger.info(message)
+
+
+class DesktopSink:
+    """Show reminders as desktop notifications with notify-send"""
+    TIMEOUT = 10
+
+    def __init__(self):
+        self.command = shutil.which('notify-send')
+        if self.command is None:
+            raise ValueError("notify-send was not found; install libnotify or use another sink")
+
+    def send(self, reminder):
+        """Pop up one notification"""
+        body = f"Due {reminder['due'].replace('T', ' ')[:16]}"
+        if reminder['notes']:
+            body += f"\n{reminder['notes']}"
+        subprocess.run([self.command, '--app-name=Airdrop Tracker', f"⏰ {reminder['project']}", body],
+                       check=True, timeout=self.TIMEOUT)
+
+
+class WebhookSink:
+    """POST reminders as JSON to a local endpoint"""
+    TIMEOUT = 5
+
+    def __init__(self, url):
+        self.url = url
+
+    def send(self, reminder):
+        """Deliver one reminder"""
+        # Imported here: urllib.request pulls in http.client and ssl, which
+        # only the webhook sink needs
+        import urllib.request
+
+        request = urllib.request.Request(self.url, data=json.dumps(reminder).encode('utf-8'),
+                                         headers={'Content-Type': 'application/json'}, method='POST')
+        with urllib.request.urlopen(request, timeout=self.TIMEOUT) as response:
+            response.read()
+
+
+def create_sink(spec):
+    """Sink for a --sink value: stdout, log=FILE, notify or webhook=URL"""
+    name, _, value = spec.partition('=')
+    if name == 'stdout':
+        return LogSink()
+    if name == 'notify':
+        return DesktopSink()
+    if name in ('log', 'webhook'):
+        if not value:
+            raise ValueError(f"--sink {name} needs a value, e.g. {name}={'reminders.log' if name == 'log' else 'http://127.0.0.1:8080/'}")
+        return LogSink(value) if name == 'log' else WebhookSink(value)
+    raise ValueError(f"Unknown sink: {spec}")
+
+
+class ReminderDaemon:
+    """Reminder loop over the app's data folder"""
+    def __init__(self, data_dir, sinks, poll_interval=30.0):
+        self.db_path = os.path.join(data_dir, 'airdrop_data.db')
+        self.ledger_file = os.path.join(data_dir, 'reminder_ledger.json')
+        self.snooze_file = os.path.join(data_dir, 'snooze_data.json')
+        self.sinks = sinks
+        self.poll_interval = poll_interval
+        self.data_lock = threading.Lock()
+        self.df = None
+        self.data_stamp = None
+        self.ledger_stamp = None
+        self.ledger_dirty = False
+        self.store = ProjectStore(self.db_path)
+        self.reminders = ReminderEngine(lambda: self.df, self.data_lock, self.save_ledger)
+
+    @staticmethod
+    def file_stamp(file_path):
+        """Modification time and size of a file, None if it doesn't exist"""
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def reload(self):
+        """Reload projects and reminder state if the app changed them since the last look"""
+        # Writes from the app land in the -wal file until SQLite checkpoints them
+        data_stamp = (self.file_stamp(self.db_path), self.file_stamp(self.db_path + '-wal'))
+        ledger_stamp = self.file_stamp(self.ledger_file)
+        if data_stamp == self.data_stamp and ledger_stamp == self.ledger_stamp:
+            return False
+
+        df = ProjectStore.add_due_column(self.store.load_frame())
+        with self.data_lock:
+            self.df = df
+        self.reminders.load_ledger(self.ledger_file, self.snooze_file)
+        self.data_stamp = data_stamp
+        self.ledger_stamp = ledger_stamp
+        self.reminders.rebuild()
+        self.flush_ledger()
+        return True
+
+    def save_ledger(self):
+        """Note a ledger change; flush_ledger writes it once per batch of reminders"""
+        self.ledger_dirty = True
+
+    def flush_ledger(self):
+        """Write the reminder ledger the app reads, if it changed"""
+        if not self.ledger_dirty:
+            return
+        self.ledger_dirty = False
+        try:
+            # Merged with what the app wrote, so neither side loses the other's entries
+            self.reminders.ledger.save(self.ledger_file)
+            # Our own write is not a change made by the app
+            self.ledger_stamp = self.file_stamp(self.ledger_file)
+        except Exception as e:
+            print(f"Error saving reminder ledger: {e}")
+
+    def deliver(self, project):
+        """Send one reminder to every sink and mark it fired"""
+        reminder = reminder_payload(project)
+        for sink in self.sinks:
+            try:
+                sink.send(reminder)
+            except Exception as e:
+                print(f"Reminder sink error ({type(sink).__name__}): {e}")
+        self.reminders.record(project, ReminderLedger.FIRED)
+
+    def run(self, once=False):
+        """Deliver reminders as they come due; with once, only those due now"""
+        self.reload()
+        while True:
+            for project in self.reminders.take_due(datetime.now()):
+                self.deliver(project)
+            self.flush_ledger()
+            if once:
+                return
+
+            # Sleep until the next reminder, waking now and then to pick up edits made in the app
+            self.reminders.scheduler.wait_for_due(self.poll_interval)
+            try:
+                self.reload()
+            except Exception as e:
+                print(f"Reload error: {e}")
+
+    def close(self):
+        """Close the project store"""
+        self.store.close()
+
+
+def main(argv=None):
+    """Entry point for premium_airdrop_tracker.py --headless"""
+    parser = argparse.ArgumentParser(prog='premium_airdrop_tracker.py --headless',
+                                     description="Run project reminders without the desktop window.")
+    parser.add_argument('--headless', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--data-dir', default=default_data_dir(),
+                        help="Folder holding airdrop_data.db (default: the app's data folder)")
+    parser.add_argument('--sink', action='append', metavar='SINK',
+                        help="stdout (default), log=FILE, notify or webhook=URL; repeat for several")
+    parser.add_argument('--once', action='store_true', help="Deliver the reminders due now and exit")
+    parser.add_argument('--poll', type=float, default=30.0, metavar='SECONDS',
+                        help="How often to look for changes made in the app (default: 30)")
+    args = parser.parse_args(argv)
+
+    try:
+        sinks = [create_sink(spec) for spec in args.sink or ['stdout']]
+    except ValueError as e:
+        parser.error(str(e))
+    # Don't create an empty database: the app migrates an existing Excel file on its first run
+    if not os.path.exists(os.path.join(args.data_dir, 'airdrop_data.db')):
+        parser.error(f"No project database in {args.data_dir}; open the desktop app once to create it")
+
+    daemon = ReminderDaemon(args.data_dir, sinks, poll_interval=args.poll)
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        daemon.run(once=args.once)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        daemon.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+"""Measure the styled Excel writer on synthetic portfolios.
+
+Compares the old normal-mode writer (one cell at a time from iterrows, then a
+second walk over every cell for the widths) against WorkbookWriter, which
+streams rows in openpyxl's write-only mode. Reports wall time and the peak
+Python memory allocated while writing (tracemalloc), and checks on a small
+portfolio that both produce the same cells, fills and widths.
+
+The old writer is only run up to --legacy-max rows because it gets slow. The
+memory pass runs under tracemalloc and takes a few minutes at 100,000 rows.
+
+Usage: python benchmarks/bench_excel_export.py [--legacy-max N] [rows ...]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from airdrop_core import ProjectStore, WorkbookWriter
+
+from bench_load_data import make_frame
+
+
+def legacy_write(df, file_path):
+    """The writer used before WorkbookWriter, kept for comparison"""
+    from openpyxl import Workbook
+    from openpyxl.styles import PatternFill, Font
+
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Airdrop Data"
+
+    headers = [col for col in ProjectStore.COLUMNS if col in df.columns and col != 'Reminder Enabled']
+    for col_idx, header in enumerate([ProjectStore.ID_COLUMN] + headers, 1):
+        cell = ws.cell(row=1, column=col_idx, value=header)
+        cell.font = Font(bold=True)
+
+    status_colors = {
+        'Active': PatternFill(start_color='4FC3F7', end_color='4FC3F7', fill_type='solid'),
+        'Completed': PatternFill(start_color='81C784', end_color='81C784', fill_type='solid'),
+        'Monitoring': PatternFill(start_color='FFA500', end_color='FFA500', fill_type='solid'),
+        'Dropped': PatternFill(start_color='E57373', end_color='E57373', fill_type='solid')
+    }
+
+    for r_idx, (row_id, row) in enumerate(df.iterrows(), 2):
+        ws.cell(row=r_idx, column=1, value=row_id)
+        for c_idx, col in enumerate(headers, 2):
+            value = row[col]
+            cell = ws.cell(row=r_idx, column=c_idx, value=value)
+            if col == 'Status' and value in status_colors:
+                cell.fill = status_colors[value]
+
+    for column in ws.columns:
+        max_length = 0
+        column_letter = column[0].column_letter
+        for cell in column:
+            if len(str(cell.value)) > max_length:
+                max_length = len(str(cell.value))
+        ws.column_dimensions[column_letter].width = min(max_length + 2, 50)
+
+    wb.save(file_path)
+
+
+def measure(write, df, file_path):
+    """Wall time of one write, and peak traced allocations of a second one"""
+    # Timed without tracemalloc, which slows openpyxl several times over
+    start = time.perf_counter()
+    write(df, file_path)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    write(df, file_path)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak / (1024 * 1024)
+
+
+def read_back(file_path):
+    """Cell values, fill colours and column widths of a written workbook"""
+    from openpyxl import load_workbook
+
+    ws = load_workbook(file_path).active
+    cells = [[(cell.value, cell.fill.fgColor.rgb if cell.fill.fill_type else None) for cell in row]
+             for row in ws.iter_rows()]
+    widths = {letter: dim.width for letter, dim in ws.column_dimensions.items() if dim.width}
+    return cells, widths
+
+
+def prepare(rows):
+    """Synthetic projects in the shape the app holds them: indexed by id, with the store columns"""
+    df = make_frame(rows)
+    df.index = range(1, rows + 1)
+    df['Recurrence'] = ''
+    df['Reminder Enabled'] = True
+    return df
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('rows', type=int, nargs='*', default=[1000, 10000, 100000])
+    parser.add_argument('--legacy-max', type=int, default=10000,
+                        help='largest portfolio to run the old writer on (default: 10000)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        sample = prepare(300)
+        legacy_write(sample, os.path.join(tmp, 'legacy.xlsx'))
+        WorkbookWriter.write(sample, os.path.join(tmp, 'streamed.xlsx'))
+        same = read_back(os.path.join(tmp, 'legacy.xlsx')) == read_back(os.path.join(tmp, 'streamed.xlsx'))
+        print(f"{'OK  ' if same else 'FAIL'} same cells, fills and widths as the old writer")
+        print()
+
+        print(f"{'rows':>8} {'old':>10} {'old peak':>10} {'streamed':>10} {'peak':>10}")
+        for rows in args.rows:
+            df = prepare(rows)
+            file_path = os.path.join(tmp, 'export.xlsx')
+            old = old_peak = None
+            if rows <= args.legacy_max:
+                old, old_peak = measure(legacy_write, df, file_path)
+            new, new_peak = measure(WorkbookWriter.write, df, file_path)
+            old_text = f"{old:>9.2f}s {old_peak:>7.1f}MiB" if old is not None else f"{'-':>10} {'-':>10}"
+            print(f"{rows:>8} {old_text} {new:>9.2f}s {new_peak:>7.1f}MiB")
+
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
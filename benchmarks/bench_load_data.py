@@ -0,0 +1,79 @@
+"""Measure load_data read paths on synthetic portfolios.
+
+Compares parsing airdrop_data.xlsx with pd.read_excel (the old startup path)
+against the FrameCache sidecar, and the SQLite project store with and without
+the startup cache written on quit.
+
+Usage: python benchmarks/bench_load_data.py [rows ...]
+"""
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from airdrop_core import FrameCache, ProjectStore
+
+STATUSES = ['Active', 'Completed', 'Monitoring', 'Dropped']
+PROGRESS = ['0%', '25%', '50%', '75%', '100%']
+
+
+def make_frame(rows):
+    """Synthetic projects with the same columns as the data file"""
+    return pd.DataFrame({
+        'Project Name': [f"Project {i}" for i in range(rows)],
+        'Status': [STATUSES[i % 4] for i in range(rows)],
+        'Due Date': [f"2025-{i % 12 + 1:02d}-{i % 28 + 1:02d}" for i in range(rows)],
+        'Due Time': [f"{i % 24:02d}:{i % 60:02d}" for i in range(rows)],
+        'Progress': [PROGRESS[i % 5] for i in range(rows)],
+        'Estimated Reward': [float(i * 1000 % 977) for i in range(rows)],
+        'Project Link': [f"https://example.com/airdrop/{i}" for i in range(rows)],
+        'Notes': [f"Daily check-in and quest #{i}" for i in range(rows)],
+    })
+
+
+def timed(func, repeat=3):
+    """Best wall time of several runs"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main(sizes):
+    print(f"{'rows':>8} {'read_excel':>12} {'xlsx cached':>12} {'store':>12} {'store cached':>13}")
+    for rows in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            xlsx_path = os.path.join(tmp, 'airdrop_data.xlsx')
+            df = make_frame(rows)
+            df.to_excel(xlsx_path, index=False)
+
+            store = ProjectStore(os.path.join(tmp, 'airdrop_data.db'))
+            store.replace_all(df)
+
+            before = timed(lambda: pd.read_excel(xlsx_path), repeat=1 if rows >= 100000 else 3)
+
+            cache = FrameCache(os.path.join(tmp, 'cache'))
+            cache.load(xlsx_path, pd.read_excel)
+            xlsx_hit = timed(lambda: cache.load(xlsx_path, pd.read_excel))
+
+            # Startup after a clean quit: the cache matches the checkpointed database
+            from_store = timed(store.load_frame)
+            final_data = store.load_frame()
+            store.close()
+            cache.save(store.db_path, final_data)
+
+            store = ProjectStore(store.db_path)
+            store_hit = timed(lambda: cache.load(store.db_path, lambda _: store.load_frame()))
+            store.close()
+
+        print(f"{rows:>8} {before:>11.3f}s {xlsx_hit:>11.3f}s {from_store:>11.3f}s {store_hit:>12.3f}s")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [1000, 10000, 100000])
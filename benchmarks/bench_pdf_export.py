@@ -0,0 +1,174 @@
+"""Measure the PDF report writer on synthetic portfolios.
+
+Compares the old report builder (a Paragraph for every cell, all rows in one
+Table) against PdfReportWriter, which lays the rows out as page-sized tables
+with plain strings for cells that fit on one line, and with --parallel also
+times the worker-process layout (needs pypdf to join the parts). Reports wall
+time, the peak Python memory allocated while writing (tracemalloc) and the
+page count, and checks that every project made it into the new report.
+
+The old builder is only run up to --legacy-max rows because it gets slow.
+
+Usage: python benchmarks/bench_pdf_export.py [--legacy-max N] [--parallel] [rows ...]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from airdrop_core import PdfReportWriter, ProjectStore
+
+from bench_excel_export import prepare
+
+
+def legacy_write(df, file_path):
+    """The report builder used before PdfReportWriter, kept for comparison"""
+    from reportlab.lib.pagesizes import letter, landscape
+    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.lib import colors
+    from reportlab.lib.units import inch
+
+    doc = SimpleDocTemplate(file_path, pagesize=landscape(letter))
+    styles = getSampleStyleSheet()
+    elements = [Paragraph("Airdrop Tracker Report", styles['Title']),
+                Paragraph(f"Generated on: {time.strftime('%Y-%m-%d %H:%M')}", styles['Normal']),
+                Paragraph("<br/><br/>", styles['Normal'])]
+
+    table_data = [['Project Name', 'Status', 'Due DateTime', 'Progress',
+                   'Estimated Reward', 'Project Link', 'Notes']]
+    cell_style = styles['Normal']
+    cell_style.wordWrap = 'CJK'
+    for _, row in df.iterrows():
+        due_date = row.get('Due Date', '')
+        due_time = row.get('Due Time', '')
+        due_datetime = f"{due_date} {due_time}" if due_date and due_time else ''
+        due = row.get('Due')
+        if pd.notna(due):
+            due_datetime = f"{due_datetime} ({due.strftime('%A')})"
+        table_data.append([
+            Paragraph(str(row.get('Project Name', '')), cell_style),
+            Paragraph(str(row.get('Status', '')), cell_style),
+            Paragraph(str(due_datetime), cell_style),
+            Paragraph(str(row.get('Progress', '')), cell_style),
+            Paragraph(f"Rp {row.get('Estimated Reward', 0):,.2f}", cell_style),
+            Paragraph(str(row.get('Project Link', '')), cell_style),
+            Paragraph(str(row.get('Notes', '')), cell_style)
+        ])
+
+    col_widths = [1.5*inch, 0.8*inch, 1.5*inch, 0.8*inch, 1.0*inch, 1.8*inch, 2.0*inch]
+    table = Table(table_data, colWidths=col_widths, repeatRows=1)
+    table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+        ('FONTSIZE', (0, 1), (-1, -1), 8),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black)
+    ]))
+    elements.append(table)
+    doc.build(elements)
+
+
+def serial_write(df, file_path):
+    """PdfReportWriter laid out in this process"""
+    PdfReportWriter.render(PdfReportWriter.report_rows(df), file_path)
+
+
+def parallel_write(df, file_path):
+    """PdfReportWriter laid out in worker processes"""
+    rows = PdfReportWriter.report_rows(df)
+    workers = min(os.cpu_count() or 1, -(-len(rows) // PdfReportWriter.PART_ROWS))
+    PdfReportWriter.render_parallel(rows, file_path, max(workers, 2))
+
+
+def measure(write, df, file_path, trace=True):
+    """Wall time of one write, and peak traced allocations of a second one"""
+    # Timed without tracemalloc, which slows reportlab several times over
+    start = time.perf_counter()
+    write(df, file_path)
+    elapsed = time.perf_counter() - start
+    if not trace:
+        return elapsed, None
+
+    tracemalloc.start()
+    write(df, file_path)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak / (1024 * 1024)
+
+
+def report_text(file_path):
+    """Page count and extracted text of a PDF, or None without pypdf"""
+    if not PdfReportWriter.can_concatenate():
+        return None
+    from pypdf import PdfReader
+
+    reader = PdfReader(file_path)
+    return len(reader.pages), "\n".join(page.extract_text() for page in reader.pages)
+
+
+def sample_frame(rows):
+    """Synthetic projects with the Due column, every fifth one with notes that wrap"""
+    df = ProjectStore.add_due_column(prepare(rows))
+    df.loc[df.index[::5], 'Notes'] = "Bridge to the L2, swap twice, provide liquidity & hold for 30 days <weekly>"
+    return df
+
+
+def result(elapsed, peak):
+    """A time and peak memory column pair"""
+    if elapsed is None:
+        return f"{'-':>10} {'-':>10}"
+    return f"{elapsed:>9.2f}s {peak:>7.1f}MiB" if peak is not None else f"{elapsed:>9.2f}s {'-':>10}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('rows', type=int, nargs='*', default=[1000, 5000, 20000])
+    parser.add_argument('--legacy-max', type=int, default=5000,
+                        help='largest portfolio to run the old builder on (default: 5000)')
+    parser.add_argument('--parallel', action='store_true',
+                        help='also time the worker-process layout (needs pypdf)')
+    args = parser.parse_args()
+
+    ok = True
+    with tempfile.TemporaryDirectory() as tmp:
+        file_path = os.path.join(tmp, 'report.pdf')
+        sample = sample_frame(300)
+        PdfReportWriter.write(sample, file_path)
+        text = report_text(file_path)
+        if text is None:
+            print("SKIP content check (pypdf not installed)")
+        else:
+            missing = [name for name in sample['Project Name'] if f"{name}\n" not in text[1] + "\n"]
+            ok = not missing
+            print(f"{'OK  ' if ok else 'FAIL'} all {len(sample)} projects in the report, {text[0]} pages"
+                  + (f"; missing {missing[:3]}" if missing else ""))
+        print()
+
+        print(f"{'rows':>8} {'old':>10} {'old peak':>10} {'tables':>10} {'peak':>10} {'parallel':>10}")
+        for rows in args.rows:
+            df = sample_frame(rows)
+            old = old_peak = parallel = None
+            if rows <= args.legacy_max:
+                old, old_peak = measure(legacy_write, df, file_path)
+            new, new_peak = measure(serial_write, df, file_path)
+            if args.parallel and PdfReportWriter.can_concatenate():
+                parallel, _ = measure(parallel_write, df, file_path, trace=False)
+            parallel_text = f"{parallel:>9.2f}s" if parallel is not None else f"{'-':>10}"
+            print(f"{rows:>8} {result(old, old_peak)} {result(new, new_peak)} {parallel_text}")
+
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+"""Check that dashboard updates reuse their figures instead of leaking them.
+
+Drives DashboardCharts through a series of updates with varying counts on the
+Agg backend and fails if the number of live matplotlib figures, pyplot
+figures or axes artists grows, or if traced memory keeps climbing.
+
+The project has no test suite; this script is the check and exits with
+status 1 on failure. check_reuse() runs it and returns the failures, for use
+from other tooling.
+
+Usage: python benchmarks/check_dashboard_figures.py [updates]
+"""
+import gc
+import os
+import random
+import sys
+import tracemalloc
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from premium_airdrop_tracker import DashboardCharts
+
+STATUSES = ['Active', 'Completed', 'Monitoring', 'Dropped']
+
+
+class DeferredCanvas(FigureCanvasAgg):
+    """Agg canvas that coalesces draw_idle requests like the Tk canvas does"""
+    pending = False
+
+    def draw_idle(self, *args, **kwargs):
+        self.pending = True
+
+    def flush(self):
+        if self.pending:
+            self.pending = False
+            self.draw()
+
+
+def live_figures():
+    """Number of Figure objects still reachable"""
+    gc.collect()
+    return sum(1 for obj in gc.get_objects() if isinstance(obj, Figure))
+
+
+def artist_count(charts):
+    """Artists currently attached to both chart axes"""
+    return len(charts.status_ax.get_children()) + len(charts.progress_ax.get_children())
+
+
+def random_counts(rng):
+    """Status and progress counts for one simulated edit"""
+    status = {s: rng.randint(0, 50) for s in STATUSES}
+    progress = {p: rng.randint(0, 50) for p in DashboardCharts.PROGRESS_ORDER}
+    return status, progress
+
+
+def check_reuse(updates=1000, verbose=False):
+    """Run updates through DashboardCharts and return what grew, empty when nothing did"""
+    rng = random.Random(0)
+
+    charts = DashboardCharts()
+    canvases = [DeferredCanvas(charts.status_fig), DeferredCanvas(charts.progress_fig)]
+    charts.update(*random_counts(rng))
+    for canvas in canvases:
+        canvas.flush()
+
+    figures_before = live_figures()
+    pyplot_before = len(plt.get_fignums())
+    artists_before = artist_count(charts)
+
+    tracemalloc.start()
+    for i in range(updates):
+        status, progress = random_counts(rng)
+        status['Active'] = max(status['Active'], 1)
+        charts.update(status, progress)
+        if i % 100 == 0:
+            # Render pending draw_idle work like an idle Tk event loop would
+            for canvas in canvases:
+                canvas.flush()
+        if i == updates // 10:
+            gc.collect()
+            warm_memory = tracemalloc.get_traced_memory()[0]
+    gc.collect()
+    final_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    figures_after = live_figures()
+    pyplot_after = len(plt.get_fignums())
+    artists_after = artist_count(charts)
+    growth_kb = (final_memory - warm_memory) / 1024
+
+    if verbose:
+        print(f"updates:          {updates}")
+        print(f"live figures:     {figures_before} -> {figures_after}")
+        print(f"pyplot figures:   {pyplot_before} -> {pyplot_after}")
+        print(f"axes artists:     {artists_before} -> {artists_after}")
+        print(f"memory growth:    {growth_kb:.1f} KiB after warm-up")
+
+    failures = []
+    if figures_after != figures_before:
+        failures.append("live figure count changed")
+    if pyplot_after != pyplot_before:
+        failures.append("pyplot figure count changed")
+    if artists_after > artists_before:
+        failures.append("axes artist count grew")
+    if growth_kb > 1024:
+        failures.append("memory kept growing")
+    return failures
+
+
+def main():
+    updates = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    failures = check_reuse(updates, verbose=True)
+    if failures:
+        print("FAIL: " + ", ".join(failures))
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
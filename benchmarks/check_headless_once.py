@@ -0,0 +1,109 @@
+"""Check that a late --once run delivers overdue recurring reminders.
+
+Creates a data folder with one-time and recurring projects (hourly, daily,
+every 5 minutes, cron) whose due time passed several minutes ago, runs
+premium_airdrop_tracker.py --headless --once against it twice and fails if the
+first run misses any of them or the second run delivers one again.
+
+Usage: python benchmarks/check_headless_once.py [--minutes-late N]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, APP_DIR)
+from airdrop_core import ProjectStore
+
+# Project name -> recurrence; every one is due --minutes-late minutes ago
+PROJECTS = {
+    'One-time': '',
+    'Hourly': 'hourly',
+    'Daily': 'daily',
+    'Every 5 minutes': 'every 5 minutes',
+    'Weekly': 'weekly',
+}
+# Not yet due; must not be delivered
+LATER = 'Tomorrow'
+
+
+def make_frame(minutes_late):
+    """The overdue projects plus one due tomorrow"""
+    now = datetime.now().replace(second=0, microsecond=0)
+    due = now - timedelta(minutes=minutes_late)
+    names = [*PROJECTS, 'Cron', LATER]
+    recurrence = [*PROJECTS.values(), f"cron {due.minute} {due.hour} * * *", '']
+    dues = [due] * (len(names) - 1) + [now + timedelta(days=1)]
+    return pd.DataFrame({
+        'Project Name': names,
+        'Status': ['Active'] * len(names),
+        'Due Date': [d.strftime('%Y-%m-%d') for d in dues],
+        'Due Time': [d.strftime('%H:%M') for d in dues],
+        'Progress': ['25%'] * len(names),
+        'Estimated Reward': [0.0] * len(names),
+        'Project Link': [''] * len(names),
+        'Notes': [''] * len(names),
+        'Recurrence': recurrence,
+    })
+
+
+def run_once(data_dir, log_path):
+    """Run the daemon once and return the project names it logged"""
+    script = os.path.join(APP_DIR, 'premium_airdrop_tracker.py')
+    result = subprocess.run([sys.executable, script, '--headless', '--once', '--data-dir', data_dir,
+                             '--sink', f"log={log_path}"], capture_output=True, text=True, cwd=APP_DIR)
+    if result.returncode != 0:
+        print(result.stderr[-4000:])
+        raise RuntimeError(f"daemon exited with status {result.returncode}")
+    names = []
+    if os.path.exists(log_path):
+        with open(log_path, encoding='utf-8') as f:
+            names = [line.split('Reminder: ', 1)[1].split(' is due ', 1)[0] for line in f]
+        os.remove(log_path)
+    return names
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--minutes-late', type=int, default=3,
+                        help='how long ago the projects came due, in minutes (default: 3)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        store = ProjectStore(os.path.join(data_dir, 'airdrop_data.db'))
+        store.replace_all(make_frame(args.minutes_late))
+        store.close()
+
+        log_path = os.path.join(data_dir, 'reminders.log')
+        first = run_once(data_dir, log_path)
+        second = run_once(data_dir, log_path)
+
+    expected = sorted([*PROJECTS, 'Cron'])
+    print(f"due {args.minutes_late} minutes ago: {', '.join(expected)}")
+    print(f"first run:        {', '.join(sorted(first)) or '-'}")
+    print(f"second run:       {', '.join(sorted(second)) or '-'}")
+
+    failures = []
+    missing = sorted(set(expected) - set(first))
+    if missing:
+        failures.append(f"not delivered: {', '.join(missing)}")
+    if len(first) != len(set(first)):
+        failures.append("delivered twice in one run")
+    if LATER in first or LATER in second:
+        failures.append("delivered a reminder that is not due")
+    if second:
+        failures.append(f"delivered again: {', '.join(sorted(second))}")
+    if failures:
+        print("FAIL: " + "; ".join(failures))
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
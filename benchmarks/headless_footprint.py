@@ -0,0 +1,144 @@
+"""Memory footprint of the headless reminder daemon.
+
+Creates a data folder with a synthetic portfolio (some reminders due now),
+runs premium_airdrop_tracker.py --headless --once in a fresh interpreter and
+prints:
+
+- resident memory of the interpreter with pandas loaded (the floor any
+  reader of the project store pays), and the daemon's peak on top of it
+- whether a GUI module (customtkinter, tkinter, matplotlib) was imported
+- how many of the due reminders were delivered to the log sink
+
+Exits with status 1 when the daemon's share exceeds the budget, a GUI module
+leaks in or a due reminder is not delivered.
+Peak resident memory is read from /proc on Linux and with the resource module
+elsewhere (macOS).
+
+Usage: python benchmarks/headless_footprint.py [--rows N] [--budget MIB]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, APP_DIR)
+from airdrop_core import ProjectStore
+
+# Modules the daemon must run without
+GUI_MODULES = ['customtkinter', 'tkinter', 'matplotlib']
+
+# Runs the daemon entry point as __main__ and reports what it cost
+PROBE = r"""
+import resource, runpy, sys
+
+def peak_rss_kib():
+    # ru_maxrss on Linux carries over the parent's peak across fork and exec;
+    # VmHWM belongs to this process alone
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+import pandas
+print(f"BASELINE_RSS_KIB {{peak_rss_kib()}}", flush=True)
+sys.argv = [{script!r}, '--headless', '--once', '--data-dir', {data_dir!r}, '--sink', {sink!r}]
+try:
+    runpy.run_path({script!r}, run_name='__main__')
+except SystemExit:
+    pass
+print(f"PEAK_RSS_KIB {{peak_rss_kib()}}", flush=True)
+print("LOADED " + " ".join(sorted(m.split('.')[0] for m in sys.modules)), flush=True)
+"""
+
+
+def due_count(rows):
+    """Projects make_frame makes due now"""
+    return len(range(0, rows, 10))
+
+
+def make_frame(rows):
+    """Active projects, every tenth one already due"""
+    now = datetime.now().replace(second=0, microsecond=0)
+    due = [now - timedelta(minutes=5) if i % 10 == 0 else now + timedelta(hours=i % 240 + 1)
+           for i in range(rows)]
+    return pd.DataFrame({
+        'Project Name': [f"Project {i}" for i in range(rows)],
+        'Status': ['Active'] * rows,
+        'Due Date': [d.strftime('%Y-%m-%d') for d in due],
+        'Due Time': [d.strftime('%H:%M') for d in due],
+        'Progress': ['25%'] * rows,
+        'Estimated Reward': [float(i % 977) for i in range(rows)],
+        'Project Link': [f"https://example.com/airdrop/{i}" for i in range(rows)],
+        'Notes': [f"Daily check-in and quest #{i}" for i in range(rows)],
+        'Recurrence': ['daily' if i % 7 == 0 else '' for i in range(rows)],
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=5000, help='projects in the portfolio (default: 5000)')
+    parser.add_argument('--budget', type=float, default=48.0,
+                        help='resident memory the daemon may add to the pandas baseline, in MiB (default: 48)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        store = ProjectStore(os.path.join(data_dir, 'airdrop_data.db'))
+        store.replace_all(make_frame(args.rows))
+        store.close()
+
+        log_path = os.path.join(data_dir, 'reminders.log')
+        probe = PROBE.format(script=os.path.join(APP_DIR, 'premium_airdrop_tracker.py'),
+                             data_dir=data_dir, sink=f"log={log_path}")
+        result = subprocess.run([sys.executable, '-c', probe], capture_output=True, text=True, cwd=APP_DIR)
+
+        delivered = 0
+        if os.path.exists(log_path):
+            with open(log_path, encoding='utf-8') as f:
+                delivered = sum(1 for _ in f)
+
+    baseline_rss = peak_rss = None
+    loaded = set()
+    for line in result.stdout.splitlines():
+        if line.startswith('BASELINE_RSS_KIB '):
+            baseline_rss = int(line.split()[1]) / 1024
+        elif line.startswith('PEAK_RSS_KIB '):
+            peak_rss = int(line.split()[1]) / 1024
+        elif line.startswith('LOADED '):
+            loaded = set(line.split()[1:])
+
+    if peak_rss is None:
+        print(result.stderr[-4000:])
+        print("Probe did not finish")
+        return 1
+
+    expected = due_count(args.rows)
+    all_delivered = delivered == expected
+    print(f"{'OK  ' if all_delivered else 'FAIL'} {args.rows} projects, "
+          f"{delivered} of {expected} due reminders delivered")
+
+    leaked = [name for name in GUI_MODULES if name in loaded]
+    if leaked:
+        print(f"FAIL GUI modules imported: {', '.join(leaked)}")
+    else:
+        print(f"OK   GUI modules not imported: {', '.join(GUI_MODULES)}")
+
+    daemon_rss = peak_rss - baseline_rss
+    within_budget = daemon_rss <= args.budget
+    print(f"     interpreter with pandas {baseline_rss:.1f} MiB, peak {peak_rss:.1f} MiB")
+    print(f"{'OK  ' if within_budget else 'FAIL'} daemon added {daemon_rss:.1f} MiB "
+          f"(budget {args.budget:.1f} MiB)")
+    return 0 if within_budget and not leaked and all_delivered else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+"""Import-time report for the start of the app, up to the password prompt.
+
+Runs a fresh interpreter with -X importtime, constructs the main window up to
+check_password (the first dialog the user sees) and prints:
+
+- the slowest top-level imports (cumulative, like -X importtime)
+- whether any module that should be deferred was imported anyway
+- the time until the password dialog would appear, against a budget
+
+Exits with status 1 when the budget is exceeded or a deferred module leaks in.
+
+Usage: python benchmarks/import_time_report.py [--budget SECONDS] [--top N]
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that must not be imported before the password prompt
+DEFERRED_MODULES = ['matplotlib', 'reportlab', 'openpyxl', 'tkcalendar', 'pystray']
+
+# Stops the app at check_password and reports the elapsed time
+PROBE = r"""
+import sys, time
+start = time.perf_counter()
+sys.path.insert(0, {app_dir!r})
+import premium_airdrop_tracker as app
+
+def probe_check_password(self):
+    print(f"PASSWORD_DIALOG {{time.perf_counter() - start:.3f}}", flush=True)
+    print("LOADED " + " ".join(sorted(m.split('.')[0] for m in sys.modules)), flush=True)
+    return False
+
+app.PremiumAirdropTracker.check_password = probe_check_password
+app.PremiumAirdropTracker()
+"""
+
+
+def parse_importtime(stderr):
+    """Parse -X importtime lines into (cumulative_us, self_us, module, depth)"""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|', 2)
+        depth = (len(name) - len(name.lstrip(' ')) - 1) // 2
+        entries.append((int(cumulative_us), int(self_us), name.strip(), depth))
+    return entries
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--budget', type=float, default=1.5,
+                        help='seconds allowed until the password dialog (default: 1.5)')
+    parser.add_argument('--top', type=int, default=15, help='number of imports to list')
+    args = parser.parse_args()
+
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', PROBE.format(app_dir=APP_DIR)],
+        capture_output=True, text=True, cwd=APP_DIR)
+
+    dialog_time = None
+    loaded = set()
+    for line in result.stdout.splitlines():
+        if line.startswith('PASSWORD_DIALOG '):
+            dialog_time = float(line.split()[1])
+        elif line.startswith('LOADED '):
+            loaded = set(line.split()[1:])
+
+    if dialog_time is None:
+        print(result.stderr[-4000:])
+        print("Probe did not reach the password dialog")
+        return 1
+
+    entries = parse_importtime(result.stderr)
+    top_level = sorted((e for e in entries if e[3] == 0), reverse=True)
+    total_us = sum(e[0] for e in top_level)
+
+    print(f"{'cumulative':>12} {'self':>10}  module")
+    for cumulative_us, self_us, name, _ in top_level[:args.top]:
+        print(f"{cumulative_us / 1000:>10.1f}ms {self_us / 1000:>8.1f}ms  {name}")
+    print(f"{total_us / 1000:>10.1f}ms {'':>10}  total ({len(entries)} modules)")
+    print()
+
+    leaked = [name for name in DEFERRED_MODULES if name in loaded]
+    if leaked:
+        print(f"FAIL deferred modules imported before the password dialog: {', '.join(leaked)}")
+    else:
+        print(f"OK   deferred modules not imported: {', '.join(DEFERRED_MODULES)}")
+
+    within_budget = dialog_time <= args.budget
+    print(f"{'OK  ' if within_budget else 'FAIL'} password dialog after {dialog_time:.3f}s "
+          f"(budget {args.budget:.3f}s)")
+    return 0 if within_budget and not leaked else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
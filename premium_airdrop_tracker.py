@@ -1,97 +1,292 @@
+import sys
+import multiprocessing
+
+# Large PDF reports are laid out in worker processes, which a frozen build
+# starts by running this file again; serve them before anything else loads
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+
+# The headless reminder daemon runs without a display, so it is dispatched
+# before customtkinter (or anything else Tk) is imported
+if __name__ == "__main__" and "--headless" in sys.argv[1:]:
+    from airdrop_daemon import main
+    sys.exit(main())
+
 import customtkinter as ctk
 from tkinter import ttk, messagebox, simpledialog, filedialog
 import pandas as pd
 import os
-import sys
 import json
+import math
 from datetime import datetime, timedelta
-from tkcalendar import DateEntry
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from PIL import Image, ImageTk, ImageDraw
-import winsound
 import threading
 import time
+import queue
 import shutil
-from openpyxl import Workbook
-from openpyxl.styles import PatternFill, Font
-from openpyxl.utils.dataframe import dataframe_to_rows
-from reportlab.lib.pagesizes import letter, landscape
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.lib import colors
-from reportlab.lib.units import inch
 import tkinter as tk
 import hashlib
 import binascii
-import pystray
-from pystray import MenuItem as item
-import keyboard
+import random
 import webbrowser
 import traceback
+from collections import deque
+
+from airdrop_core import (CsvWriter, DataWriter, ExportJob, FrameCache, ImportMerge, ImportReader,
+                          PdfReportWriter, PortfolioStats, ProjectStore, RecurrenceRule, ReminderEngine,
+                          ReminderLedger, WorkbookWriter, default_data_dir)
 
-# Pre-load matplotlib font cache to avoid blocking
-plt.rcParams['font.family'] = 'DejaVu Sans'
-plt.rcParams['figure.max_open_warning'] = 50
+# Heavy modules are imported where they are first needed so the password
+# prompt appears quickly: matplotlib (dashboard charts), openpyxl (Excel
+# files), reportlab (PDF export), tkcalendar (data form) and pystray (tray
+# icon). See benchmarks/import_time_report.py.
 
 # Set appearance mode and color theme
 ctk.set_appearance_mode("Dark")
 ctk.set_default_color_theme("blue")
 
+class ScheduledJob:
+    """A periodic job and its run history"""
+    def __init__(self, name, func, interval, jitter=0.0, essential=False, retry=None, max_delay=None):
+        self.name = name
+        self.func = func
+        self.interval = interval
+        self.jitter = jitter
+        self.essential = essential
+        self.retry = retry or interval
+        self.max_delay = max_delay or self.retry * 8
+        self.next_run = None
+        # Set when next_run is a wall-clock time from run_at or the job itself,
+        # which an interval change must not move
+        self.deadline = None
+        self.last_run = None
+        self.last_duration = None
+        self.last_error = None
+        self.failures = 0
+        self.in_progress = False
+
+    def delay(self):
+        """Seconds until the next run: the interval, or a growing retry delay after failures"""
+        if self.failures:
+            delay = min(self.retry * 2 ** (self.failures - 1), self.max_delay)
+        else:
+            delay = self.interval
+        if self.jitter:
+            delay += random.uniform(-self.jitter, self.jitter) * delay
+        return max(delay, 0)
+
+class TaskScheduler:
+    """Runs the app's periodic jobs on the UI thread from a single Tk timer
+
+    Jobs that are not essential are held while the app is locked or in the
+    tray, and run once on return if they fell due in the meantime. A job may
+    return the time.time() of its next run instead of waiting one interval.
+    """
+    # Longest single timer, so a suspended machine or a clock change is noticed
+    MAX_TIMER = 300
+
+    def __init__(self, app):
+        self.app = app
+        self.jobs = {}
+        self.timer_id = None
+        self.suspended = False
+        self.running = True
+
+    def add(self, name, func, interval, jitter=0.0, essential=False, retry=None, max_delay=None):
+        """Register a job that first runs one interval from now"""
+        job = ScheduledJob(name, func, interval, jitter, essential, retry, max_delay)
+        job.next_run = time.time() + job.delay()
+        self.jobs[name] = job
+        self._arm()
+        return job
+
+    def remove(self, name):
+        """Drop a job"""
+        if self.jobs.pop(name, None) is not None:
+            self._arm()
+
+    def configure(self, name, interval):
+        """Change a job's interval, counting from its last run unless a deadline is pending"""
+        job = self.jobs.get(name)
+        if job is None or interval <= 0:
+            return
+        if job.retry == job.interval:
+            job.retry = interval
+            job.max_delay = interval * 8
+        job.interval = interval
+        if job.deadline is None:
+            job.next_run = (job.last_run or time.time()) + job.delay()
+        self._arm()
+
+    def apply_intervals(self, intervals):
+        """Apply {job name: seconds} overrides, e.g. from settings.json"""
+        for name, interval in intervals.items():
+            try:
+                self.configure(name, float(interval))
+            except (TypeError, ValueError):
+                print(f"Ignoring interval for {name}: {interval!r}")
+
+    def run_at(self, name, when):
+        """Move a job's next run to a wall-clock time"""
+        job = self.jobs.get(name)
+        if job is not None:
+            job.next_run = job.deadline = when
+            self._arm()
+
+    def set_suspended(self, suspended):
+        """Hold or release the jobs that are not essential"""
+        if suspended != self.suspended:
+            self.suspended = suspended
+            self._arm()
+
+    def status(self):
+        """Next run, last run and last duration of every job"""
+        return [{'name': job.name, 'interval': job.interval, 'next_run': job.next_run,
+                 'last_run': job.last_run, 'last_duration': job.last_duration,
+                 'failures': job.failures, 'last_error': job.last_error,
+                 'held': self.suspended and not job.essential}
+                for job in self.jobs.values()]
+
+    def stop(self):
+        """Cancel the timer and stop running jobs"""
+        self.running = False
+        self._cancel()
+
+    def _active(self, job):
+        return not job.in_progress and (job.essential or not self.suspended)
+
+    def _cancel(self):
+        if self.timer_id is not None:
+            try:
+                self.app.after_cancel(self.timer_id)
+            except tk.TclError:
+                pass
+            self.timer_id = None
+
+    def _arm(self):
+        """Point the timer at the earliest job that may run"""
+        self._cancel()
+        if not self.running:
+            return
+        pending = [job.next_run for job in self.jobs.values() if self._active(job)]
+        if not pending:
+            return
+        delay = min(max(min(pending) - time.time(), 0), self.MAX_TIMER)
+        try:
+            self.timer_id = self.app.after(int(delay * 1000), self._tick)
+        except tk.TclError:
+            # Window has been destroyed
+            self.running = False
+
+    def _tick(self):
+        """Run every job that is due"""
+        self.timer_id = None
+        now = time.time()
+        due = [job for job in self.jobs.values() if self._active(job) and job.next_run <= now]
+        for job in due:
+            # Re-arm before running so a job that blocks in a dialog (the lock
+            # screen) doesn't hold up the others
+            job.in_progress = True
+            job.next_run = now + job.interval
+            job.deadline = None
+        self._arm()
+
+        for job in due:
+            start = time.perf_counter()
+            next_run = None
+            try:
+                next_run = job.func()
+                job.failures = 0
+                job.last_error = None
+            except Exception as e:
+                job.failures += 1
+                job.last_error = str(e)
+                print(f"Scheduled job {job.name} failed: {e}")
+            job.in_progress = False
+            job.last_run = time.time()
+            job.last_duration = time.perf_counter() - start
+            if next_run is None or next_run <= job.last_run:
+                job.next_run = job.last_run + job.delay()
+            else:
+                job.next_run = job.deadline = next_run
+        if due:
+            self._arm()
+
 class AutoLockManager:
     """Auto-lock manager for security"""
+    # While the mouse moves, motion is handled at most once per this many milliseconds
+    MOTION_THROTTLE_MS = 1000
+
     def __init__(self, app, lock_callback, inactivity_minutes=10):
         self.app = app
         self.lock_callback = lock_callback
         self.inactivity_minutes = inactivity_minutes
         self.last_activity_time = time.time()
         self.running = True
+        self.motion_binding = None
         self.setup_auto_lock()
         
     def setup_auto_lock(self):
         """Setup auto-lock functionality"""
         # Bind events to track activity
-        events = ['<Button>', '<Key>', '<Motion>']
-        for event in events:
+        for event in ['<Button>', '<Key>']:
             self.app.bind(event, self.reset_inactivity_timer)
+        self.bind_motion()
         
-        # Start checking for inactivity
-        self.check_inactivity()
+        # The app's task scheduler holds this check while locked or in the tray.
+        # Each check returns the exact lock deadline, so activity never touches the timer.
+        self.app.tasks.add('auto_lock', self.check_inactivity, 60)
+        self.app.tasks.run_at('auto_lock', self.lock_deadline())
+
+    def bind_motion(self):
+        """Start listening for mouse motion again"""
+        if self.running and self.motion_binding is None:
+            self.motion_binding = self.app.bind('<Motion>', self.on_motion)
+
+    def on_motion(self, event=None):
+        """Record motion, then ignore it for a moment instead of handling every event"""
+        self.reset_inactivity_timer()
+        try:
+            self.unbind_motion()
+            self.app.after(self.MOTION_THROTTLE_MS, self.bind_motion)
+        except tk.TclError:
+            pass
+
+    def unbind_motion(self):
+        """Stop listening for mouse motion"""
+        if self.motion_binding is not None:
+            # Passing the id also frees the Tcl command created by bind
+            self.app.unbind('<Motion>', self.motion_binding)
+            self.motion_binding = None
         
     def reset_inactivity_timer(self, event=None):
         """Reset inactivity timer"""
         if self.running and not self.app.is_minimized_to_tray:
             self.last_activity_time = time.time()
+
+    def lock_deadline(self):
+        """When the app locks if there is no further activity"""
+        return self.last_activity_time + self.inactivity_minutes * 60
         
     def check_inactivity(self):
-        """Check for inactivity and lock if needed"""
-        if not self.running or not hasattr(self, 'winfo_exists') or not self.winfo_exists():
-            return
-            
-        try:
-            # Don't lock if app is minimized to tray
-            if self.app.is_minimized_to_tray:
-                # Check again after 1 minute if still running
-                if self.running and hasattr(self, 'winfo_exists') and self.winfo_exists():
-                    self.app.after(60000, self.check_inactivity)
-                return
-                
-            current_time = time.time()
-            if current_time - self.last_activity_time > self.inactivity_minutes * 60:
-                if self.app.winfo_viewable():  # Only lock if window is visible
-                    self.lock_callback()
-                    self.reset_inactivity_timer()
-            
-            # Check again after 1 minute if still running
-            if self.running and hasattr(self, 'winfo_exists') and self.winfo_exists():
-                self.app.after(60000, self.check_inactivity)
-        except tk.TclError:
-            # Window has been destroyed
-            self.stop()
+        """Lock if the deadline has passed; returns the next deadline to check at"""
+        if not self.running or self.app.is_minimized_to_tray:
+            return None
+
+        if time.time() >= self.lock_deadline():
+            if not self.app.winfo_viewable():  # Only lock if window is visible
+                return None
+            self.lock_callback()
+            self.reset_inactivity_timer()
+        return self.lock_deadline()
             
     def stop(self):
         """Stop the auto-lock manager"""
         self.running = False
+        self.app.tasks.remove('auto_lock')
+        try:
+            self.unbind_motion()
+        except tk.TclError:
+            pass
 
 class PasswordRecovery:
     """Password recovery system"""
@@ -152,7 +347,131 @@ class PasswordRecovery:
             messagebox.showerror("Error", f"Password recovery failed: {str(e)}")
             return None
 
+class DashboardCharts:
+    """Persistent dashboard figures whose artists are updated in place"""
+    STATUS_COLORS = {
+        'Active': '#45B7D1',      # Light blue
+        'Completed': '#96CEB4',   # Light green
+        'Monitoring': '#FFA500',  # Orange
+        'Dropped': '#FF6B6B',     # Red
+    }
+    PROGRESS_ORDER = ['0%', '25%', '50%', '75%', '100%']
+
+    def __init__(self):
+        # Figures are created outside pyplot so they are owned by this object
+        # alone and freed with it instead of piling up in pyplot's registry
+        from matplotlib.figure import Figure
+
+        self.status_fig = Figure(figsize=(5, 4))
+        self.status_ax = self.status_fig.add_subplot()
+        self.progress_fig = Figure(figsize=(5, 4))
+        self.progress_ax = self.progress_fig.add_subplot()
+        self.status_wedges = None
+        self.status_labels = None
+        self.status_pcts = None
+        self.status_categories = None
+        self.progress_bars = None
+        self.progress_categories = None
+        self.status_counts = None
+        self.progress_counts = None
+
+    def update(self, status_counts, progress_counts):
+        """Update both charts, redrawing only the ones whose data changed"""
+        changed = self.update_status(status_counts)
+        return self.update_progress(progress_counts) or changed
+
+    def update_status(self, status_counts):
+        """Update the status pie wedges and labels in place"""
+        counts = {str(k): int(v) for k, v in dict(status_counts).items() if v}
+        if counts == self.status_counts:
+            return False
+        self.status_counts = counts
+
+        statuses = [s for s in self.STATUS_COLORS if s in counts] + sorted(s for s in counts if s not in self.STATUS_COLORS)
+        values = [counts[status] for status in statuses]
+        ax = self.status_ax
+        if not counts:
+            ax.clear()
+            ax.text(0.5, 0.5, 'No data available', ha='center', va='center')
+            ax.set_title('Status Distribution')
+            self.status_wedges = None
+            self.status_categories = None
+        elif statuses != self.status_categories:
+            # Only a status appearing or disappearing changes the slices
+            ax.clear()
+            colors = [self.STATUS_COLORS.get(status, '#CCCCCC') for status in statuses]
+            self.status_wedges, self.status_labels, self.status_pcts = ax.pie(
+                values, labels=statuses, autopct='%1.1f%%', colors=colors)
+            self.status_categories = statuses
+            ax.set_title('Status Distribution')
+        else:
+            # Same layout as ax.pie: counterclockwise from 0 degrees, labels at
+            # 1.1 and percentages at 0.6 of the radius
+            total = sum(values)
+            theta1 = 0.0
+            for wedge, label, pct, value in zip(self.status_wedges, self.status_labels, self.status_pcts, values):
+                theta2 = theta1 + 360.0 * value / total
+                wedge.set_theta1(theta1)
+                wedge.set_theta2(theta2)
+                middle = math.radians((theta1 + theta2) / 2)
+                x, y = math.cos(middle), math.sin(middle)
+                label.set_position((1.1 * x, 1.1 * y))
+                label.set_horizontalalignment('left' if x > 0 else 'right')
+                pct.set_position((0.6 * x, 0.6 * y))
+                pct.set_text(f"{100.0 * value / total:.1f}%")
+                theta1 = theta2
+        self.status_fig.canvas.draw_idle()
+        return True
+
+    def update_progress(self, progress_counts):
+        """Update the progress bar heights in place"""
+        counts = {str(k): int(v) for k, v in dict(progress_counts).items() if v}
+        if counts == self.progress_counts:
+            return False
+        self.progress_counts = counts
+
+        ax = self.progress_ax
+        if not counts:
+            ax.clear()
+            ax.text(0.5, 0.5, 'No data available', ha='center', va='center')
+            ax.set_title('Progress Distribution')
+            self.progress_bars = None
+            self.progress_categories = None
+        else:
+            categories = self.PROGRESS_ORDER + sorted(c for c in counts if c not in self.PROGRESS_ORDER)
+            heights = [counts.get(category, 0) for category in categories]
+            if categories != self.progress_categories:
+                # Only an unexpected progress value changes the bar layout
+                ax.clear()
+                self.progress_bars = ax.bar(categories, heights)
+                self.progress_categories = categories
+                ax.set_title('Progress Distribution')
+                ax.set_xlabel('Progress')
+                ax.set_ylabel('Count')
+                ax.tick_params(axis='x', labelrotation=45)
+            else:
+                for bar, height in zip(self.progress_bars, heights):
+                    bar.set_height(height)
+            ax.set_ylim(0, max(heights) * 1.1)
+        self.progress_fig.canvas.draw_idle()
+        return True
+
+
 class PremiumAirdropTracker(ctk.CTk):
+    # Tab names
+    DASHBOARD_TAB = "📊 Dashboard"
+    DATA_TAB = "📋 Data"
+    REMINDER_TAB = "⏰ Reminders"
+    SETTINGS_TAB = "⚙️ Settings"
+    ABOUT_TAB = "ℹ️ About"
+
+    # Reminders coming due within this many milliseconds share one digest
+    DIGEST_DELAY_MS = 2000
+    # Changes listed in the merge preview; the summary counts all of them
+    MERGE_PREVIEW_ROWS = 500
+    # How often the UI picks up progress from running exports
+    EXPORT_POLL_MS = 100
+
     def __init__(self):
         super().__init__()
 
@@ -166,15 +485,29 @@ class PremiumAirdropTracker(ctk.CTk):
         self.is_minimized_to_tray = False
         self.closing_app = False
         self.data_lock = threading.Lock()  # Lock for thread-safe data access
+        self.writer = None
+        self.locked = False
+        self.unexported_changes = 0
+        self.export_threshold = 200  # Store changes before refreshing the Excel copy
+
+        # Exports run on worker threads and report through this queue
+        self.export_events = queue.Queue()
+        self.export_jobs = {}
+        self.export_rows = {}
+        self.export_counter = 0
+        self.export_poll_id = None
 
         # Initialize chart variables
-        self.status_fig = None
-        self.status_ax = None
+        self.matplotlib_configured = False
+        self.charts = None
         self.status_canvas = None
-        self.progress_fig = None
-        self.progress_ax = None
         self.progress_canvas = None
 
+        # Bumped on every data change; the dashboard catches up lazily
+        self.data_version = 0
+        self.dashboard_version = -1
+        self.dashboard_refresh_pending = False
+
         # Password protection
         self.get_data_file_path()
         if not self.check_password():
@@ -182,8 +515,17 @@ class PremiumAirdropTracker(ctk.CTk):
             return
 
         try:
+            # Periodic jobs (backup, auto-lock) run from one timer
+            self.settings = self.load_settings()
+            self.tasks = TaskScheduler(self)
+
             # Load data with thread-safe protection
-            self.df = self.load_data()
+            self.store = None
+            self.df = ProjectStore.add_due_column(self.load_data())
+            self.stats = PortfolioStats()
+            self.stats.rebuild(self.df)
+            self.writer = DataWriter(self.store, self.data_file_path, self.write_workbook,
+                                     on_error=self.report_save_error)
             
             # Create backup directory
             self.create_backup_dir()
@@ -193,31 +535,32 @@ class PremiumAirdropTracker(ctk.CTk):
             
             # Setup reminder system
             self.reminder_active = True
-            self.shown_reminders = set()
-            self.snoozed_projects = {}
+            self.pending_reminders = deque()
+            self.reminders = ReminderEngine(lambda: self.df, self.data_lock, self.save_reminder_ledger)
+            self.reminders.load_ledger(self.ledger_file, self.snooze_file)
+            self.reminders.rebuild()
             self.reminder_thread = None
             self.reminder_stop_event = threading.Event()
-            self.setup_reminder_system()
+
+            # Reminder digest window and the reminders listed in it
+            self.reminder_window = None
+            self.digest_after_id = None
+            self.digest_rows = {}
+            self.digest_projects = {}
+            self.digest_counter = 0
 
             # Create the UI widgets
             self.create_widgets()
 
-            # Update UI
-            self.update_dashboard()
-            self.update_table()
-            
             # Track currently editing row
             self.editing_index = None
-            
-            # Reminder notification window
-            self.reminder_window = None
+
+            # Started once the UI and digest state exist, as a reminder may already be due
+            self.setup_reminder_system()
             
             # Setup new features
             self.setup_new_features()
             
-            # Load snooze data
-            self.load_snooze_data()
-            
         except Exception as e:
             messagebox.showerror("Error", f"Failed to initialize application: {str(e)}")
             self.destroy()
@@ -235,9 +578,16 @@ class PremiumAirdropTracker(ctk.CTk):
         # Password recovery
         self.password_recovery = PasswordRecovery(self.security_dir)
 
+        # Interval overrides from settings.json, e.g. {"task_intervals": {"backup": 43200}}
+        self.tasks.apply_intervals(self.settings.get('task_intervals', {}))
+
     def setup_tray_icon(self):
         """Setup system tray icon"""
         try:
+            from PIL import Image, ImageDraw
+            import pystray
+            from pystray import MenuItem as item
+
             # Create a simple icon
             image = Image.new('RGB', (64, 64), color='blue')
             draw = ImageDraw.Draw(image)
@@ -276,6 +626,10 @@ class PremiumAirdropTracker(ctk.CTk):
             self.deiconify()
             self.lift()
             self.focus_force()
+
+            # Catch up on changes made while hidden
+            self.after_idle(self._refresh_dashboard_idle)
+            self.after_idle(self.update_task_suspension)
             
             # Hide tray icon when showing app
             if self.tray_icon:
@@ -298,6 +652,7 @@ class PremiumAirdropTracker(ctk.CTk):
             try:
                 self.is_minimized_to_tray = True
                 self.withdraw()
+                self.update_task_suspension()
                 
                 # Start tray icon if not already running
                 if not self.tray_thread or not self.tray_thread.is_alive():
@@ -319,19 +674,33 @@ class PremiumAirdropTracker(ctk.CTk):
             self.closing_app = True
             self.running = False
             
-            # Stop reminder system
+            # Stop reminder system, periodic jobs and exports
             self.stop_reminder_system()
+            self.tasks.stop()
+            for job in list(self.export_jobs.values()):
+                job.cancel()
+                job.thread.join(timeout=2.0)
             
             # Stop auto-lock
             if hasattr(self, 'auto_lock'):
                 self.auto_lock.stop()
             
-            # Save data
+            # Save data and wait for the writer to finish
             try:
-                self.save_data()
-                self.save_snooze_data()
-            except:
-                pass
+                self.save_reminder_ledger()
+                if self.unexported_changes:
+                    self.save_data()
+                # No timeout: the store must not be closed under a writer still using it
+                self.writer.stop(timeout=None)
+                if self.writer.thread.is_alive():
+                    print("Writer still running; leaving the project store open")
+                else:
+                    final_data = self.store.load_frame()
+                    self.store.close()
+                    # Refresh the startup cache now that the database is checkpointed
+                    self.frame_cache.save(self.db_path, final_data)
+            except Exception as e:
+                print(f"Error saving data on quit: {e}")
             
             # Stop tray icon
             if self.tray_icon:
@@ -340,15 +709,6 @@ class PremiumAirdropTracker(ctk.CTk):
                 except:
                     pass
             
-            # Close matplotlib figures
-            try:
-                if hasattr(self, 'status_fig') and self.status_fig and plt.fignum_exists(self.status_fig.number):
-                    plt.close(self.status_fig)
-                if hasattr(self, 'progress_fig') and self.progress_fig and plt.fignum_exists(self.progress_fig.number):
-                    plt.close(self.progress_fig)
-            except:
-                pass
-            
             # Destroy the window
             try:
                 self.quit()
@@ -365,11 +725,19 @@ class PremiumAirdropTracker(ctk.CTk):
     def lock_application(self):
         """Lock the application"""
         if not self.is_minimized_to_tray:
+            self.locked = True
+            self.update_task_suspension()
             self.withdraw()
             if not self.check_password():
                 self.quit_application()
             else:
                 self.deiconify()
+                self.locked = False
+                self.update_task_suspension()
+
+    def update_task_suspension(self):
+        """Hold non-essential periodic jobs while locked or in the tray"""
+        self.tasks.set_suspended(self.locked or self.is_minimized_to_tray)
             
     def initiate_password_recovery(self):
         """Initiate password recovery process"""
@@ -477,14 +845,11 @@ class PremiumAirdropTracker(ctk.CTk):
 
     def get_data_file_path(self):
         """Determine where to save the data file"""
-        if getattr(sys, 'frozen', False):
-            application_path = os.path.dirname(sys.executable)
-        else:
-            application_path = os.path.dirname(os.path.abspath(__file__))
-        
-        self.data_dir = os.path.join(application_path, 'data')
+        self.data_dir = default_data_dir()
         os.makedirs(self.data_dir, exist_ok=True)
         self.data_file_path = os.path.join(self.data_dir, 'airdrop_data.xlsx')
+        self.db_path = os.path.join(self.data_dir, 'airdrop_data.db')
+        self.frame_cache = FrameCache(os.path.join(self.data_dir, 'cache'))
         self.settings_path = os.path.join(self.data_dir, 'settings.json')
         
         # Create secure directory for password
@@ -498,7 +863,8 @@ class PremiumAirdropTracker(ctk.CTk):
         self.security_backup_dir = os.path.join(self.backup_dir, 'security')
         os.makedirs(self.security_backup_dir, exist_ok=True)
         
-        # Snooze data file
+        # Reminder state, replacing the snooze file of earlier versions
+        self.ledger_file = os.path.join(self.data_dir, 'reminder_ledger.json')
         self.snooze_file = os.path.join(self.data_dir, 'snooze_data.json')
 
     def create_backup_dir(self):
@@ -509,28 +875,30 @@ class PremiumAirdropTracker(ctk.CTk):
     def setup_auto_backup(self):
         """Setup automatic daily backup"""
         self.auto_backup = True
-        self.last_backup_time = time.time()
-        self.backup_interval = 86400  # 24 hours in seconds
-        self.run_backup_check()
+        # Backups keep running in the tray and while locked
+        self.tasks.add('backup', self.run_backup_check, 86400, jitter=0.02, essential=True)
+        self.tasks.add('reminder_watchdog', self.check_reminder_thread, 300, essential=True)
 
     def run_backup_check(self):
-        """Check if backup is needed"""
-        if not self.running or not hasattr(self, 'auto_backup'):
-            return
-            
+        """Create the automatic backup"""
+        if self.running and self.auto_backup and not self.closing_app:
+            self.create_backup()
+
+    def check_reminder_thread(self):
+        """Restart the reminder thread if reminders are on but it has stopped"""
+        if self.running and self.reminder_active and not self.closing_app:
+            if self.reminder_thread is None or not self.reminder_thread.is_alive():
+                self.setup_reminder_system()
+
+    def load_settings(self):
+        """Read optional settings from settings.json"""
         try:
-            if self.auto_backup and (time.time() - self.last_backup_time >= self.backup_interval):
-                try:
-                    self.create_backup()
-                    self.last_backup_time = time.time()
-                except Exception as e:
-                    print(f"Backup error: {e}")
-            
-            if self.running and not self.closing_app:
-                self.after(3600000, self.run_backup_check)  # Check every hour
-        except tk.TclError:
-            # Window has been destroyed
-            pass
+            if os.path.exists(self.settings_path):
+                with open(self.settings_path, 'r') as f:
+                    return json.load(f)
+        except Exception as e:
+            print(f"Error loading settings: {e}")
+        return {}
 
     def setup_reminder_system(self):
         """Setup reminder system with proper thread management"""
@@ -543,23 +911,24 @@ class PremiumAirdropTracker(ctk.CTk):
         """Stop reminder system properly"""
         self.reminder_active = False
         self.reminder_stop_event.set()
+        self.reminders.scheduler.wake()
         
         # Wait for thread to finish (with timeout)
         if self.reminder_thread and self.reminder_thread.is_alive():
             self.reminder_thread.join(timeout=2.0)
 
     def reminder_check_loop(self):
-        """Continuous reminder check loop with proper thread safety"""
+        """Sleep until the next scheduled reminder and fire everything due"""
         while self.running and self.reminder_active and not self.reminder_stop_event.is_set():
             try:
-                if hasattr(self, 'df') and not self.df.empty and not self.closing_app:
+                if not self.closing_app:
                     self.check_reminders()
             except Exception as e:
                 print(f"Reminder error: {e}")
-            
-            # Use event wait instead of sleep for better responsiveness
-            if self.reminder_stop_event.wait(timeout=60):
-                break
+
+            # Wait exactly until the next due item; schedule changes and
+            # stop_reminder_system() wake the scheduler early
+            self.reminders.scheduler.wait_for_due()
 
     def create_widgets(self):
         """Create all UI widgets"""
@@ -631,22 +1000,77 @@ class PremiumAirdropTracker(ctk.CTk):
         self.main_content.pack(side="right", fill="both", expand=True, pady=10)
 
         # Create tabs
-        self.tabview = ctk.CTkTabview(self.main_content)
+        self.tabview = ctk.CTkTabview(self.main_content, command=self.on_tab_changed)
         self.tabview.pack(fill="both", expand=True)
         
         # Create tabs
-        self.dashboard_tab = self.tabview.add("📊 Dashboard")
-        self.data_tab = self.tabview.add("📋 Data")
-        self.reminder_tab = self.tabview.add("⏰ Reminders")
-        self.settings_tab = self.tabview.add("⚙️ Settings")
-        self.about_tab = self.tabview.add("ℹ️ About")
-
-        # Setup each tab
-        self.setup_dashboard_tab()
-        self.setup_data_tab()
-        self.setup_reminder_tab()
-        self.setup_settings_tab()
-        self.setup_about_tab()
+        self.dashboard_tab = self.tabview.add(self.DASHBOARD_TAB)
+        self.data_tab = self.tabview.add(self.DATA_TAB)
+        self.reminder_tab = self.tabview.add(self.REMINDER_TAB)
+        self.settings_tab = self.tabview.add(self.SETTINGS_TAB)
+        self.about_tab = self.tabview.add(self.ABOUT_TAB)
+
+        # Shared settings read outside their tab
+        self.snooze_var = ctk.StringVar(value="30")
+
+        # Tab contents are built on first visit; only the dashboard is visible at startup
+        self.tab_builders = {
+            self.DASHBOARD_TAB: self.setup_dashboard_tab,
+            self.DATA_TAB: self.setup_data_tab,
+            self.REMINDER_TAB: self.setup_reminder_tab,
+            self.SETTINGS_TAB: self.setup_settings_tab,
+            self.ABOUT_TAB: self.setup_about_tab,
+        }
+        self.built_tabs = set()
+        self.build_tab(self.DASHBOARD_TAB)
+
+    def build_tab(self, name):
+        """Build a tab's widgets the first time it is shown"""
+        if name in self.built_tabs:
+            return
+        self.built_tabs.add(name)
+        self.tab_builders[name]()
+
+    def on_tab_changed(self):
+        """Handle a click on a tab header"""
+        name = self.tabview.get()
+        self.build_tab(name)
+        if name == self.DASHBOARD_TAB:
+            self.refresh_dashboard()
+
+    def select_tab(self, name):
+        """Build the tab if needed and switch to it"""
+        self.build_tab(name)
+        self.tabview.set(name)
+        if name == self.DASHBOARD_TAB:
+            self.refresh_dashboard()
+
+    def dashboard_visible(self):
+        """Whether the dashboard tab is on screen"""
+        return (not self.is_minimized_to_tray
+                and self.DASHBOARD_TAB in self.built_tabs
+                and self.tabview.get() == self.DASHBOARD_TAB)
+
+    def mark_data_changed(self):
+        """Record a data change and refresh the dashboard only if it is showing"""
+        self.data_version += 1
+        if self.dashboard_visible() and not self.dashboard_refresh_pending:
+            # Coalesce a burst of changes into one refresh when Tk goes idle
+            self.dashboard_refresh_pending = True
+            self.after_idle(self._refresh_dashboard_idle)
+
+    def _refresh_dashboard_idle(self):
+        """Run a refresh queued by mark_data_changed"""
+        self.dashboard_refresh_pending = False
+        if self.dashboard_visible():
+            self.refresh_dashboard()
+
+    def refresh_dashboard(self):
+        """Recompute the dashboard at most once per data version"""
+        if self.DASHBOARD_TAB not in self.built_tabs or self.dashboard_version == self.data_version:
+            return
+        self.dashboard_version = self.data_version
+        self.update_dashboard()
 
     def setup_about_tab(self):
         """Setup about tab"""
@@ -698,10 +1122,10 @@ class PremiumAirdropTracker(ctk.CTk):
 
         # Stats data with corrected colors
         stats_data = [
-            ("Total Projects", len(self.df), "#4ECDC4"),
-            ("Active Projects", len(self.df[self.df['Status'] == 'Active']), "#45B7D1"),
-            ("Completed", len(self.df[self.df['Status'] == 'Completed']), "#96CEB4"),
-            ("Total Value", f"Rp {self.df['Estimated Reward'].sum():,.2f}" if not self.df.empty else "Rp 0", "#FECA57")
+            ("Total Projects", self.stats.total, "#4ECDC4"),
+            ("Active Projects", self.stats.status_counts.get('Active', 0), "#45B7D1"),
+            ("Completed", self.stats.status_counts.get('Completed', 0), "#96CEB4"),
+            ("Total Value", f"Rp {self.stats.reward_total:,.2f}" if self.stats.total else "Rp 0", "#FECA57")
         ]
 
         for i, (title, value, color) in enumerate(stats_data):
@@ -722,102 +1146,52 @@ class PremiumAirdropTracker(ctk.CTk):
         # Status distribution chart
         status_frame = ctk.CTkFrame(charts_frame)
         status_frame.grid(row=0, column=0, padx=5, pady=5, sticky="nsew")
-        self.create_status_chart(status_frame)
 
         # Progress chart
         progress_frame = ctk.CTkFrame(charts_frame)
         progress_frame.grid(row=0, column=1, padx=5, pady=5, sticky="nsew")
-        self.create_progress_chart(progress_frame)
-
-    def create_status_chart(self, parent):
-        """Create status distribution chart with efficient figure management"""
+        self.create_charts(status_frame, progress_frame)
+        self.dashboard_version = self.data_version
+
+    def import_matplotlib(self):
+        """Import matplotlib on first use and apply chart defaults"""
+        import matplotlib
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+        if not self.matplotlib_configured:
+            # Pre-load matplotlib font cache to avoid blocking
+            matplotlib.rcParams['font.family'] = 'DejaVu Sans'
+            self.matplotlib_configured = True
+        return FigureCanvasTkAgg
+
+    def create_charts(self, status_frame, progress_frame):
+        """Create the dashboard figures and embed them once"""
         try:
-            # Clear existing widgets
-            for widget in parent.winfo_children():
-                widget.destroy()
-            
-            # Create new figure and axis
-            fig, ax = plt.subplots(figsize=(5, 4))
-            
-            if not self.df.empty and 'Status' in self.df.columns:
-                status_counts = self.df['Status'].value_counts()
-                if not status_counts.empty:
-                    # Corrected colors
-                    colors = []
-                    for status in status_counts.index:
-                        if status == 'Active':
-                            colors.append('#45B7D1')  # Light blue
-                        elif status == 'Completed':
-                            colors.append('#96CEB4')  # Light green
-                        elif status == 'Monitoring':
-                            colors.append('#FFA500')  # Orange
-                        elif status == 'Dropped':
-                            colors.append('#FF6B6B')  # Red
-                        else:
-                            colors.append('#CCCCCC')  # Default
-                    
-                    ax.pie(status_counts.values, labels=status_counts.index, autopct='%1.1f%%', colors=colors)
-                    ax.set_title('Status Distribution')
-                else:
-                    ax.text(0.5, 0.5, 'No data available', ha='center', va='center')
-                    ax.set_title('Status Distribution')
-            else:
-                ax.text(0.5, 0.5, 'No data available', ha='center', va='center')
-                ax.set_title('Status Distribution')
-            
-            # Create canvas
-            canvas = FigureCanvasTkAgg(fig, parent)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill="both", expand=True)
-            
-            # Store references
-            self.status_fig = fig
-            self.status_ax = ax
-            self.status_canvas = canvas
-                
+            FigureCanvasTkAgg = self.import_matplotlib()
+            self.charts = DashboardCharts()
+
+            self.status_canvas = FigureCanvasTkAgg(self.charts.status_fig, status_frame)
+            self.status_canvas.get_tk_widget().pack(fill="both", expand=True)
+            self.progress_canvas = FigureCanvasTkAgg(self.charts.progress_fig, progress_frame)
+            self.progress_canvas.get_tk_widget().pack(fill="both", expand=True)
         except Exception as e:
             print(f"Chart error: {e}")
+            return
+        self.refresh_charts()
 
-    def create_progress_chart(self, parent):
-        """Create progress chart with efficient figure management"""
+    def refresh_charts(self):
+        """Push the current counts into the existing chart artists"""
+        if self.charts is None:
+            return
         try:
-            # Clear existing widgets
-            for widget in parent.winfo_children():
-                widget.destroy()
-                
-            # Create new figure and axis
-            fig, ax = plt.subplots(figsize=(5, 4))
-            
-            if not self.df.empty and 'Progress' in self.df.columns:
-                progress_counts = self.df['Progress'].value_counts()
-                if not progress_counts.empty:
-                    ax.bar(progress_counts.index, progress_counts.values)
-                    ax.set_title('Progress Distribution')
-                    ax.set_xlabel('Progress')
-                    ax.set_ylabel('Count')
-                    plt.xticks(rotation=45)
-                else:
-                    ax.text(0.5, 0.5, 'No data available', ha='center', va='center')
-                    ax.set_title('Progress Distribution')
-            else:
-                ax.text(0.5, 0.5, 'No data available', ha='center', va='center')
-                ax.set_title('Progress Distribution')
-            
-            # Create canvas
-            canvas = FigureCanvasTkAgg(fig, parent)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill="both", expand=True)
-            
-            # Store references
-            self.progress_fig = fig
-            self.progress_ax = ax
-            self.progress_canvas = canvas
-                
+            self.charts.update(self.stats.status_counts, self.stats.progress_counts)
         except Exception as e:
             print(f"Chart error: {e}")
 
     def setup_data_tab(self):
         """Setup data management tab"""
+        from tkcalendar import DateEntry
+
         # Input form
         form_frame = ctk.CTkFrame(self.data_tab)
         form_frame.pack(fill="x", padx=10, pady=10)
@@ -831,6 +1205,7 @@ class PremiumAirdropTracker(ctk.CTk):
             ("Progress", "option", ["0%", "25%", "50%", "75%", "100%"]),
             ("Estimated Reward (Rp)", "entry", ""),
             ("Project Link", "entry", ""),
+            ("Repeat", "combo", ["None", "Hourly", "Daily", "Weekly", "Every 12 hours", "Every 6 hours"]),
             ("Notes", "text", ""),
         ]
 
@@ -850,6 +1225,12 @@ class PremiumAirdropTracker(ctk.CTk):
                 option = ctk.CTkOptionMenu(form_frame, variable=var, values=options, width=200)
                 option.grid(row=row, column=col+1, padx=5, pady=5)
                 self.form_fields[label] = var
+            elif field_type == "combo":
+                # Editable, so rules such as "every 3 days" or "cron 0 9 * * 1-5" can be typed
+                combo = ctk.CTkComboBox(form_frame, values=options, width=200)
+                combo.set(options[0])
+                combo.grid(row=row, column=col+1, padx=5, pady=5)
+                self.form_fields[label] = combo
             elif field_type == "date":
                 date_entry = DateEntry(form_frame, width=18, background='darkblue',
                                      foreground='white', borderwidth=2, date_pattern='y-mm-dd')
@@ -886,7 +1267,7 @@ class PremiumAirdropTracker(ctk.CTk):
 
         # Buttons
         btn_frame = ctk.CTkFrame(form_frame)
-        btn_frame.grid(row=4, column=0, columnspan=4, pady=10)
+        btn_frame.grid(row=5, column=0, columnspan=4, pady=10)
 
         self.add_btn = ctk.CTkButton(btn_frame, text="Add Project", command=self.add_project)
         self.add_btn.pack(side="left", padx=5)
@@ -906,6 +1287,7 @@ class PremiumAirdropTracker(ctk.CTk):
 
         columns = ["ID", "Project", "Status", "Due DateTime", "Progress", "Reward", "Link", "Notes"]
         self.tree = ttk.Treeview(table_frame, columns=columns, show="headings", height=15)
+        self.tree_rows = {}  # Displayed values by item id (project id)
         
         # Set column widths
         self.tree.column("ID", width=50)
@@ -929,6 +1311,20 @@ class PremiumAirdropTracker(ctk.CTk):
         # Bind selection
         self.tree.bind("<<TreeviewSelect>>", self.on_tree_select)
 
+        # Paging controls, shown only for large portfolios
+        self.table_page = 0
+        self.table_page_size = 200
+        self.paging_threshold = 1000
+        self.page_frame = ctk.CTkFrame(self.data_tab, fg_color="transparent")
+        ctk.CTkButton(self.page_frame, text="◀ Prev", width=80,
+                     command=lambda: self.change_table_page(-1)).pack(side="left", padx=5)
+        self.page_label = ctk.CTkLabel(self.page_frame, text="")
+        self.page_label.pack(side="left", padx=10)
+        ctk.CTkButton(self.page_frame, text="Next ▶", width=80,
+                     command=lambda: self.change_table_page(1)).pack(side="left", padx=5)
+
+        self.update_table()
+
     def setup_reminder_tab(self):
         """Setup reminder settings tab"""
         reminder_frame = ctk.CTkFrame(self.reminder_tab)
@@ -950,7 +1346,6 @@ class PremiumAirdropTracker(ctk.CTk):
         # Snooze options
         ctk.CTkLabel(reminder_frame, text="Snooze Duration (minutes):").pack(pady=(20, 5))
         
-        self.snooze_var = ctk.StringVar(value="30")
         snooze_options = ["15", "30", "60", "120", "240"]
         snooze_dropdown = ctk.CTkOptionMenu(reminder_frame, variable=self.snooze_var, values=snooze_options)
         snooze_dropdown.pack(pady=5)
@@ -1022,6 +1417,10 @@ class PremiumAirdropTracker(ctk.CTk):
                      command=self.export_csv).pack(side="left", padx=5)
         ctk.CTkButton(export_frame, text="Export to PDF", 
                      command=self.export_pdf).pack(side="left", padx=5)
+
+        # Running exports, one row each with a progress bar and Cancel
+        self.export_jobs_frame = ctk.CTkFrame(settings_scroll, fg_color="transparent")
+        self.export_jobs_frame.pack(fill="x", padx=20)
         
         # Import options
         ctk.CTkLabel(settings_scroll, text="Import Options").pack(pady=(20, 5))
@@ -1033,6 +1432,18 @@ class PremiumAirdropTracker(ctk.CTk):
                      command=self.import_excel).pack(side="left", padx=5)
         ctk.CTkButton(import_frame, text="Import from CSV", 
                      command=self.import_csv).pack(side="left", padx=5)
+        self.import_merge_var = ctk.BooleanVar(value=False)
+        ctk.CTkSwitch(settings_scroll, text="Merge into existing projects",
+                     variable=self.import_merge_var).pack(pady=5)
+
+        # Periodic jobs
+        ctk.CTkLabel(settings_scroll, text="Background Jobs").pack(pady=(20, 5))
+        self.task_status_label = ctk.CTkLabel(settings_scroll, text="", justify="left",
+                                            font=ctk.CTkFont(family="Courier", size=12))
+        self.task_status_label.pack(pady=5)
+        ctk.CTkButton(settings_scroll, text="Refresh",
+                     command=self.refresh_task_status).pack(pady=5)
+        self.refresh_task_status()
 
         # Window options
         ctk.CTkLabel(settings_scroll, text="Window Options", 
@@ -1057,6 +1468,12 @@ class PremiumAirdropTracker(ctk.CTk):
                 messagebox.showwarning("Warning", "Project Name is required!")
                 return
 
+            try:
+                recurrence = self.get_form_recurrence()
+            except ValueError as e:
+                messagebox.showwarning("Warning", str(e))
+                return
+
             # Get time from time fields
             hour_var, minute_var = self.form_fields['Due Time']
             due_time = f"{hour_var.get()}:{minute_var.get()}"
@@ -1070,20 +1487,31 @@ class PremiumAirdropTracker(ctk.CTk):
                 'Estimated Reward': float(self.form_fields['Estimated Reward (Rp)'].get() or 0),
                 'Project Link': self.form_fields['Project Link'].get().strip(),
                 'Notes': self.form_fields['Notes'].get("1.0", "end-1c").strip(),
+                'Recurrence': recurrence,
                 'Reminder Enabled': True  # Default to enabled
             }
 
+            # Save to the store first to get the project id
+            row_id = self.save_data('add', values=project_data)
+            if row_id is None:
+                return
+
             # Add to DataFrame with thread safety
             with self.data_lock:
+                new_row = pd.DataFrame([project_data], index=[row_id])
+                new_row['Due'] = ProjectStore.parse_due(new_row['Due Date'], new_row['Due Time'])
                 if self.df.empty:
-                    self.df = pd.DataFrame([project_data])
+                    self.df = new_row
                 else:
-                    self.df = pd.concat([self.df, pd.DataFrame([project_data])], ignore_index=True)
+                    self.df = pd.concat([self.df, new_row])
+                self.stats.add(project_data)
+            self.reminders.reschedule(row_id)
 
-            # Save and update
-            self.save_data()
+            # Update UI, showing the page that holds the new project
+            if self.DATA_TAB in self.built_tabs:
+                self.table_page = (len(self.df) - 1) // self.table_page_size
             self.update_table()
-            self.update_dashboard()
+            self.mark_data_changed()
             self.clear_form()
             self.update_project_dropdown()
 
@@ -1102,7 +1530,7 @@ class PremiumAirdropTracker(ctk.CTk):
             return
 
         try:
-            index = self.tree.index(selected[0])
+            index = int(selected[0])
             
             # Get form data
             project_name = self.form_fields['Project Name'].get().strip()
@@ -1110,30 +1538,41 @@ class PremiumAirdropTracker(ctk.CTk):
                 messagebox.showwarning("Warning", "Project Name is required!")
                 return
 
+            try:
+                recurrence = self.get_form_recurrence()
+            except ValueError as e:
+                messagebox.showwarning("Warning", str(e))
+                return
+
             # Get time from time fields
             hour_var, minute_var = self.form_fields['Due Time']
             due_time = f"{hour_var.get()}:{minute_var.get()}"
 
+            updated_values = {
+                'Project Name': project_name,
+                'Status': self.form_fields['Status'].get(),
+                'Due Date': self.form_fields['Due Date'].get_date().strftime('%Y-%m-%d'),
+                'Due Time': due_time,
+                'Progress': self.form_fields['Progress'].get(),
+                'Estimated Reward': float(self.form_fields['Estimated Reward (Rp)'].get() or 0),
+                'Project Link': self.form_fields['Project Link'].get().strip(),
+                'Notes': self.form_fields['Notes'].get("1.0", "end-1c").strip(),
+                'Recurrence': recurrence
+            }
+
             # Update the DataFrame row with thread safety
             with self.data_lock:
-                self.df.at[index, 'Project Name'] = project_name
-                self.df.at[index, 'Status'] = self.form_fields['Status'].get()
-                self.df.at[index, 'Due Date'] = self.form_fields['Due Date'].get_date().strftime('%Y-%m-%d')
-                self.df.at[index, 'Due Time'] = due_time
-                self.df.at[index, 'Progress'] = self.form_fields['Progress'].get()
-                self.df.at[index, 'Estimated Reward'] = float(self.form_fields['Estimated Reward (Rp)'].get() or 0)
-                self.df.at[index, 'Project Link'] = self.form_fields['Project Link'].get().strip()
-                self.df.at[index, 'Notes'] = self.form_fields['Notes'].get("1.0", "end-1c").strip()
-
-            # Remove from shown reminders if due date/time changed
-            project_id = f"{project_name}_{self.df.at[index, 'Due Date']}_{self.df.at[index, 'Due Time']}"
-            if project_id in self.shown_reminders:
-                self.shown_reminders.remove(project_id)
+                self.stats.replace(self.df.loc[index], updated_values)
+                for col, value in updated_values.items():
+                    self.df.at[index, col] = value
+                self.df.at[index, 'Due'] = ProjectStore.parse_due(
+                    self.df.loc[[index], 'Due Date'], self.df.loc[[index], 'Due Time']).iloc[0]
 
             # Save and update
-            self.save_data()
+            self.save_data('update', index, updated_values)
+            self.reminders.reschedule(index)
             self.update_table()
-            self.update_dashboard()
+            self.mark_data_changed()
             self.clear_form()
             self.update_project_dropdown()
 
@@ -1144,6 +1583,17 @@ class PremiumAirdropTracker(ctk.CTk):
         except Exception as e:
             messagebox.showerror("Error", f"Failed to update project: {str(e)}")
 
+    def get_form_recurrence(self):
+        """Repeat rule from the form; raises ValueError if it can't be understood"""
+        text = self.form_fields['Repeat'].get().strip()
+        try:
+            if RecurrenceRule.parse(text) is None:
+                return ''
+        except ValueError:
+            raise ValueError(f"Unknown repeat rule '{text}'. Use Hourly, Daily, Weekly, "
+                             "'every 6 hours' or 'cron MIN HOUR DAY MONTH WEEKDAY'.")
+        return text
+
     def clear_form(self):
         """Clear all form fields"""
         for field_name, field in self.form_fields.items():
@@ -1157,6 +1607,8 @@ class PremiumAirdropTracker(ctk.CTk):
                     field.set("0%")
                 else:
                     field.set("")
+            elif isinstance(field, ctk.CTkComboBox):
+                field.set("None")
             elif isinstance(field, tuple):  # Time field
                 hour_var, minute_var = field
                 hour_var.set("09")
@@ -1176,28 +1628,25 @@ class PremiumAirdropTracker(ctk.CTk):
         """Handle treeview selection"""
         selected = self.tree.selection()
         if selected:
-            index = self.tree.index(selected[0])
+            index = int(selected[0])
             self.editing_index = index
             
             # Enable update button
             self.update_btn.configure(state="normal")
             
             # Populate form with selected data
-            row = self.df.iloc[index]
+            row = self.df.loc[index]
             
             self.form_fields['Project Name'].delete(0, 'end')
             self.form_fields['Project Name'].insert(0, row.get('Project Name', ''))
             
             self.form_fields['Status'].set(row.get('Status', 'Active'))
             
-            due_date = row.get('Due Date', '')
-            if due_date:
-                try:
-                    if isinstance(due_date, str):
-                        due_date = datetime.strptime(due_date, '%Y-%m-%d')
-                    self.form_fields['Due Date'].set_date(due_date)
-                except:
-                    self.form_fields['Due Date'].set_date(datetime.now())
+            due = row.get('Due')
+            if pd.notna(due):
+                self.form_fields['Due Date'].set_date(due.date())
+            elif row.get('Due Date', ''):
+                self.form_fields['Due Date'].set_date(datetime.now())
             
             # Set time fields
             due_time = row.get('Due Time', '09:00')
@@ -1215,6 +1664,8 @@ class PremiumAirdropTracker(ctk.CTk):
             self.form_fields['Project Link'].delete(0, 'end')
             self.form_fields['Project Link'].insert(0, row.get('Project Link', ''))
             
+            self.form_fields['Repeat'].set(row.get('Recurrence', '') or "None")
+
             self.form_fields['Notes'].delete("1.0", "end")
             self.form_fields['Notes'].insert("1.0", row.get('Notes', ''))
 
@@ -1227,28 +1678,22 @@ class PremiumAirdropTracker(ctk.CTk):
 
         if messagebox.askyesno("Confirm", "Are you sure you want to delete the selected project?"):
             try:
-                # Get selected index
-                selected_index = self.tree.index(selected[0])
-                project_name = self.df.at[selected_index, 'Project Name']
-                due_date = self.df.at[selected_index, 'Due Date']
-                due_time = self.df.at[selected_index, 'Due Time']
-                
-                # Remove from shown reminders
-                project_id = f"{project_name}_{due_date}_{due_time}"
-                if project_id in self.shown_reminders:
-                    self.shown_reminders.remove(project_id)
+                # Get selected project id
+                selected_index = int(selected[0])
                 
-                # Remove from snoozed projects
-                if project_id in self.snoozed_projects:
-                    del self.snoozed_projects[project_id]
+                # Remove its reminder state
+                if self.reminders.ledger.forget(selected_index):
+                    self.save_reminder_ledger()
                 
                 # Delete with thread safety
                 with self.data_lock:
-                    self.df = self.df.drop(selected_index).reset_index(drop=True)
+                    self.stats.remove(self.df.loc[selected_index])
+                    self.df = self.df.drop(selected_index)
                 
-                self.save_data()
+                self.save_data('delete', selected_index)
+                self.reminders.scheduler.remove(selected_index)
                 self.update_table()
-                self.update_dashboard()
+                self.mark_data_changed()
                 self.clear_form()
                 self.update_project_dropdown()
                 messagebox.showinfo("Success", "Project deleted successfully!")
@@ -1256,56 +1701,96 @@ class PremiumAirdropTracker(ctk.CTk):
                 messagebox.showerror("Error", f"Failed to delete project: {str(e)}")
 
     def update_table(self):
-        """Update data table with combined date and time"""
-        # Clear existing data
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # Add new data with combined date/time
-        for index, row in self.df.iterrows():
-            reward_value = row.get('Estimated Reward', 0)
-            if pd.notna(reward_value):
-                reward_str = f"Rp {reward_value:,.2f}"
-            else:
-                reward_str = "Rp 0"
-                
-            # Combine date and time
-            due_date = row.get('Due Date', '')
-            due_time = row.get('Due Time', '')
-            due_datetime = f"{due_date} {due_time}" if due_date and due_time else ''
+        """Update data table, touching only rows that were added, changed or removed"""
+        if self.DATA_TAB not in self.built_tabs:
+            return
+
+        # Item ids are project ids, so unchanged rows (and the selection) are left alone
+        first_visible = self.tree.yview()[0]
+
+        # Large portfolios are paged so only one page of rows exists in the tree
+        total = len(self.df)
+        if total > self.paging_threshold:
+            page_count = (total + self.table_page_size - 1) // self.table_page_size
+            self.table_page = max(0, min(self.table_page, page_count - 1))
+            start = self.table_page * self.table_page_size
+            visible = self.df.iloc[start:start + self.table_page_size]
+            self.page_label.configure(text=f"Page {self.table_page + 1} of {page_count} ({total:,} projects)")
+            if not self.page_frame.winfo_manager():
+                self.page_frame.pack(side="bottom", pady=(0, 10))
+        else:
+            self.table_page = 0
+            visible = self.df
+            if self.page_frame.winfo_manager():
+                self.page_frame.pack_forget()
+
+        new_rows = {}
+        for index, row in zip(visible.index, visible.to_dict('records')):
+            new_rows[str(index)] = self.format_table_row(index, row)
+
+        removed = [iid for iid in self.tree_rows if iid not in new_rows]
+        if removed:
+            self.tree.delete(*removed)
+
+        for position, (iid, values) in enumerate(new_rows.items()):
+            old_values = self.tree_rows.get(iid)
+            if old_values is None:
+                self.tree.insert("", position, iid=iid, values=values)
+            elif old_values != values:
+                self.tree.item(iid, values=values)
+
+        self.tree_rows = new_rows
+        self.tree.yview_moveto(first_visible)
+
+    def change_table_page(self, step):
+        """Show the previous or next page of the data table"""
+        self.table_page += step
+        self.update_table()
+        self.tree.yview_moveto(0)
+
+    def format_table_row(self, index, row):
+        """Format a project as table values with combined date and time"""
+        reward_value = row.get('Estimated Reward', 0)
+        if pd.notna(reward_value):
+            reward_str = f"Rp {reward_value:,.2f}"
+        else:
+            reward_str = "Rp 0"
             
-            # Add day name if date is available
-            if due_date:
-                try:
-                    date_obj = datetime.strptime(due_date, '%Y-%m-%d')
-                    day_name = date_obj.strftime('%A')
-                    due_datetime = f"{due_datetime} ({day_name})"
-                except:
-                    pass
-                    
-            # Shorten notes for display
-            notes = row.get('Notes', '')
-            if len(notes) > 50:
-                notes = notes[:47] + "..."
+        # Combine date and time
+        due_date = row.get('Due Date', '')
+        due_time = row.get('Due Time', '')
+        due_datetime = f"{due_date} {due_time}" if due_date and due_time else ''
+        
+        # Add day name if date is available
+        due = row.get('Due')
+        if pd.notna(due):
+            due_datetime = f"{due_datetime} ({due.strftime('%A')})"
+        if row.get('Recurrence'):
+            due_datetime = f"{due_datetime} ↻ {row['Recurrence']}"
                 
-            self.tree.insert("", "end", values=(
-                index + 1,
-                row.get('Project Name', ''),
-                row.get('Status', ''),
-                due_datetime,
-                row.get('Progress', ''),
-                reward_str,
-                row.get('Project Link', ''),
-                notes
-            ))
+        # Shorten notes for display
+        notes = row.get('Notes', '')
+        if len(notes) > 50:
+            notes = notes[:47] + "..."
+            
+        return (
+            index,
+            row.get('Project Name', ''),
+            row.get('Status', ''),
+            due_datetime,
+            row.get('Progress', ''),
+            reward_str,
+            row.get('Project Link', ''),
+            notes
+        )
 
     def update_dashboard(self):
         """Update dashboard statistics and charts"""
         # Update stats
-        total_projects = len(self.df)
-        active_projects = len(self.df[self.df['Status'] == 'Active']) if not self.df.empty else 0
-        completed_projects = len(self.df[self.df['Status'] == 'Completed']) if not self.df.empty else 0
-        total_value = self.df['Estimated Reward'].sum() if not self.df.empty else 0
+        total_projects = self.stats.total
+        active_projects = self.stats.status_counts.get('Active', 0)
+        completed_projects = self.stats.status_counts.get('Completed', 0)
+        total_value = self.stats.reward_total
 
         # Find the stats frame and update labels
         stats_frame = self.dashboard_tab.winfo_children()[0]
@@ -1320,71 +1805,19 @@ class PremiumAirdropTracker(ctk.CTk):
             value_label = stat_frame.winfo_children()[1]
             value_label.configure(text=str(value))
 
-        # Update charts - get the chart frames
-        charts_frame = self.dashboard_tab.winfo_children()[1]
-        status_frame = charts_frame.grid_slaves(row=0, column=0)[0]
-        progress_frame = charts_frame.grid_slaves(row=0, column=1)[0]
-        
-        self.create_status_chart(status_frame)
-        self.create_progress_chart(progress_frame)
+        # Update charts in place
+        self.refresh_charts()
 
     def check_reminders(self):
-        """Check for due reminders, considering snoozed projects with thread safety"""
-        if not self.reminder_active or self.df.empty or self.closing_app:
+        """Fire reminders for every project whose scheduled time has passed"""
+        if not self.reminder_active or self.closing_app:
             return
 
         try:
-            now = datetime.now()
-            for index, project in self.df.iterrows():
-                # Check if reminder is enabled for this project
-                if not project.get('Reminder Enabled', True):
-                    continue
-                    
-                # Create project identifier
-                project_name = project.get('Project Name', '')
-                due_date = project.get('Due Date', '')
-                due_time = project.get('Due Time', '')
-                project_id = f"{project_name}_{due_date}_{due_time}"
-                
-                # Check if project is snoozed
-                if project_id in self.snoozed_projects:
-                    if now < self.snoozed_projects[project_id]:
-                        continue  # Still snoozed
-                    else:
-                        # Snooze time expired, remove from snoozed list
-                        del self.snoozed_projects[project_id]
-                        
-                if project.get('Status') == 'Active' and project.get('Due Date') and project.get('Due Time'):
-                    try:
-                        due_date_str = project['Due Date']
-                        due_time_str = project['Due Time']
-                        
-                        # Handle different date formats
-                        if isinstance(due_date_str, datetime):
-                            due_date = due_date_str
-                        else:
-                            due_date = datetime.strptime(due_date_str, "%Y-%m-%d")
-                        
-                        # Parse time
-                        due_time = datetime.strptime(due_time_str, "%H:%M").time()
-                        
-                        # Combine date and time
-                        due_datetime = datetime.combine(due_date, due_time)
-                        
-                        # Check if due time has passed and not yet notified
-                        reminder_id = f"{project['Project Name']}_{project['Due Date']}_{project['Due Time']}"
-                        
-                        # Show reminder if due time has passed
-                        if now >= due_datetime and reminder_id not in self.shown_reminders:
-                            # Use thread-safe method to show reminder
-                            if not self.closing_app and self.running:
-                                self.show_reminder_thread_safe(project)
-                                self.shown_reminders.add(reminder_id)
-                                
-                    except (ValueError, TypeError) as e:
-                        print(f"Error parsing date/time for project {project.get('Project Name', 'Unknown')}: {e}")
-                        continue
-                        
+            for project in self.reminders.take_due(datetime.now()):
+                if not self.closing_app and self.running:
+                    self.show_reminder_thread_safe(project)
+
         except Exception as e:
             print(f"Reminder check error: {e}")
 
@@ -1392,8 +1825,8 @@ class PremiumAirdropTracker(ctk.CTk):
         """Thread-safe method to show reminder"""
         if self.running and not self.closing_app:
             try:
-                # Schedule the reminder to be shown in the main thread
-                self.after_idle(self._show_reminder_window, project)
+                # Schedule the reminder to be queued in the main thread
+                self.after_idle(self.queue_reminder, project)
             except (tk.TclError, RuntimeError):
                 # Main thread might not be available
                 print("Cannot show reminder: main thread not available")
@@ -1402,238 +1835,333 @@ class PremiumAirdropTracker(ctk.CTk):
         """Show reminder notification as a popup window - legacy method"""
         self.show_reminder_thread_safe(project)
 
-    def _show_reminder_window(self, project):
-        """Actually show the reminder window (runs in main thread)"""
-        if not self.running or self.closing_app or (self.reminder_window is not None and self.reminder_window.winfo_exists()):
+    def queue_reminder(self, project):
+        """Collect a due reminder for the next digest (runs in main thread)"""
+        if not self.running or self.closing_app:
             return
-            
+        self.pending_reminders.append(project)
+        if self.digest_after_id is None:
+            # Everything else that comes due before this fires joins the same digest
+            self.digest_after_id = self.after(self.DIGEST_DELAY_MS, self.show_reminder_digest)
+
+    def show_reminder_digest(self):
+        """Show all queued reminders in one window with a single sound"""
+        self.digest_after_id = None
+        if not self.running or self.closing_app or not self.pending_reminders:
+            return
+
         try:
-            # Create a top-level window for the reminder
-            self.reminder_window = ctk.CTkToplevel(self)
-            self.reminder_window.title("⏰ Airdrop Reminder")
-            self.reminder_window.geometry("400x200")
-            self.reminder_window.resizable(False, False)
-            self.reminder_window.transient(self)
+            if self.reminder_window is None or not self.reminder_window.winfo_exists():
+                self.create_reminder_window()
+            while self.pending_reminders:
+                self.add_digest_item(self.pending_reminders.popleft())
+            self.update_digest_title()
+
             self.reminder_window.lift()
-            self.reminder_window.attributes('-topmost', True)
-            
-            # Center the reminder window
-            self.reminder_window.update_idletasks()
-            x = self.winfo_x() + (self.winfo_width() - self.reminder_window.winfo_width()) // 2
-            y = self.winfo_y() + (self.winfo_height() - self.reminder_window.winfo_height()) // 2
-            self.reminder_window.geometry(f"+{x}+{y}")
-            
-            # Reminder content
-            title_label = ctk.CTkLabel(self.reminder_window, text="⏰ Airdrop Reminder", 
-                                     font=ctk.CTkFont(size=16, weight="bold"))
-            title_label.pack(pady=10)
-            
-            message = f"Project: {project.get('Project Name', 'Unknown')}\nDue: {project.get('Due Date', '')} {project.get('Due Time', '')}"
-            message_label = ctk.CTkLabel(self.reminder_window, text=message, 
-                                       font=ctk.CTkFont(size=14))
-            message_label.pack(pady=10)
-            
-            # Button frame
-            button_frame = ctk.CTkFrame(self.reminder_window)
-            button_frame.pack(pady=20)
-            
-            # Snooze button
-            snooze_btn = ctk.CTkButton(button_frame, text=f"Snooze ({self.snooze_var.get()}m)", 
-                                     command=lambda: self.snooze_reminder(project))
-            snooze_btn.pack(side="left", padx=10)
-            
-            # Dismiss button
-            dismiss_btn = ctk.CTkButton(button_frame, text="Dismiss", 
-                                      command=self.dismiss_reminder)
-            dismiss_btn.pack(side="left", padx=10)
-            
-            # Play sound
-            try:
-                winsound.Beep(1000, 500)
-            except:
-                pass
-            
-            # Set focus to the reminder window
             self.reminder_window.focus_set()
-            self.reminder_window.grab_set()
-            
+            self.play_reminder_sound()
         except Exception as e:
             print(f"Error showing reminder window: {e}")
 
-    def snooze_reminder(self, project):
-        """Snooze the reminder for the specified duration"""
-        if self.reminder_window:
-            self.reminder_window.destroy()
-            self.reminder_window = None
-            
+    def create_reminder_window(self):
+        """Create the reminder digest window"""
+        self.reminder_window = ctk.CTkToplevel(self)
+        self.reminder_window.title("⏰ Airdrop Reminder")
+        self.reminder_window.geometry("460x360")
+        self.reminder_window.transient(self)
+        self.reminder_window.lift()
+        self.reminder_window.attributes('-topmost', True)
+        self.reminder_window.protocol("WM_DELETE_WINDOW", self.dismiss_all_reminders)
+
+        # Center the reminder window
+        self.reminder_window.update_idletasks()
+        x = self.winfo_x() + (self.winfo_width() - self.reminder_window.winfo_width()) // 2
+        y = self.winfo_y() + (self.winfo_height() - self.reminder_window.winfo_height()) // 2
+        self.reminder_window.geometry(f"+{x}+{y}")
+
+        self.digest_title = ctk.CTkLabel(self.reminder_window, text="⏰ Airdrop Reminder",
+                                         font=ctk.CTkFont(size=16, weight="bold"))
+        self.digest_title.pack(pady=10)
+
+        # Buttons for the whole list
+        button_frame = ctk.CTkFrame(self.reminder_window)
+        button_frame.pack(side="bottom", pady=10)
+        ctk.CTkButton(button_frame, text=f"Snooze All ({self.snooze_var.get()}m)",
+                      command=self.snooze_all_reminders).pack(side="left", padx=10)
+        ctk.CTkButton(button_frame, text="Dismiss All",
+                      command=self.dismiss_all_reminders).pack(side="left", padx=10)
+
+        self.digest_list = ctk.CTkScrollableFrame(self.reminder_window)
+        self.digest_list.pack(fill="both", expand=True, padx=10)
+        self.digest_rows = {}
+        self.digest_projects = {}
+
+    def add_digest_item(self, project):
+        """Add one reminder to the digest with its own snooze and dismiss buttons"""
+        # Stored projects are keyed by id; the test reminder gets a key of its own
+        key = getattr(project, 'name', None)
+        if key is None:
+            self.digest_counter += 1
+            key = f"test_{self.digest_counter}"
+        if key in self.digest_rows:
+            return
+
+        row = ctk.CTkFrame(self.digest_list)
+        row.pack(fill="x", pady=3)
+        message = f"{project.get('Project Name', 'Unknown')}\nDue: {project.get('Due Date', '')} {project.get('Due Time', '')}"
+        ctk.CTkLabel(row, text=message, justify="left", anchor="w").pack(side="left", padx=10, pady=5)
+        ctk.CTkButton(row, text="Dismiss", width=70,
+                      command=lambda: self.dismiss_reminder(key)).pack(side="right", padx=5)
+        ctk.CTkButton(row, text=f"Snooze ({self.snooze_var.get()}m)", width=90,
+                      command=lambda: self.snooze_reminder(key)).pack(side="right", padx=5)
+        self.digest_rows[key] = row
+        self.digest_projects[key] = project
+
+        # Remember it was shown so a restart does not fire it again
+        self.reminders.record(project, ReminderLedger.FIRED)
+
+    def update_digest_title(self):
+        """Show how many reminders the digest holds"""
+        count = len(self.digest_rows)
+        text = "⏰ Airdrop Reminder" if count == 1 else f"⏰ {count} Airdrop Reminders"
+        self.digest_title.configure(text=text)
+
+    def play_reminder_sound(self):
+        """Play one notification sound without blocking the UI"""
+        try:
+            # Windows only; elsewhere the reminder is silent
+            import winsound
+            winsound.PlaySound("SystemExclamation", winsound.SND_ALIAS | winsound.SND_ASYNC)
+        except:
+            pass
+
+    def remove_digest_item(self, key):
+        """Take a reminder off the digest, closing the window when it is empty"""
+        row = self.digest_rows.pop(key, None)
+        if row is not None:
+            row.destroy()
+        project = self.digest_projects.pop(key, None)
+        if not self.digest_rows:
+            self.close_reminder_window()
+        else:
+            self.update_digest_title()
+        return project
+
+    def snooze_reminder(self, key):
+        """Snooze one reminder for the specified duration"""
+        project = self.remove_digest_item(key)
+        if project is None:
+            return
+
         # Calculate when to show the reminder again
         snooze_minutes = int(self.snooze_var.get())
         snooze_until = datetime.now() + timedelta(minutes=snooze_minutes)
-        
-        # Create a unique identifier for the project
-        project_name = project.get('Project Name', '')
-        due_date = project.get('Due Date', '')
-        due_time = project.get('Due Time', '')
-        project_id = f"{project_name}_{due_date}_{due_time}"
-        
-        # Store snooze time
-        self.snoozed_projects[project_id] = snooze_until
-        self.save_snooze_data()
-        
-        messagebox.showinfo("Snoozed", f"Reminder snoozed for {snooze_minutes} minutes.")
 
-    def dismiss_reminder(self):
-        """Dismiss the current reminder"""
+        # Store snooze time and fire again once it runs out
+        row_id = self.reminders.record(project, ReminderLedger.SNOOZED, snooze_until)
+        if row_id is not None:
+            self.reminders.scheduler.schedule(row_id, snooze_until)
+
+    def dismiss_reminder(self, key):
+        """Dismiss one reminder"""
+        project = self.remove_digest_item(key)
+        if project is not None:
+            self.reminders.record(project, ReminderLedger.ACKNOWLEDGED)
+
+    def snooze_all_reminders(self):
+        """Snooze every reminder in the digest"""
+        for key in list(self.digest_rows):
+            self.snooze_reminder(key)
+
+    def dismiss_all_reminders(self):
+        """Dismiss every reminder in the digest"""
+        for key in list(self.digest_rows):
+            self.dismiss_reminder(key)
+        self.close_reminder_window()
+
+    def close_reminder_window(self):
+        """Close the reminder digest window"""
         if self.reminder_window:
             self.reminder_window.destroy()
             self.reminder_window = None
+        self.digest_rows = {}
+        self.digest_projects = {}
 
-    def save_data(self):
-        """Save data to Excel with color coding"""
+    def save_data(self, op=None, row_id=None, values=None):
+        """Queue a change (one row, or a batch) for the writer thread, or a refresh of the Excel copy"""
         try:
-            # Use thread-safe lock for data access
-            with self.data_lock:
-                # Create a new workbook
-                wb = Workbook()
-                ws = wb.active
-                ws.title = "Airdrop Data"
-                
-                # Write headers (exclude Reminder Enabled column)
-                headers = [col for col in self.df.columns if col != 'Reminder Enabled']
-                for col_idx, header in enumerate(headers, 1):
-                    cell = ws.cell(row=1, column=col_idx, value=header)
-                    cell.font = Font(bold=True)
-                
-                # Define color fills for different statuses
-                status_colors = {
-                    'Active': PatternFill(start_color='4FC3F7', end_color='4FC3F7', fill_type='solid'),
-                    'Completed': PatternFill(start_color='81C784', end_color='81C784', fill_type='solid'),
-                    'Monitoring': PatternFill(start_color='FFA500', end_color='FFA500', fill_type='solid'),
-                    'Dropped': PatternFill(start_color='E57373', end_color='E57373', fill_type='solid')
-                }
-                
-                # Write data with color coding (exclude Reminder Enabled column)
-                for r_idx, row in self.df.iterrows():
-                    for c_idx, col in enumerate(headers, 1):
-                        value = row[col]
-                        cell = ws.cell(row=r_idx+2, column=c_idx, value=value)
-                        
-                        # Apply color based on status
-                        if col == 'Status' and value in status_colors:
-                            cell.fill = status_colors[value]
-                
-                # Auto-adjust column widths
-                for column in ws.columns:
-                    max_length = 0
-                    column_letter = column[0].column_letter
-                    for cell in column:
-                        try:
-                            if len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except:
-                            pass
-                    adjusted_width = min(max_length + 2, 50)
-                    ws.column_dimensions[column_letter].width = adjusted_width
-                
-                # Save the workbook
-                wb.save(self.data_file_path)
-            
+            if op is None:
+                # No single change to record - export the Excel copy now
+                self.export_data_file()
+                return None
+
+            if op == 'add':
+                row_id = self.store.allocate_id()
+            if op in ('replace_all', 'batch'):
+                values = values.copy()
+            elif values is not None:
+                values = dict(values)
+
+            self.writer.submit('change', op, row_id, values)
+            self.unexported_changes += 1
+            if self.unexported_changes >= self.export_threshold:
+                self.export_data_file()
+            return row_id
+
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save data: {str(e)}")
+            return None
 
-    def save_snooze_data(self):
-        """Save snooze data to file"""
-        try:
-            snooze_data = {}
-            for project_id, snooze_until in self.snoozed_projects.items():
-                snooze_data[project_id] = snooze_until.isoformat()
-            
-            with open(self.snooze_file, 'w') as f:
-                json.dump(snooze_data, f)
-        except Exception as e:
-            print(f"Error saving snooze data: {e}")
+    def report_save_error(self, message):
+        """Show a save error from the writer thread"""
+        self.after_idle(messagebox.showerror, "Error", message)
+
+    def export_data_file(self):
+        """Queue a snapshot for the Excel compatibility copy"""
+        with self.data_lock:
+            snapshot = self.df.copy()
+            self.unexported_changes = 0
+        self.writer.submit('export', snapshot)
+
+    def write_workbook(self, df, file_path):
+        """Write data to Excel with color coding"""
+        WorkbookWriter.write(df, file_path)
 
-    def load_snooze_data(self):
-        """Load snooze data from file"""
+    def save_reminder_ledger(self):
+        """Save reminder state to file"""
         try:
-            if os.path.exists(self.snooze_file):
-                with open(self.snooze_file, 'r') as f:
-                    snooze_data = json.load(f)
-                
-                for project_id, snooze_until_str in snooze_data.items():
-                    self.snoozed_projects[project_id] = datetime.fromisoformat(snooze_until_str)
+            # The writer saves a burst of reminder updates once, merged with the daemon's
+            self.writer.submit('ledger', self.ledger_file, self.reminders.ledger)
         except Exception as e:
-            print(f"Error loading snooze data: {e}")
+            print(f"Error saving reminder ledger: {e}")
 
     def load_data(self):
-        """Load data from Excel with thread safety and error handling"""
+        """Load data from the project store, migrating the Excel file on first run"""
         try:
             with self.data_lock:
-                if os.path.exists(self.data_file_path):
-                    df = pd.read_excel(self.data_file_path)
-                    # Ensure all required columns exist
-                    required_columns = ['Project Name', 'Status', 'Due Date', 'Due Time', 
-                                      'Progress', 'Estimated Reward', 'Project Link', 'Notes', 'Reminder Enabled']
-                    
-                    for col in required_columns:
-                        if col not in df.columns:
-                            if col == 'Reminder Enabled':
-                                df[col] = True
-                            else:
-                                df[col] = '' if col != 'Estimated Reward' else 0.0
-                    
-                    # Handle NaN values
-                    df = df.fillna('')
-                    
-                    # Convert numpy.bool_ to Python bool for Reminder Enabled column
-                    if 'Reminder Enabled' in df.columns:
-                        df['Reminder Enabled'] = df['Reminder Enabled'].apply(lambda x: bool(x) if pd.notna(x) else True)
-                    
-                    return df
-                else:
-                    return pd.DataFrame(columns=[
-                        'Project Name', 'Status', 'Due Date', 'Due Time',
-                        'Progress', 'Estimated Reward', 'Project Link', 'Notes', 'Reminder Enabled'
-                    ])
+                self.store = ProjectStore(self.db_path)
+                if not self.store.get_meta('xlsx_migrated'):
+                    if os.path.exists(self.data_file_path):
+                        self.store.replace_all(self.read_data_file(self.data_file_path))
+                    self.store.set_meta('xlsx_migrated', '1')
+                return self.frame_cache.load(self.db_path, lambda _: self.store.load_frame())
         except Exception as e:
             print(f"Load error: {e}")
-            # Create backup of corrupted file
-            if os.path.exists(self.data_file_path):
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            return self.recover_data()
+
+    def recover_data(self):
+        """Rebuild a corrupted store from the Excel copy or the newest database backup"""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        if self.store is not None:
+            try:
+                self.store.close()
+            except Exception:
+                pass
+
+        # Move the corrupted database aside
+        if os.path.exists(self.db_path):
+            corrupted_backup = os.path.join(self.backup_dir, f"corrupted_backup_{timestamp}.db")
+            shutil.move(self.db_path, corrupted_backup)
+            for suffix in ('-wal', '-shm'):
+                if os.path.exists(self.db_path + suffix):
+                    os.remove(self.db_path + suffix)
+            print(f"Created backup of corrupted database: {corrupted_backup}")
+
+        # Try the Excel copy first, then database backups from newest to oldest
+        if os.path.exists(self.data_file_path):
+            try:
+                with self.data_lock:
+                    self.store = ProjectStore(self.db_path)
+                    df = self.store.replace_all(self.read_data_file(self.data_file_path))
+                    self.store.set_meta('xlsx_migrated', '1')
+                messagebox.showwarning("Warning", "Database was corrupted. Restored from the Excel copy.")
+                return df
+            except Exception as e:
+                print(f"Restore from Excel copy failed: {e}")
                 corrupted_backup = os.path.join(self.backup_dir, f"corrupted_backup_{timestamp}.xlsx")
                 shutil.copy2(self.data_file_path, corrupted_backup)
                 print(f"Created backup of corrupted file: {corrupted_backup}")
-            
-            messagebox.showwarning("Warning", "Data file is corrupted. Creating new dataset.")
-            return pd.DataFrame(columns=[
-                'Project Name', 'Status', 'Due Date', 'Due Time',
-                'Progress', 'Estimated Reward', 'Project Link', 'Notes', 'Reminder Enabled'
-            ])
+
+        db_backups = sorted((name for name in os.listdir(self.backup_dir)
+                             if name.startswith('backup_') and name.endswith('.db')), reverse=True)
+        for name in db_backups:
+            try:
+                if self.store is not None:
+                    self.store.close()
+                shutil.copy2(os.path.join(self.backup_dir, name), self.db_path)
+                with self.data_lock:
+                    self.store = ProjectStore(self.db_path)
+                    df = self.store.load_frame()
+                    self.store.set_meta('xlsx_migrated', '1')
+                messagebox.showwarning("Warning", f"Database was corrupted. Restored from backup {name}.")
+                return df
+            except Exception as e:
+                print(f"Restore from {name} failed: {e}")
+            
+        messagebox.showwarning("Warning", "Data file is corrupted and no usable backup was found. Creating new dataset.")
+        if os.path.exists(self.db_path):
+            os.remove(self.db_path)
+        with self.data_lock:
+            self.store = ProjectStore(self.db_path)
+            self.store.set_meta('xlsx_migrated', '1')
+            return self.store.load_frame()
+
+    def read_data_file(self, file_path):
+        """Read an airdrop Excel file and fill in missing columns"""
+        df = self.frame_cache.load(file_path, pd.read_excel)
+        # Ensure all required columns exist
+        required_columns = ['Project Name', 'Status', 'Due Date', 'Due Time', 
+                          'Progress', 'Estimated Reward', 'Project Link', 'Notes', 'Recurrence', 'Reminder Enabled']
+        
+        for col in required_columns:
+            if col not in df.columns:
+                if col == 'Reminder Enabled':
+                    df[col] = True
+                else:
+                    df[col] = '' if col != 'Estimated Reward' else 0.0
+        
+        # Handle NaN values
+        df = df.fillna('')
+        
+        # Convert numpy.bool_ to Python bool for Reminder Enabled column
+        if 'Reminder Enabled' in df.columns:
+            df['Reminder Enabled'] = df['Reminder Enabled'].apply(lambda x: bool(x) if pd.notna(x) else True)
+        
+        return df
 
     def create_backup(self):
         """Create data backup - including password file"""
         try:
-            # First save the current data
+            # Queue the current data, then copy the files once the writer has saved it
             self.save_data()
-            
-            # Now create the backup
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            self.writer.submit('call', lambda: self._write_backup(timestamp))
+        except Exception as e:
+            messagebox.showerror("Error", f"Backup failed: {str(e)}")
+
+    def _write_backup(self, timestamp):
+        """Copy data files into the backup folder (runs in the writer thread)"""
+        try:
             backup_path = os.path.join(self.backup_dir, f"backup_{timestamp}.xlsx")
             shutil.copy2(self.data_file_path, backup_path)
             
+            # Backup the project database
+            db_backup_path = os.path.join(self.backup_dir, f"backup_{timestamp}.db")
+            self.store.backup(db_backup_path)
+            
             # Backup password file if it exists
             if os.path.exists(self.password_file):
                 password_backup_path = os.path.join(self.security_backup_dir, f"password_backup_{timestamp}.txt")
                 shutil.copy2(self.password_file, password_backup_path)
                 
-            # Backup snooze data
-            if os.path.exists(self.snooze_file):
-                snooze_backup_path = os.path.join(self.backup_dir, f"snooze_backup_{timestamp}.json")
-                shutil.copy2(self.snooze_file, snooze_backup_path)
+            # Backup reminder state
+            if os.path.exists(self.ledger_file):
+                ledger_backup_path = os.path.join(self.backup_dir, f"reminder_ledger_backup_{timestamp}.json")
+                shutil.copy2(self.ledger_file, ledger_backup_path)
                 
-            messagebox.showinfo("Backup", f"Backup created successfully at:\n{backup_path}")
+            self.after_idle(messagebox.showinfo, "Backup", f"Backup created successfully at:\n{backup_path}")
         except Exception as e:
-            messagebox.showerror("Error", f"Backup failed: {str(e)}")
+            self.after_idle(messagebox.showerror, "Error", f"Backup failed: {str(e)}")
 
     def export_excel(self):
         """Export data to Excel"""
@@ -1648,50 +2176,8 @@ class PremiumAirdropTracker(ctk.CTk):
                 initialfile=default_filename
             )
             if file_path:
-                # Save with color coding (exclude Reminder Enabled column)
-                wb = Workbook()
-                ws = wb.active
-                ws.title = "Airdrop Data"
-                
-                # Write headers (exclude Reminder Enabled)
-                headers = [col for col in self.df.columns if col != 'Reminder Enabled']
-                for col_idx, header in enumerate(headers, 1):
-                    cell = ws.cell(row=1, column=col_idx, value=header)
-                    cell.font = Font(bold=True)
-                
-                # Define color fills for different statuses
-                status_colors = {
-                    'Active': PatternFill(start_color='4FC3F7', end_color='4FC3F7', fill_type='solid'),
-                    'Completed': PatternFill(start_color='81C784', end_color='81C784', fill_type='solid'),
-                    'Monitoring': PatternFill(start_color='FFA500', end_color='FFA500', fill_type='solid'),
-                    'Dropped': PatternFill(start_color='E57373', end_color='E57373', fill_type='solid')
-                }
-                
-                # Write data with color coding (exclude Reminder Enabled)
-                for r_idx, row in self.df.iterrows():
-                    for c_idx, col in enumerate(headers, 1):
-                        value = row[col]
-                        cell = ws.cell(row=r_idx+2, column=c_idx, value=value)
-                        
-                        # Apply color based on status
-                        if col == 'Status' and value in status_colors:
-                            cell.fill = status_colors[value]
-                
-                # Auto-adject column widths
-                for column in ws.columns:
-                    max_length = 0
-                    column_letter = column[0].column_letter
-                    for cell in column:
-                        try:
-                            if len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except:
-                            pass
-                    adjusted_width = min(max_length + 2, 50)
-                    ws.column_dimensions[column_letter].width = adjusted_width
-                
-                wb.save(file_path)
-                messagebox.showinfo("Success", "Data exported to Excel successfully!")
+                self.start_export("Excel", WorkbookWriter.write, file_path,
+                                  "Data exported to Excel successfully!", "Export failed")
         except Exception as e:
             messagebox.showerror("Error", f"Export failed: {str(e)}")
 
@@ -1708,10 +2194,8 @@ class PremiumAirdropTracker(ctk.CTk):
                 initialfile=default_filename
             )
             if file_path:
-                # Exclude Reminder Enabled column
-                export_df = self.df.drop(columns=['Reminder Enabled'], errors='ignore')
-                export_df.to_csv(file_path, index=False)
-                messagebox.showinfo("Success", "Data exported to CSV successfully!")
+                self.start_export("CSV", CsvWriter.write, file_path,
+                                  "Data exported to CSV successfully!", "Export failed")
         except Exception as e:
             messagebox.showerror("Error", f"Export failed: {str(e)}")
 
@@ -1728,96 +2212,77 @@ class PremiumAirdropTracker(ctk.CTk):
                 initialfile=default_filename
             )
             if file_path:
-                # Create PDF document in landscape mode
-                doc = SimpleDocTemplate(file_path, pagesize=landscape(letter))
-                elements = []
-                
-                # Add title
-                styles = getSampleStyleSheet()
-                title = Paragraph("Airdrop Tracker Report", styles['Title'])
-                elements.append(title)
-                
-                # Add date
-                date_str = datetime.now().strftime("%Y-%m-%d %H:%M")
-                date = Paragraph(f"Generated on: {date_str}", styles['Normal'])
-                elements.append(date)
-                
-                # Add some space
-                elements.append(Paragraph("<br/><br/>", styles['Normal']))
-                
-                # Prepare data for table - exclude Reminder Enabled column
-                columns_to_export = [
-                    'Project Name', 'Status', 'Due DateTime', 'Progress', 
-                    'Estimated Reward', 'Project Link', 'Notes'
-                ]
-                
-                table_data = [columns_to_export]
-                
-                # Create a style for table cells with word wrap
-                cell_style = styles['Normal']
-                cell_style.wordWrap = 'CJK'
-                
-                for _, row in self.df.iterrows():
-                    # Combine date and time for display
-                    due_date = row.get('Due Date', '')
-                    due_time = row.get('Due Time', '')
-                    due_datetime = f"{due_date} {due_time}" if due_date and due_time else ''
-                    
-                    # Add day name if date is available
-                    if due_date:
-                        try:
-                            date_obj = datetime.strptime(due_date, '%Y-%m-%d')
-                            day_name = date_obj.strftime('%A')
-                            due_datetime = f"{due_datetime} ({day_name})"
-                        except:
-                            pass
-                    
-                    table_data.append([
-                        Paragraph(str(row.get('Project Name', '')), cell_style),
-                        Paragraph(str(row.get('Status', '')), cell_style),
-                        Paragraph(str(due_datetime), cell_style),
-                        Paragraph(str(row.get('Progress', '')), cell_style),
-                        Paragraph(f"Rp {row.get('Estimated Reward', 0):,.2f}", cell_style),
-                        Paragraph(str(row.get('Project Link', '')), cell_style),
-                        Paragraph(str(row.get('Notes', '')), cell_style)
-                    ])
-                
-                # Create table with adjusted column widths for landscape
-                col_widths = [
-                    1.5*inch,  # Project Name
-                    0.8*inch,  # Status
-                    1.5*inch,  # Due DateTime
-                    0.8*inch,  # Progress
-                    1.0*inch,  # Estimated Reward
-                    1.8*inch,  # Project Link
-                    2.0*inch,  # Notes
-                ]
-                
-                table = Table(table_data, colWidths=col_widths, repeatRows=1)
-                
-                # Add style to table
-                table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTSIZE', (0, 0), (-1, 0), 10),
-                    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                    ('FONTSIZE', (0, 1), (-1, -1), 8),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.black)
-                ]))
-                
-                elements.append(table)
-                
-                # Build PDF
-                doc.build(elements)
-                
-                messagebox.showinfo("Success", "Data exported to PDF successfully!")
+                self.start_export("PDF", PdfReportWriter.write, file_path,
+                                  "Data exported to PDF successfully!", "PDF export failed")
         except Exception as e:
             messagebox.showerror("Error", f"PDF export failed: {str(e)}")
 
+    def start_export(self, label, write, file_path, success_message, error_prefix):
+        """Export a snapshot of the data on a worker thread"""
+        with self.data_lock:
+            snapshot = self.df.copy()
+        self.export_counter += 1
+        job = ExportJob(self.export_counter, label, write, snapshot, file_path, self.export_events)
+        job.success_message = success_message
+        job.error_prefix = error_prefix
+        self.export_jobs[job.job_id] = job
+        self.add_export_row(job)
+        job.start()
+        if self.export_poll_id is None:
+            self.export_poll_id = self.after(self.EXPORT_POLL_MS, self.poll_export_events)
+
+    def add_export_row(self, job):
+        """Show a running export with its progress bar and Cancel button"""
+        row = ctk.CTkFrame(self.export_jobs_frame)
+        row.pack(fill="x", pady=2)
+        label = ctk.CTkLabel(row, text=f"{job.label}: {os.path.basename(job.file_path)}", anchor="w")
+        label.pack(side="left", padx=5)
+        cancel_button = ctk.CTkButton(row, text="Cancel", width=70,
+                                      command=lambda: self.cancel_export(job.job_id))
+        cancel_button.pack(side="right", padx=5)
+        progress_bar = ctk.CTkProgressBar(row)
+        progress_bar.set(0)
+        progress_bar.pack(side="right", fill="x", expand=True, padx=5)
+        self.export_rows[job.job_id] = (row, label, progress_bar, cancel_button)
+
+    def cancel_export(self, job_id):
+        """Cancel a running export"""
+        job = self.export_jobs.get(job_id)
+        if job is None:
+            return
+        job.cancel()
+        row, label, progress_bar, cancel_button = self.export_rows[job_id]
+        label.configure(text=f"{job.label}: cancelling...")
+        cancel_button.configure(state="disabled")
+
+    def poll_export_events(self):
+        """Apply progress and results reported by export workers"""
+        self.export_poll_id = None
+        while True:
+            try:
+                job_id, kind, value = self.export_events.get_nowait()
+            except queue.Empty:
+                break
+            job = self.export_jobs.get(job_id)
+            if job is None:
+                continue
+            if kind == 'progress':
+                self.export_rows[job_id][2].set(value)
+            else:
+                self.finish_export(job, kind, value)
+
+        if self.export_jobs and self.running:
+            self.export_poll_id = self.after(self.EXPORT_POLL_MS, self.poll_export_events)
+
+    def finish_export(self, job, kind, value):
+        """Remove a finished export's row and report the result"""
+        del self.export_jobs[job.job_id]
+        self.export_rows.pop(job.job_id)[0].destroy()
+        if kind == 'done':
+            messagebox.showinfo("Success", job.success_message)
+        elif kind == 'error':
+            messagebox.showerror("Error", f"{job.error_prefix}: {value}")
+
     def import_excel(self):
         """Import data from Excel file"""
         try:
@@ -1825,31 +2290,7 @@ class PremiumAirdropTracker(ctk.CTk):
                 filetypes=[("Excel files", "*.xlsx"), ("All files", "*.*")]
             )
             if file_path:
-                new_df = pd.read_excel(file_path)
-                
-                # Check if the imported data has the required columns
-                required_columns = ['Project Name', 'Status', 'Due Date', 'Due Time', 
-                                  'Progress', 'Estimated Reward', 'Project Link', 'Notes', 'Reminder Enabled']
-                
-                for col in required_columns:
-                    if col not in new_df.columns:
-                        if col == 'Reminder Enabled':
-                            new_df[col] = True
-                        else:
-                            new_df[col] = '' if col != 'Estimated Reward' else 0.0
-                
-                # Fix numpy.bool_ conversion issue
-                if 'Reminder Enabled' in new_df.columns:
-                    new_df['Reminder Enabled'] = new_df['Reminder Enabled'].apply(lambda x: bool(x) if pd.notna(x) else True)
-                
-                # Replace the current data with imported data
-                with self.data_lock:
-                    self.df = new_df
-                self.save_data()
-                self.update_table()
-                self.update_dashboard()
-                self.update_project_dropdown()
-                messagebox.showinfo("Success", "Data imported from Excel successfully!")
+                self.import_projects(file_path, "Excel")
         except Exception as e:
             messagebox.showerror("Error", f"Import failed: {str(e)}")
 
@@ -1860,30 +2301,138 @@ class PremiumAirdropTracker(ctk.CTk):
                 filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
             )
             if file_path:
-                new_df = pd.read_csv(file_path)
-                
-                # Check if the imported data has the required columns
-                required_columns = ['Project Name', 'Status', 'Due Date', 'Due Time', 
-                                  'Progress', 'Estimated Reward', 'Project Link', 'Notes', 'Reminder Enabled']
-                
-                for col in required_columns:
-                    if col not in new_df.columns:
-                        if col == 'Reminder Enabled':
-                            new_df[col] = True
-                        else:
-                            new_df[col] = '' if col != 'Estimated Reward' else 0.0
-                
-                # Replace the current data with imported data
-                with self.data_lock:
-                    self.df = new_df
-                self.save_data()
-                self.update_table()
-                self.update_dashboard()
-                self.update_project_dropdown()
-                messagebox.showinfo("Success", "Data imported from CSV successfully!")
+                self.import_projects(file_path, "CSV")
         except Exception as e:
             messagebox.showerror("Error", f"Import failed: {str(e)}")
 
+    def confirm_import_errors(self, reader, valid_rows):
+        """Report rows that failed validation; True to import the rest"""
+        report_path = os.path.join(self.data_dir, 'import_errors.csv')
+        reader.error_report().to_csv(report_path, index=False)
+        failed_rows = len({row for row, _, _, _ in reader.errors})
+        shown = "\n".join(f"Row {row}, {column}: {message}" for row, column, _, message in reader.errors[:10])
+        if len(reader.errors) > 10:
+            shown += f"\n... and {len(reader.errors) - 10} more"
+        return messagebox.askyesno(
+            "Import Errors",
+            f"{failed_rows} row(s) have errors and will be skipped:\n\n{shown}\n\n"
+            f"Full report: {report_path}\n\nImport the {valid_rows} valid project(s)?")
+
+    def import_projects(self, file_path, label):
+        """Replace the data with the valid projects of a CSV or Excel file, or merge them in"""
+        reader = ImportReader(file_path)
+        new_df = reader.read()
+        if reader.errors and not self.confirm_import_errors(reader, len(new_df)):
+            return
+
+        if self.import_merge_var.get():
+            with self.data_lock:
+                merge = ImportMerge(self.df, new_df, reader.columns)
+            if merge.inserted.empty and not merge.updated:
+                messagebox.showinfo("Import", f"Nothing to merge: all {merge.unchanged} project(s) are unchanged.")
+            else:
+                self.show_merge_preview(merge, label)
+            return
+
+        # Replace the current data with imported data
+        with self.data_lock:
+            self.df = ProjectStore.add_due_column(self.store.prepare_frame(new_df))
+            self.stats.rebuild(self.df)
+        self.save_data('replace_all', values=self.df)
+        self.reminders.rebuild()
+        self.save_data()
+        self.update_table()
+        self.mark_data_changed()
+        self.update_project_dropdown()
+        messagebox.showinfo("Success", f"Data imported from {label} successfully!")
+
+    def show_merge_preview(self, merge, label):
+        """List what a merge import would add and change, and apply it on confirmation"""
+        window = ctk.CTkToplevel(self)
+        window.title(f"Merge {label} Import")
+        window.geometry("760x460")
+        window.transient(self)
+        # Edits made while the preview is open would make it stale; the grab
+        # waits until the window is mapped
+        window.after(100, window.grab_set)
+
+        summary = (f"{len(merge.inserted)} new, {len(merge.updated)} updated, "
+                   f"{merge.unchanged} unchanged")
+        if merge.duplicates:
+            summary += f", {merge.duplicates} duplicate row(s) skipped"
+        ctk.CTkLabel(window, text=summary, font=ctk.CTkFont(size=14, weight="bold")).pack(pady=10)
+
+        button_frame = ctk.CTkFrame(window)
+        button_frame.pack(side="bottom", pady=10)
+
+        def apply():
+            window.destroy()
+            self.apply_import_merge(merge, label)
+
+        ctk.CTkButton(button_frame, text="Apply", command=apply).pack(side="left", padx=10)
+        ctk.CTkButton(button_frame, text="Cancel", command=window.destroy).pack(side="left", padx=10)
+
+        preview_frame = ctk.CTkFrame(window)
+        preview_frame.pack(fill="both", expand=True, padx=10)
+        columns = ["Change", "Project", "Details"]
+        preview = ttk.Treeview(preview_frame, columns=columns, show="headings")
+        preview.column("Change", width=80)
+        preview.column("Project", width=180)
+        preview.column("Details", width=460)
+        for col in columns:
+            preview.heading(col, text=col)
+        scrollbar = ttk.Scrollbar(preview_frame, orient="vertical", command=preview.yview)
+        preview.configure(yscrollcommand=scrollbar.set)
+        preview.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+
+        shown = 0
+        for row_id, new_values, old_values in merge.updated[:self.MERGE_PREVIEW_ROWS]:
+            details = "; ".join(f"{col}: {old_values[col]} → {new_values[col]}" for col in new_values)
+            preview.insert("", "end", values=("Update", self.df.at[row_id, 'Project Name'], details))
+            shown += 1
+        for values in merge.inserted.head(self.MERGE_PREVIEW_ROWS - shown).to_dict('records'):
+            details = f"{values['Status']} | Due {values['Due Date']} {values['Due Time']}".strip()
+            preview.insert("", "end", values=("Add", values['Project Name'], details))
+            shown += 1
+        total = len(merge.updated) + len(merge.inserted)
+        if total > shown:
+            preview.insert("", "end", values=("", f"... and {total - shown} more", ""))
+
+    def apply_import_merge(self, merge, label):
+        """Add and update the merged projects and save them in one write"""
+        # Added projects get new ids; ids from another copy of the data may be taken here
+        new_rows = self.store.prepare_frame(merge.inserted)
+        new_ids = list(new_rows.index)
+        new_rows['Due'] = ProjectStore.parse_due(new_rows['Due Date'], new_rows['Due Time'])
+        changes = [('update', row_id, new_values) for row_id, new_values, _ in merge.updated]
+        changes += [('add', row_id, values) for row_id, values in zip(new_ids, new_rows.to_dict('records'))]
+
+        with self.data_lock:
+            for row_id, new_values, _ in merge.updated:
+                # The totals read Status, Progress and Estimated Reward from the whole row
+                old_row = self.df.loc[row_id]
+                self.stats.replace(old_row, {**old_row.to_dict(), **new_values})
+                for col, value in new_values.items():
+                    self.df.at[row_id, col] = value
+            updated_ids = [row_id for row_id, _, _ in merge.updated]
+            if updated_ids:
+                self.df.loc[updated_ids, 'Due'] = ProjectStore.parse_due(
+                    self.df.loc[updated_ids, 'Due Date'], self.df.loc[updated_ids, 'Due Time'])
+            if new_ids:
+                self.df = new_rows if self.df.empty else pd.concat([self.df, new_rows])
+                for values in new_rows.to_dict('records'):
+                    self.stats.add(values)
+
+        self.save_data('batch', values=changes)
+        self.reminders.rebuild()
+        self.save_data()
+        self.update_table()
+        self.mark_data_changed()
+        self.update_project_dropdown()
+        messagebox.showinfo("Success", f"Merged {label} import: {len(new_ids)} project(s) added, "
+                                       f"{len(updated_ids)} updated.")
+
     def toggle_theme(self):
         """Toggle between light and dark theme"""
         ctk.set_appearance_mode(self.theme_var.get())
@@ -1891,9 +2440,28 @@ class PremiumAirdropTracker(ctk.CTk):
     def toggle_reminders(self):
         """Toggle reminders on/off"""
         self.reminder_active = self.reminder_var.get()
+        if self.reminder_active:
+            # The reminder thread exits while reminders are off
+            self.setup_reminder_system()
         status = "enabled" if self.reminder_active else "disabled"
         messagebox.showinfo("Reminders", f"Reminders {status}")
 
+    def refresh_task_status(self):
+        """Show the next run and last duration of each periodic job"""
+        lines = []
+        for job in self.tasks.status():
+            next_run = datetime.fromtimestamp(job['next_run']).strftime('%Y-%m-%d %H:%M')
+            if job['held']:
+                next_run += " (held)"
+            if job['last_duration'] is None:
+                last = "not run yet"
+            else:
+                last = f"last took {job['last_duration'] * 1000:.0f} ms"
+                if job['failures']:
+                    last += f", {job['failures']} failure(s): {job['last_error']}"
+            lines.append(f"{job['name']:<18} next {next_run}  {last}")
+        self.task_status_label.configure(text="\n".join(lines))
+
     def toggle_auto_backup(self):
         """Toggle auto backup on/off"""
         self.auto_backup = self.backup_toggle.get()
@@ -1902,6 +2470,14 @@ class PremiumAirdropTracker(ctk.CTk):
 
     def update_project_dropdown(self):
         """Update the project dropdown in reminder settings"""
+        if self.REMINDER_TAB not in self.built_tabs:
+            return
+
+        # Map each project name to its ids so selection needs no scan or query
+        self.project_choice_ids = {}
+        for row_id, name in self.df['Project Name'].items():
+            self.project_choice_ids.setdefault(name, []).append(row_id)
+
         if not self.df.empty:
             project_names = self.df['Project Name'].tolist()
             self.project_dropdown.configure(values=project_names)
@@ -1916,8 +2492,9 @@ class PremiumAirdropTracker(ctk.CTk):
 
     def on_project_select(self, choice):
         """Handle project selection in reminder settings"""
-        if not self.df.empty and choice:
-            project_data = self.df[self.df['Project Name'] == choice].iloc[0]
+        matching = self.project_choice_ids.get(choice, [])
+        if matching:
+            project_data = self.df.loc[matching[0]]
             # Convert numpy.bool_ to Python bool if needed
             reminder_enabled = bool(project_data.get('Reminder Enabled', True))
             self.project_reminder_var.set(reminder_enabled)
@@ -1928,8 +2505,13 @@ class PremiumAirdropTracker(ctk.CTk):
         selected_project = self.project_var.get()
         if selected_project and not self.df.empty:
             # Update the reminder setting for the selected project
-            self.df.loc[self.df['Project Name'] == selected_project, 'Reminder Enabled'] = self.project_reminder_var.get()
-            self.save_data()
+            reminder_enabled = bool(self.project_reminder_var.get())
+            matching = self.project_choice_ids.get(selected_project, [])
+            with self.data_lock:
+                self.df.loc[matching, 'Reminder Enabled'] = reminder_enabled
+            for index in matching:
+                self.save_data('update', index, {'Reminder Enabled': reminder_enabled})
+                self.reminders.reschedule(index)
             messagebox.showinfo("Success", f"Reminder setting updated for {selected_project}")
 
     def test_reminder(self):
@@ -1945,15 +2527,15 @@ class PremiumAirdropTracker(ctk.CTk):
         if messagebox.askyesno("Confirm Deletion", "Are you sure you want to delete ALL data? This action cannot be undone!"):
             try:
                 with self.data_lock:
-                    self.df = pd.DataFrame(columns=[
-                        'Project Name', 'Status', 'Due Date', 'Due Time',
-                        'Progress', 'Estimated Reward', 'Project Link', 'Notes', 'Reminder Enabled'
-                    ])
-                self.shown_reminders.clear()
-                self.snoozed_projects.clear()
+                    self.df = ProjectStore.add_due_column(self.store.prepare_frame(pd.DataFrame(columns=ProjectStore.COLUMNS)))
+                    self.stats.rebuild(self.df)
+                self.reminders.ledger.clear()
+                self.save_reminder_ledger()
+                self.save_data('replace_all', values=self.df)
+                self.reminders.rebuild()
                 self.save_data()
                 self.update_table()
-                self.update_dashboard()
+                self.mark_data_changed()
                 self.update_project_dropdown()
                 messagebox.showinfo("Success", "All data has been deleted successfully!")
             except Exception as e:
@@ -1961,25 +2543,24 @@ class PremiumAirdropTracker(ctk.CTk):
 
     def show_dashboard(self):
         """Show dashboard tab"""
-        self.tabview.set("📊 Dashboard")
-        self.update_dashboard()
+        self.select_tab(self.DASHBOARD_TAB)
 
     def show_data_manager(self):
         """Show data manager tab"""
-        self.tabview.set("📋 Data")
+        self.select_tab(self.DATA_TAB)
 
     def show_reminder_settings(self):
         """Show reminder settings tab"""
-        self.tabview.set("⏰ Reminders")
+        self.select_tab(self.REMINDER_TAB)
         self.update_project_dropdown()
 
     def show_settings(self):
         """Show settings tab"""
-        self.tabview.set("⚙️ Settings")
+        self.select_tab(self.SETTINGS_TAB)
 
     def show_about(self):
         """Show about tab"""
-        self.tabview.set("ℹ️ About")
+        self.select_tab(self.ABOUT_TAB)
 
     def on_closing(self):
         """Handle application closing - minimize to tray instead of closing"""